@@ -3,6 +3,7 @@ Real implementation of SecretCipher using cryptography library
 """
 import os
 import base64
+from functools import lru_cache
 from typing import Dict, Any
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -12,6 +13,25 @@ from app.core.ports.secret_cipher import SecretCipher
 from app.core.config import ENCRYPTION_MASTER_KEY
 
 
+@lru_cache(maxsize=None)
+def _derive_fernet(master_key: bytes) -> Fernet:
+    """Derive the Fernet cipher for master_key, once per process
+    
+    PBKDF2 with 100k iterations costs tens of milliseconds, so every
+    CryptoCipher built for the same master key (e.g. KmsCipher's local
+    fallback) reuses the derived key instead of running it again.
+    """
+    # Derive key from master key using PBKDF2
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b'env_var_salt',  # In production, use random salt
+        iterations=100000,
+    )
+    key = base64.urlsafe_b64encode(kdf.derive(master_key))
+    return Fernet(key)
+
+
 class CryptoCipher(SecretCipher):
     """Real implementation of SecretCipher using cryptography library"""
     
@@ -35,15 +55,7 @@ class CryptoCipher(SecretCipher):
     
     def _create_fernet(self) -> Fernet:
         """Create Fernet cipher from master key"""
-        # Derive key from master key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'env_var_salt',  # In production, use random salt
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(self.master_key))
-        return Fernet(key)
+        return _derive_fernet(self.master_key)
     
     async def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext and return encrypted string"""
@@ -0,0 +1,17 @@
+"""
+AuditSink implementation that persists events through an EnvStore
+"""
+from app.core.domain.audit_event import AuditEvent
+from app.core.ports.audit_sink import AuditSink
+from app.core.ports.env_store import EnvStore
+
+
+class EnvStoreAuditSink(AuditSink):
+    """Persist audit events via EnvStore.create_audit_event"""
+    
+    def __init__(self, env_store: EnvStore):
+        self.env_store = env_store
+    
+    async def create_audit_event(self, event: AuditEvent) -> None:
+        """Persist the audit event"""
+        await self.env_store.create_audit_event(event)
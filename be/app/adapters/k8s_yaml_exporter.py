@@ -1,7 +1,8 @@
 """
 Real implementation of Exporter for Kubernetes YAML
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
+import base64
 import yaml
 import json
 import re
@@ -10,6 +11,9 @@ from app.core.domain.env_var import EnvVar
 from app.core.ports.exporter import Exporter
 
 
+_QUOTES = ('"', "'")
+
+
 class K8sYamlExporter(Exporter):
     """Real implementation of Exporter for Kubernetes YAML"""
     
@@ -18,22 +22,19 @@ class K8sYamlExporter(Exporter):
     
     async def export_to_k8s_secret(self, env_vars: List[EnvVar], secret_name: str) -> str:
         """Export environment variables to Kubernetes Secret YAML"""
-        # Filter only secret variables
-        secret_vars = [var for var in env_vars if var.is_secret]
+        return await self._collect(self.stream_to_k8s_secret(env_vars, secret_name))
+    
+    async def stream_to_k8s_secret(self, env_vars: List[EnvVar], secret_name: str) -> AsyncIterator[bytes]:
+        """Stream Kubernetes Secret YAML: header, then one data entry per secret"""
+        # Only secret variables; the last one wins for a repeated key. Values
+        # are encoded as each entry is written, so only references are held
+        secret_vars = {var.key: var for var in env_vars if var.is_secret}
         
         if not secret_vars:
-            return self._create_empty_secret_yaml(secret_name)
-        
-        # Create data section with base64 encoded values
-        data = {}
-        for env_var in secret_vars:
-            # In real implementation, you'd need to decrypt the value
-            # For now, we'll use the encrypted value as-is
-            import base64
-            encoded_value = base64.b64encode(env_var.value.encode('utf-8')).decode('utf-8')
-            data[env_var.key] = encoded_value
+            yield self._create_empty_secret_yaml(secret_name).encode('utf-8')
+            return
         
-        secret = {
+        header = {
             'apiVersion': 'v1',
             'kind': 'Secret',
             'metadata': {
@@ -44,26 +45,30 @@ class K8sYamlExporter(Exporter):
                     'app.kubernetes.io/component': 'secrets'
                 }
             },
-            'type': 'Opaque',
-            'data': data
+            'type': 'Opaque'
         }
         
-        return yaml.dump(secret, default_flow_style=False, sort_keys=False)
+        yield (yaml.dump(header, default_flow_style=False, sort_keys=False) + "data:\n").encode('utf-8')
+        for key, env_var in secret_vars.items():
+            # In real implementation, you'd need to decrypt the value
+            # For now, we'll use the encrypted value as-is
+            encoded_value = base64.b64encode(env_var.value.encode('utf-8')).decode('utf-8')
+            yield self._dump_data_entry(key, encoded_value)
     
     async def export_to_k8s_configmap(self, env_vars: List[EnvVar], configmap_name: str) -> str:
         """Export environment variables to Kubernetes ConfigMap YAML"""
-        # Filter only non-secret variables
-        config_vars = [var for var in env_vars if not var.is_secret]
-        
-        if not config_vars:
-            return self._create_empty_configmap_yaml(configmap_name)
+        return await self._collect(self.stream_to_k8s_configmap(env_vars, configmap_name))
+    
+    async def stream_to_k8s_configmap(self, env_vars: List[EnvVar], configmap_name: str) -> AsyncIterator[bytes]:
+        """Stream Kubernetes ConfigMap YAML: header, then one data entry per variable"""
+        # Only non-secret variables; the last one wins for a repeated key
+        data = {var.key: var.value for var in env_vars if not var.is_secret}
         
-        # Create data section
-        data = {}
-        for env_var in config_vars:
-            data[env_var.key] = env_var.value
+        if not data:
+            yield self._create_empty_configmap_yaml(configmap_name).encode('utf-8')
+            return
         
-        configmap = {
+        header = {
             'apiVersion': 'v1',
             'kind': 'ConfigMap',
             'metadata': {
@@ -73,20 +78,24 @@ class K8sYamlExporter(Exporter):
                     'app.kubernetes.io/name': 'env-vars',
                     'app.kubernetes.io/component': 'configmap'
                 }
-            },
-            'data': data
+            }
         }
         
-        return yaml.dump(configmap, default_flow_style=False, sort_keys=False)
+        yield (yaml.dump(header, default_flow_style=False, sort_keys=False) + "data:\n").encode('utf-8')
+        for key, value in data.items():
+            yield self._dump_data_entry(key, value)
     
     async def export_to_dotenv(self, env_vars: List[EnvVar]) -> str:
         """Export environment variables to .env format"""
-        lines = []
-        
+        return await self._collect(self.stream_to_dotenv(env_vars))
+    
+    async def stream_to_dotenv(self, env_vars: List[EnvVar]) -> AsyncIterator[bytes]:
+        """Stream .env content one line at a time"""
         # Add header comment
-        lines.append("# Environment variables exported from EnvVar Manager")
-        lines.append(f"# Generated at: {self._get_current_timestamp()}")
-        lines.append("")
+        yield (
+            "# Environment variables exported from EnvVar Manager\n"
+            f"# Generated at: {self._get_current_timestamp()}\n"
+        ).encode('utf-8')
         
         # Group by scope
         scopes = {}
@@ -96,16 +105,13 @@ class K8sYamlExporter(Exporter):
                 scopes[scope_key] = []
             scopes[scope_key].append(env_var)
         
-        # Export each scope
+        # Export each scope, separated from the previous block by a blank line
         for scope_key, scope_vars in scopes.items():
-            lines.append(f"# Scope: {scope_key}")
+            yield f"\n# Scope: {scope_key}\n".encode('utf-8')
             for env_var in scope_vars:
                 # Escape value if it contains special characters
                 value = self._escape_env_value(env_var.value)
-                lines.append(f"{env_var.key}={value}")
-            lines.append("")
-        
-        return "\n".join(lines)
+                yield f"{env_var.key}={value}\n".encode('utf-8')
     
     async def export_to_json(self, env_vars: List[EnvVar]) -> str:
         """Export environment variables to JSON format"""
@@ -178,25 +184,22 @@ class K8sYamlExporter(Exporter):
         result = {}
         
         for line in content.split('\n'):
-            line = line.strip()
+            # Lines without '=' (including blank lines) carry no assignment
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
             
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
+            # Skip comments
+            key = key.strip()
+            if key[:1] == '#':
                 continue
             
-            # Parse key=value pairs
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                result[key] = value
+            # Remove quotes if present
+            value = value.strip()
+            if value[:1] in _QUOTES and value.endswith(value[0]):
+                value = value[1:-1]
+            
+            result[key] = value
         
         return result
     
@@ -279,6 +282,18 @@ class K8sYamlExporter(Exporter):
         
         return yaml.dump(configmap, default_flow_style=False, sort_keys=False)
     
+    def _dump_data_entry(self, key: str, value: str) -> bytes:
+        """Render one entry of a YAML data mapping, indented under `data:`"""
+        # Two columns narrower than the default width (80) so long values wrap
+        # exactly where a full-document dump would wrap them
+        entry = yaml.dump({key: value}, default_flow_style=False, sort_keys=False, width=78)
+        lines = entry.splitlines(keepends=True)
+        return "".join(line if line == "\n" else f"  {line}" for line in lines).encode('utf-8')
+    
+    async def _collect(self, chunks: AsyncIterator[bytes]) -> str:
+        """Join a streamed export back into a single string"""
+        return b"".join([chunk async for chunk in chunks]).decode('utf-8')
+    
     def _escape_env_value(self, value: str) -> str:
         """Escape environment variable value for .env format"""
         # Escape backslashes and quotes
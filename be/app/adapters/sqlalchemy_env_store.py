@@ -1,10 +1,14 @@
 """
 SQLAlchemy implementation of EnvStore
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+import asyncio
+import functools
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, asc, select, update, func, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import selectinload
 
 from app.core.domain.env_var import EnvVar, EnvVarType, ScopeRef, ScopeLevel, EnvVarStatus
 from app.core.domain.env_var_version import EnvVarVersion
@@ -14,195 +18,315 @@ from app.core.domain.audit_event import AuditEvent, AuditAction, AuditTargetType
 from app.core.ports.env_store import EnvStore
 from app.model.env_var import (
     EnvVarModel, EnvVarVersionModel, ReleaseModel, ApprovalModel, 
-    AuditEventModel, RotationScheduleModel
+    RotationScheduleModel
 )
+from app.model.audit_event import AuditEventModel
+
+# Column value -> enum member, built once; Enum(value) goes through
+# Enum.__new__ on every call, and the row mappers run once per row
+_ENV_VAR_TYPES = {member.value: member for member in EnvVarType}
+_SCOPE_LEVELS = {member.value: member for member in ScopeLevel}
+_ENV_VAR_STATUSES = {member.value: member for member in EnvVarStatus}
+_RELEASE_STATUSES = {member.value: member for member in ReleaseStatus}
+_APPROVAL_DECISIONS = {member.value: member for member in ApprovalDecision}
+_AUDIT_ACTIONS = {member.value: member for member in AuditAction}
+_AUDIT_TARGET_TYPES = {member.value: member for member in AuditTargetType}
+
+# Read-only list queries select from the tables rather than the mapped
+# classes: rows come back as plain Core rows, skipping ORM entity loading
+# and the identity map. Column names match the model attributes, so the
+# *_model_to_domain mappers take either.
+_ENV_VARS = EnvVarModel.__table__
+_ENV_VAR_VERSIONS = EnvVarVersionModel.__table__
+_RELEASES = ReleaseModel.__table__
+_APPROVALS = ApprovalModel.__table__
+
+
+def _serialized(method):
+    """Run a store method under the store's session lock
+    
+    An AsyncSession must not be used by concurrent tasks, and use cases gather
+    independent store calls, so calls on one store are queued here.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self._session_lock:
+            return await method(self, *args, **kwargs)
+    return wrapper
 
 
 class SqlAlchemyEnvStore(EnvStore):
     """SQLAlchemy implementation of EnvStore"""
     
-    def __init__(self, db_session: Session):
+    # Stores are created per request, so the write counter is kept on the
+    # class and shared by every instance in the process
+    write_version: int = 0
+    
+    def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
+        self._session_lock = asyncio.Lock()
     
+    @_serialized
     async def create(self, env_var: EnvVar) -> EnvVar:
         """Create a new environment variable"""
-        model = EnvVarModel(
-            id=env_var.id,
-            key=env_var.key,
-            value_encrypted=env_var.value,
-            type=env_var.type.value,
-            scope_level=env_var.scope.level.value,
-            scope_ref_id=env_var.scope.ref_id,
-            tags=env_var.tags,
-            description=env_var.description,
-            is_secret=env_var.is_secret,
-            status=env_var.status.value,
-            created_by=env_var.created_by,
-            created_at=env_var.created_at,
-            updated_by=env_var.updated_by,
-            updated_at=env_var.updated_at
-        )
+        model = EnvVarModel(**self._domain_to_columns(env_var))
         
         self.db_session.add(model)
-        self.db_session.commit()
+        await self.db_session.commit()
+        self._bump_write_version()
         return env_var
     
+    @_serialized
+    async def create_if_absent(self, env_var: EnvVar) -> Optional[EnvVar]:
+        """Create an environment variable unless its unique key is taken"""
+        # INSERT ... ON CONFLICT (scope_level, scope_ref_id, key) DO NOTHING RETURNING id
+        stmt = (
+            pg_insert(EnvVarModel)
+            .values(**self._domain_to_columns(env_var))
+            .on_conflict_do_nothing(index_elements=['scope_level', 'scope_ref_id', 'key'])
+            .returning(EnvVarModel.id)
+        )
+        inserted_id = (await self.db_session.execute(stmt)).scalar_one_or_none()
+        await self.db_session.commit()
+        
+        if inserted_id is None:
+            return None
+        self._bump_write_version()
+        return env_var
+    
+    @_serialized
     async def get_by_id(self, env_var_id: str) -> Optional[EnvVar]:
         """Get environment variable by ID"""
-        model = self.db_session.query(EnvVarModel).filter(EnvVarModel.id == env_var_id).first()
+        model = await self.db_session.get(EnvVarModel, env_var_id)
         if not model:
             return None
         
         return self._model_to_domain(model)
     
+    @_serialized
     async def get_by_unique_key(self, scope_level: str, scope_ref_id: str, key: str) -> Optional[EnvVar]:
         """Get environment variable by unique key"""
-        model = self.db_session.query(EnvVarModel).filter(
+        model = await self.db_session.scalar(select(EnvVarModel).where(
             and_(
                 EnvVarModel.scope_level == scope_level,
                 EnvVarModel.scope_ref_id == scope_ref_id,
                 EnvVarModel.key == key
             )
-        ).first()
+        ).limit(1))
         
         if not model:
             return None
         
         return self._model_to_domain(model)
     
+    @_serialized
+    async def get_by_unique_keys(self, scope_level: str, scope_ref_id: str, keys: List[str]) -> Dict[str, EnvVar]:
+        """Get existing environment variables in a scope for the given keys"""
+        if not keys:
+            return {}
+        
+        models = (await self.db_session.scalars(select(EnvVarModel).where(
+            and_(
+                EnvVarModel.scope_level == scope_level,
+                EnvVarModel.scope_ref_id == scope_ref_id,
+                EnvVarModel.key.in_(keys)
+            )
+        ))).all()
+        
+        return {model.key: self._model_to_domain(model) for model in models}
+    
+    @_serialized
     async def update(self, env_var: EnvVar) -> EnvVar:
         """Update an environment variable"""
-        model = self.db_session.query(EnvVarModel).filter(EnvVarModel.id == env_var.id).first()
+        model = await self.db_session.get(EnvVarModel, env_var.id)
         if not model:
             raise ValueError(f"Environment variable {env_var.id} not found")
         
-        model.value_encrypted = env_var.value
-        model.type = env_var.type.value
-        model.tags = env_var.tags
-        model.description = env_var.description
-        model.status = env_var.status.value
-        model.updated_by = env_var.updated_by
-        model.updated_at = env_var.updated_at
+        self._apply_update(model, env_var)
         
-        self.db_session.commit()
+        await self.db_session.commit()
+        self._bump_write_version()
         return env_var
     
+    @_serialized
+    async def update_with_version_tx(self, env_var: EnvVar, version: EnvVarVersion) -> EnvVar:
+        """Update an environment variable and insert its version in one transaction"""
+        model = await self.db_session.get(EnvVarModel, env_var.id)
+        if not model:
+            raise ValueError(f"Environment variable {env_var.id} not found")
+        
+        self._apply_update(model, env_var)
+        
+        self.db_session.add(EnvVarVersionModel(**self._version_to_columns(version)))
+        await self.db_session.commit()
+        self._bump_write_version()
+        return env_var
+    
+    @_serialized
     async def delete(self, env_var_id: str) -> bool:
         """Delete an environment variable"""
-        model = self.db_session.query(EnvVarModel).filter(EnvVarModel.id == env_var_id).first()
+        # Versions are deleted by cascade; load them up front in one query
+        model = await self.db_session.get(
+            EnvVarModel, env_var_id, options=[selectinload(EnvVarModel.versions)]
+        )
         if not model:
             return False
         
-        self.db_session.delete(model)
-        self.db_session.commit()
+        await self.db_session.delete(model)
+        await self.db_session.commit()
+        self._bump_write_version()
         return True
     
-    async def list(self, filters: Dict[str, Any], page: int = 1, size: int = 50) -> List[EnvVar]:
-        """List environment variables with filtering and pagination"""
-        query = self.db_session.query(EnvVarModel)
-        
-        # Apply filters
+    @staticmethod
+    def _apply_update(model: EnvVarModel, env_var: EnvVar) -> None:
+        """Copy the updatable fields of env_var onto its row"""
+        model.value_encrypted = env_var.value
+        model.type = env_var.type.value
+        model.tags = env_var.tags
+        model.description = env_var.description
+        model.status = env_var.status.value
+        model.updated_by = env_var.updated_by
+        model.updated_at = env_var.updated_at
+    
+    @classmethod
+    def _bump_write_version(cls):
+        """Record a write for caches keyed on write_version"""
+        cls.write_version += 1
+    
+    @staticmethod
+    def _env_var_filters(filters: Dict[str, Any]) -> List[Any]:
+        """Build WHERE criteria for list/count from the filter dict"""
+        criteria = []
         if 'scope_level' in filters:
-            query = query.filter(EnvVarModel.scope_level == filters['scope_level'])
+            criteria.append(EnvVarModel.scope_level == filters['scope_level'])
         
         if 'scope_ref_id' in filters:
-            query = query.filter(EnvVarModel.scope_ref_id == filters['scope_ref_id'])
+            criteria.append(EnvVarModel.scope_ref_id == filters['scope_ref_id'])
         
         if 'key_filter' in filters:
-            query = query.filter(EnvVarModel.key.ilike(f"%{filters['key_filter']}%"))
+            criteria.append(EnvVarModel.key.ilike(f"%{filters['key_filter']}%"))
         
         if 'tag_filter' in filters:
-            query = query.filter(EnvVarModel.tags.contains([filters['tag_filter']]))
+            # tags @> '["tag"]', served by the GIN index on tags
+            criteria.append(type_coerce(EnvVarModel.tags, JSONB).contains([filters['tag_filter']]))
         
         if 'type_filter' in filters:
-            query = query.filter(EnvVarModel.type == filters['type_filter'])
+            criteria.append(EnvVarModel.type == filters['type_filter'])
         
         if 'status_filter' in filters:
-            query = query.filter(EnvVarModel.status == filters['status_filter'])
+            criteria.append(EnvVarModel.status == filters['status_filter'])
+        
+        return criteria
+    
+    @_serialized
+    async def list(self, filters: Dict[str, Any], page: int = 1, size: int = 50) -> List[EnvVar]:
+        """List environment variables with filtering and pagination"""
+        # Ordered along idx_env_vars_unique so pages are stable
+        query = (
+            select(_ENV_VARS)
+            .where(*self._env_var_filters(filters))
+            .order_by(EnvVarModel.scope_level, EnvVarModel.scope_ref_id, EnvVarModel.key)
+        )
         
         # Apply pagination
         offset = (page - 1) * size
-        models = query.offset(offset).limit(size).all()
+        rows = (await self.db_session.execute(query.offset(offset).limit(size))).all()
         
-        return [self._model_to_domain(model) for model in models]
+        return [self._model_to_domain(row) for row in rows]
     
+    @_serialized
     async def count(self, filters: Dict[str, Any]) -> int:
         """Count environment variables matching filters"""
-        query = self.db_session.query(EnvVarModel)
-        
-        # Apply same filters as list method
-        if 'scope_level' in filters:
-            query = query.filter(EnvVarModel.scope_level == filters['scope_level'])
-        
-        if 'scope_ref_id' in filters:
-            query = query.filter(EnvVarModel.scope_ref_id == filters['scope_ref_id'])
-        
-        if 'key_filter' in filters:
-            query = query.filter(EnvVarModel.key.ilike(f"%{filters['key_filter']}%"))
-        
-        if 'tag_filter' in filters:
-            query = query.filter(EnvVarModel.tags.contains([filters['tag_filter']]))
-        
-        if 'type_filter' in filters:
-            query = query.filter(EnvVarModel.type == filters['type_filter'])
-        
-        if 'status_filter' in filters:
-            query = query.filter(EnvVarModel.status == filters['status_filter'])
+        query = select(func.count()).select_from(EnvVarModel).where(*self._env_var_filters(filters))
+        return await self.db_session.scalar(query)
+    
+    @_serialized
+    async def list_by_scope(self, scope_level: str, scope_ref_id: str) -> Dict[str, EnvVar]:
+        """Get all environment variables in a scope keyed by env var key"""
+        rows = (await self.db_session.execute(select(_ENV_VARS).where(
+            and_(
+                EnvVarModel.scope_level == scope_level,
+                EnvVarModel.scope_ref_id == scope_ref_id
+            )
+        ))).all()
         
-        return query.count()
+        return {row.key: self._model_to_domain(row) for row in rows}
+    
+    @_serialized
+    async def list_by_scopes(self, scope_level: str, scope_ref_ids: List[str]) -> Dict[str, Dict[str, EnvVar]]:
+        """Get the env vars of several scopes of one level in one query, keyed by scope_ref_id"""
+        scopes: Dict[str, Dict[str, EnvVar]] = {ref_id: {} for ref_id in scope_ref_ids}
+        rows = (await self.db_session.execute(select(_ENV_VARS).where(
+            EnvVarModel.scope_level == scope_level,
+            EnvVarModel.scope_ref_id.in_(list(scopes))
+        ))).all()
+        
+        for row in rows:
+            scopes[row.scope_ref_id][row.key] = self._model_to_domain(row)
+        return scopes
     
     # Version management
+    @_serialized
     async def create_version(self, version: EnvVarVersion) -> EnvVarVersion:
         """Create a new version record"""
-        model = EnvVarVersionModel(
-            id=version.id,
-            env_var_id=version.env_var_id,
-            version=version.version,
-            diff_json=version.diff_json,
-            checksum=version.checksum,
-            author=version.author,
-            created_at=version.created_at
-        )
+        model = EnvVarVersionModel(**self._version_to_columns(version))
         
         self.db_session.add(model)
-        self.db_session.commit()
+        await self.db_session.commit()
+        self._bump_write_version()
         return version
     
+    def _version_to_columns(self, version: EnvVarVersion) -> Dict[str, Any]:
+        """Map a version onto EnvVarVersionModel columns"""
+        return {
+            'id': version.id,
+            'env_var_id': version.env_var_id,
+            'version': version.version,
+            'diff_json': version.diff_json,
+            'checksum': version.checksum,
+            'author': version.author,
+            'created_at': version.created_at
+        }
+    
+    @_serialized
     async def get_versions(self, env_var_id: str) -> List[EnvVarVersion]:
         """Get all versions for an environment variable"""
-        models = self.db_session.query(EnvVarVersionModel).filter(
+        rows = (await self.db_session.execute(select(_ENV_VAR_VERSIONS).where(
             EnvVarVersionModel.env_var_id == env_var_id
-        ).order_by(desc(EnvVarVersionModel.version)).all()
+        ).order_by(desc(EnvVarVersionModel.version)))).all()
         
-        return [self._version_model_to_domain(model) for model in models]
+        return [self._version_model_to_domain(row) for row in rows]
     
+    @_serialized
     async def get_next_version(self, env_var_id: str) -> int:
         """Get next version number for an environment variable"""
-        max_version = self.db_session.query(EnvVarVersionModel.version).filter(
+        max_version = await self.db_session.scalar(select(EnvVarVersionModel.version).where(
             EnvVarVersionModel.env_var_id == env_var_id
-        ).order_by(desc(EnvVarVersionModel.version)).first()
+        ).order_by(desc(EnvVarVersionModel.version)).limit(1))
         
         if max_version:
-            return max_version[0] + 1
+            return max_version + 1
         return 1
     
+    @_serialized
     async def rollback_to_version(self, env_var_id: str, version: int, rolled_back_by: str) -> EnvVar:
         """Rollback environment variable to a specific version"""
         # Get the version to rollback to
-        version_model = self.db_session.query(EnvVarVersionModel).filter(
+        version_model = await self.db_session.scalar(select(EnvVarVersionModel).where(
             and_(
                 EnvVarVersionModel.env_var_id == env_var_id,
                 EnvVarVersionModel.version == version
             )
-        ).first()
+        ).limit(1))
         
         if not version_model:
             raise ValueError(f"Version {version} not found for environment variable {env_var_id}")
         
-        # Get current env_var
-        env_var = await self.get_by_id(env_var_id)
-        if not env_var:
+        # Get current env_var (not via get_by_id, which would re-take the session lock)
+        model = await self.db_session.get(EnvVarModel, env_var_id)
+        if not model:
             raise ValueError(f"Environment variable {env_var_id} not found")
+        env_var = self._model_to_domain(model)
         
         # Apply version changes (simplified implementation)
         # In reality, you'd need to apply the diff_json changes
@@ -210,6 +334,7 @@ class SqlAlchemyEnvStore(EnvStore):
         return env_var
     
     # Release management
+    @_serialized
     async def create_release(self, release: Release) -> Release:
         """Create a new release"""
         model = ReleaseModel(
@@ -227,20 +352,39 @@ class SqlAlchemyEnvStore(EnvStore):
         )
         
         self.db_session.add(model)
-        self.db_session.commit()
+        await self.db_session.commit()
+        self._bump_write_version()
         return release
     
+    @_serialized
     async def get_release_by_id(self, release_id: str) -> Optional[Release]:
         """Get release by ID"""
-        model = self.db_session.query(ReleaseModel).filter(ReleaseModel.id == release_id).first()
+        model = await self.db_session.get(ReleaseModel, release_id)
         if not model:
             return None
         
         return self._release_model_to_domain(model)
     
+    @_serialized
+    async def get_release_with_approvals(self, release_id: str) -> Optional[Tuple[Release, List[Approval]]]:
+        """Get a release and its approvals, newest first, in one LEFT JOIN query"""
+        rows = (await self.db_session.execute(
+            select(ReleaseModel, ApprovalModel)
+            .outerjoin(ApprovalModel, ApprovalModel.release_id == ReleaseModel.id)
+            .where(ReleaseModel.id == release_id)
+            .order_by(desc(ApprovalModel.decided_at))
+        )).all()
+        if not rows:
+            return None
+        
+        release = self._release_model_to_domain(rows[0][0])
+        approvals = [self._approval_model_to_domain(approval) for _, approval in rows if approval is not None]
+        return release, approvals
+    
+    @_serialized
     async def update_release(self, release: Release) -> Release:
         """Update a release"""
-        model = self.db_session.query(ReleaseModel).filter(ReleaseModel.id == release.id).first()
+        model = await self.db_session.get(ReleaseModel, release.id)
         if not model:
             raise ValueError(f"Release {release.id} not found")
         
@@ -248,33 +392,83 @@ class SqlAlchemyEnvStore(EnvStore):
         model.applied_by = release.applied_by
         model.applied_at = release.applied_at
         
-        self.db_session.commit()
+        await self.db_session.commit()
+        self._bump_write_version()
+        return release
+    
+    @_serialized
+    async def approve_release_tx(self, approval: Approval, release_id: str) -> Release:
+        """Insert the approval and flip the release to APPROVED in one transaction"""
+        self.db_session.add(self._approval_to_model(approval))
+        model = await self.db_session.scalar(
+            update(ReleaseModel)
+            .where(ReleaseModel.id == release_id,
+                   ReleaseModel.status == ReleaseStatus.PENDING_APPROVAL.value)
+            .values(status=ReleaseStatus.APPROVED.value)
+            .returning(ReleaseModel)
+        )
+        if model is None:
+            await self.db_session.rollback()
+            raise ValueError(f"Release {release_id} cannot be approved")
+        
+        await self.db_session.commit()
+        self._bump_write_version()
+        return self._release_model_to_domain(model)
+    
+    @_serialized
+    async def apply_release_tx(self, release: Release, event: AuditEvent) -> Release:
+        """Update the applied release and insert its audit event in one transaction"""
+        result = await self.db_session.execute(
+            update(ReleaseModel)
+            .where(ReleaseModel.id == release.id)
+            .values(status=release.status.value,
+                    applied_by=release.applied_by,
+                    applied_at=release.applied_at)
+        )
+        if result.rowcount == 0:
+            await self.db_session.rollback()
+            raise ValueError(f"Release {release.id} not found")
+        
+        self.db_session.add(AuditEventModel(**self._audit_event_to_columns(event)))
+        await self.db_session.commit()
+        self._bump_write_version()
         return release
     
+    @_serialized
     async def list_releases(self, filters: Dict[str, Any], page: int = 1, size: int = 50) -> List[Release]:
         """List releases with filtering and pagination"""
-        query = self.db_session.query(ReleaseModel)
+        query = select(_RELEASES)
         
         # Apply filters
         if 'service_id' in filters:
-            query = query.filter(ReleaseModel.service_id == filters['service_id'])
+            query = query.where(ReleaseModel.service_id == filters['service_id'])
         
         if 'environment' in filters:
-            query = query.filter(ReleaseModel.environment == filters['environment'])
+            query = query.where(ReleaseModel.environment == filters['environment'])
         
         if 'status' in filters:
-            query = query.filter(ReleaseModel.status == filters['status'])
+            query = query.where(ReleaseModel.status == filters['status'])
         
         # Apply pagination
         offset = (page - 1) * size
-        models = query.order_by(desc(ReleaseModel.created_at)).offset(offset).limit(size).all()
+        rows = (await self.db_session.execute(
+            query.order_by(desc(ReleaseModel.created_at)).offset(offset).limit(size)
+        )).all()
         
-        return [self._release_model_to_domain(model) for model in models]
+        return [self._release_model_to_domain(row) for row in rows]
     
     # Approval management
+    @_serialized
     async def create_approval(self, approval: Approval) -> Approval:
         """Create a new approval"""
-        model = ApprovalModel(
+        self.db_session.add(self._approval_to_model(approval))
+        await self.db_session.commit()
+        self._bump_write_version()
+        return approval
+    
+    def _approval_to_model(self, approval: Approval) -> ApprovalModel:
+        """Map an approval onto a new ApprovalModel"""
+        return ApprovalModel(
             id=approval.id,
             release_id=approval.release_id,
             approver_id=approval.approver_id,
@@ -282,70 +476,77 @@ class SqlAlchemyEnvStore(EnvStore):
             comment=approval.comment,
             decided_at=approval.decided_at
         )
-        
-        self.db_session.add(model)
-        self.db_session.commit()
-        return approval
     
+    @_serialized
     async def get_approvals_for_release(self, release_id: str) -> List[Approval]:
         """Get all approvals for a release"""
-        models = self.db_session.query(ApprovalModel).filter(
+        rows = (await self.db_session.execute(select(_APPROVALS).where(
             ApprovalModel.release_id == release_id
-        ).order_by(desc(ApprovalModel.decided_at)).all()
+        ).order_by(desc(ApprovalModel.decided_at)))).all()
         
-        return [self._approval_model_to_domain(model) for model in models]
+        return [self._approval_model_to_domain(row) for row in rows]
     
+    @_serialized
     async def get_approval_by_id(self, approval_id: str) -> Optional[Approval]:
         """Get approval by ID"""
-        model = self.db_session.query(ApprovalModel).filter(ApprovalModel.id == approval_id).first()
+        model = await self.db_session.get(ApprovalModel, approval_id)
         if not model:
             return None
         
         return self._approval_model_to_domain(model)
     
     # Audit management
+    @_serialized
     async def create_audit_event(self, event: AuditEvent) -> AuditEvent:
         """Create an audit event"""
-        model = AuditEventModel(
-            id=event.id,
-            actor=event.actor,
-            action=event.action.value,
-            target_type=event.target_type.value,
-            target_id=event.target_id,
-            before_json=event.before_json,
-            after_json=event.after_json,
-            reason=event.reason,
-            timestamp=event.timestamp
-        )
+        model = AuditEventModel(**self._audit_event_to_columns(event))
         
         self.db_session.add(model)
-        self.db_session.commit()
+        await self.db_session.commit()
         return event
     
+    def _audit_event_to_columns(self, event: AuditEvent) -> Dict[str, Any]:
+        """Map an audit event onto AuditEventModel columns"""
+        return {
+            'id': event.id,
+            'actor': event.actor,
+            'action': event.action.value,
+            'target_type': event.target_type.value,
+            'target_id': event.target_id,
+            'before_json': event.before_json,
+            'after_json': event.after_json,
+            'reason': str(event.reason) if event.reason is not None else None,
+            'timestamp': event.timestamp
+        }
+    
+    @_serialized
     async def get_audit_events(self, filters: Dict[str, Any], page: int = 1, size: int = 50) -> List[AuditEvent]:
         """Get audit events with filtering and pagination"""
-        query = self.db_session.query(AuditEventModel)
+        query = select(AuditEventModel)
         
         # Apply filters
         if 'actor' in filters:
-            query = query.filter(AuditEventModel.actor == filters['actor'])
+            query = query.where(AuditEventModel.actor == filters['actor'])
         
         if 'action' in filters:
-            query = query.filter(AuditEventModel.action == filters['action'])
+            query = query.where(AuditEventModel.action == filters['action'])
         
         if 'target_type' in filters:
-            query = query.filter(AuditEventModel.target_type == filters['target_type'])
+            query = query.where(AuditEventModel.target_type == filters['target_type'])
         
         if 'target_id' in filters:
-            query = query.filter(AuditEventModel.target_id == filters['target_id'])
+            query = query.where(AuditEventModel.target_id == filters['target_id'])
         
         # Apply pagination
         offset = (page - 1) * size
-        models = query.order_by(desc(AuditEventModel.timestamp)).offset(offset).limit(size).all()
+        models = (await self.db_session.scalars(
+            query.order_by(desc(AuditEventModel.timestamp)).offset(offset).limit(size)
+        )).all()
         
         return [self._audit_event_model_to_domain(model) for model in models]
     
     # Rotation management
+    @_serialized
     async def create_rotation_schedule(self, schedule: Dict[str, Any]) -> Dict[str, Any]:
         """Create a rotation schedule"""
         model = RotationScheduleModel(
@@ -360,28 +561,28 @@ class SqlAlchemyEnvStore(EnvStore):
         )
         
         self.db_session.add(model)
-        self.db_session.commit()
+        await self.db_session.commit()
         return schedule
     
+    @_serialized
     async def get_rotation_schedules(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get rotation schedules"""
-        query = self.db_session.query(RotationScheduleModel)
+        query = select(RotationScheduleModel)
         
         # Apply filters
         if 'env_var_id' in filters:
-            query = query.filter(RotationScheduleModel.env_var_id == filters['env_var_id'])
+            query = query.where(RotationScheduleModel.env_var_id == filters['env_var_id'])
         
         if 'status' in filters:
-            query = query.filter(RotationScheduleModel.status == filters['status'])
+            query = query.where(RotationScheduleModel.status == filters['status'])
         
-        models = query.all()
+        models = (await self.db_session.scalars(query)).all()
         return [self._rotation_schedule_model_to_dict(model) for model in models]
     
+    @_serialized
     async def update_rotation_schedule(self, schedule_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update a rotation schedule"""
-        model = self.db_session.query(RotationScheduleModel).filter(
-            RotationScheduleModel.id == schedule_id
-        ).first()
+        model = await self.db_session.get(RotationScheduleModel, schedule_id)
         
         if not model:
             return {}
@@ -390,22 +591,41 @@ class SqlAlchemyEnvStore(EnvStore):
             if hasattr(model, key):
                 setattr(model, key, value)
         
-        self.db_session.commit()
+        await self.db_session.commit()
         return self._rotation_schedule_model_to_dict(model)
     
     # Helper methods
+    def _domain_to_columns(self, env_var: EnvVar) -> Dict[str, Any]:
+        """Convert domain object to EnvVarModel column values"""
+        return {
+            'id': env_var.id,
+            'key': env_var.key,
+            'value_encrypted': env_var.value,
+            'type': env_var.type.value,
+            'scope_level': env_var.scope.level.value,
+            'scope_ref_id': env_var.scope.ref_id,
+            'tags': env_var.tags,
+            'description': env_var.description,
+            'is_secret': env_var.is_secret,
+            'status': env_var.status.value,
+            'created_by': env_var.created_by,
+            'created_at': env_var.created_at,
+            'updated_by': env_var.updated_by,
+            'updated_at': env_var.updated_at
+        }
+    
     def _model_to_domain(self, model: EnvVarModel) -> EnvVar:
         """Convert SQLAlchemy model to domain object"""
         return EnvVar(
             id=model.id,
             key=model.key,
             value=model.value_encrypted,
-            type=EnvVarType(model.type),
-            scope=ScopeRef(ScopeLevel(model.scope_level), model.scope_ref_id),
+            type=_ENV_VAR_TYPES[model.type],
+            scope=ScopeRef(_SCOPE_LEVELS[model.scope_level], model.scope_ref_id),
             tags=model.tags or [],
             description=model.description,
             is_secret=model.is_secret,
-            status=EnvVarStatus(model.status),
+            status=_ENV_VAR_STATUSES[model.status],
             created_by=model.created_by,
             created_at=model.created_at,
             updated_by=model.updated_by,
@@ -432,7 +652,7 @@ class SqlAlchemyEnvStore(EnvStore):
             environment=model.environment,
             title=model.title,
             description=model.description,
-            status=ReleaseStatus(model.status),
+            status=_RELEASE_STATUSES[model.status],
             changes=model.changes,
             created_by=model.created_by,
             created_at=model.created_at,
@@ -446,7 +666,7 @@ class SqlAlchemyEnvStore(EnvStore):
             id=model.id,
             release_id=model.release_id,
             approver_id=model.approver_id,
-            decision=ApprovalDecision(model.decision),
+            decision=_APPROVAL_DECISIONS[model.decision],
             comment=model.comment,
             decided_at=model.decided_at
         )
@@ -454,10 +674,10 @@ class SqlAlchemyEnvStore(EnvStore):
     def _audit_event_model_to_domain(self, model: AuditEventModel) -> AuditEvent:
         """Convert audit event model to domain object"""
         return AuditEvent(
-            id=model.id,
+            id=str(model.id),
             actor=model.actor,
-            action=AuditAction(model.action),
-            target_type=AuditTargetType(model.target_type),
+            action=_AUDIT_ACTIONS[model.action],
+            target_type=_AUDIT_TARGET_TYPES[model.target_type],
             target_id=model.target_id,
             before_json=model.before_json,
             after_json=model.after_json,
@@ -0,0 +1,22 @@
+"""
+IdGenerator implementation backed by uuid4
+"""
+import uuid
+
+from app.core.ports.id_generator import IdGenerator
+
+
+class UuidIdGenerator(IdGenerator):
+    """Stateless UUID v4 ID generator, safe to share across requests"""
+
+    def generate(self) -> str:
+        """Generate a new unique ID"""
+        return str(uuid.uuid4())
+
+    def generate_uuid(self) -> str:
+        """Generate a UUID v4"""
+        return str(uuid.uuid4())
+
+    def generate_short_id(self) -> str:
+        """Generate a short ID"""
+        return uuid.uuid4().hex[:8]
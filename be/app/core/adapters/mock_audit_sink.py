@@ -0,0 +1,18 @@
+"""
+Mock implementation of AuditSink for testing
+"""
+from typing import List
+
+from ..domain.audit_event import AuditEvent
+from ..ports.audit_sink import AuditSink
+
+
+class MockAuditSink(AuditSink):
+    """AuditSink that keeps every event in memory (for tests that read audit data)"""
+    
+    def __init__(self):
+        self.events: List[AuditEvent] = []
+    
+    async def create_audit_event(self, event: AuditEvent) -> None:
+        """Record the audit event"""
+        self.events.append(event)
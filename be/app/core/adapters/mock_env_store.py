@@ -1,9 +1,11 @@
 """
 Mock implementation of EnvStore for testing
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Set
 from datetime import datetime
+from collections import defaultdict
 import asyncio
+import itertools
 
 from ..domain.env_var import EnvVar
 from ..domain.env_var_version import EnvVarVersion
@@ -23,34 +25,68 @@ class MockEnvStore(EnvStore):
         self.approvals: Dict[str, List[Approval]] = {}
         self.audit_events: List[AuditEvent] = []
         self.rotation_schedules: Dict[str, Dict[str, Any]] = {}
+        self._write_lock = asyncio.Lock()
+        
+        # Secondary indexes over env_vars
+        self._by_scope: Dict[Tuple[str, str], Dict[str, EnvVar]] = {}  # (scope_level, ref_id) -> {key: env_var}
+        self._idx: Dict[str, Dict[str, Set[str]]] = {
+            'scope_level': defaultdict(set),
+            'type': defaultdict(set),
+            'status': defaultdict(set),
+            'tag': defaultdict(set),
+        }
+        self._seq: Dict[str, int] = {}  # id -> insertion order, used to sort index hits
+        self._seq_counter = itertools.count()
     
     async def create(self, env_var: EnvVar) -> EnvVar:
         """Create a new environment variable"""
         self.env_vars[env_var.id] = env_var
+        self._index(env_var)
+        self.write_version += 1
         return env_var
     
+    async def create_if_absent(self, env_var: EnvVar) -> Optional[EnvVar]:
+        """Create an environment variable unless its unique key is taken"""
+        async with self._write_lock:
+            existing = await self.get_by_unique_key(
+                env_var.scope.level.value, env_var.scope.ref_id, env_var.key
+            )
+            if existing:
+                return None
+            self.env_vars[env_var.id] = env_var
+            self._index(env_var)
+            self.write_version += 1
+            return env_var
+    
     async def get_by_id(self, env_var_id: str) -> Optional[EnvVar]:
         """Get environment variable by ID"""
         return self.env_vars.get(env_var_id)
     
     async def get_by_unique_key(self, scope_level: str, scope_ref_id: str, key: str) -> Optional[EnvVar]:
         """Get environment variable by unique key"""
-        for env_var in self.env_vars.values():
-            if (env_var.scope.level.value == scope_level and 
-                env_var.scope.ref_id == scope_ref_id and 
-                env_var.key == key):
-                return env_var
-        return None
+        return self._by_scope.get((scope_level, scope_ref_id), {}).get(key)
+    
+    async def get_by_unique_keys(self, scope_level: str, scope_ref_id: str, keys: List[str]) -> Dict[str, EnvVar]:
+        """Get existing environment variables in a scope for the given keys"""
+        scope_vars = self._by_scope.get((scope_level, scope_ref_id), {})
+        return {key: scope_vars[key] for key in keys if key in scope_vars}
     
     async def update(self, env_var: EnvVar) -> EnvVar:
         """Update an environment variable"""
+        previous = self.env_vars.get(env_var.id)
+        if previous:
+            self._unindex(previous)
         self.env_vars[env_var.id] = env_var
+        self._index(env_var)
+        self.write_version += 1
         return env_var
     
     async def delete(self, env_var_id: str) -> bool:
         """Delete an environment variable"""
         if env_var_id in self.env_vars:
-            del self.env_vars[env_var_id]
+            self._unindex(self.env_vars.pop(env_var_id))
+            del self._seq[env_var_id]
+            self.write_version += 1
             return True
         return False
     
@@ -58,7 +94,7 @@ class MockEnvStore(EnvStore):
         """List environment variables with filtering and pagination"""
         filtered_vars = []
         
-        for env_var in self.env_vars.values():
+        for env_var in self._candidates(filters):
             if self._matches_filters(env_var, filters):
                 filtered_vars.append(env_var)
         
@@ -70,11 +106,69 @@ class MockEnvStore(EnvStore):
     async def count(self, filters: Dict[str, Any]) -> int:
         """Count environment variables matching filters"""
         count = 0
-        for env_var in self.env_vars.values():
+        for env_var in self._candidates(filters):
             if self._matches_filters(env_var, filters):
                 count += 1
         return count
     
+    async def list_by_scope(self, scope_level: str, scope_ref_id: str) -> Dict[str, EnvVar]:
+        """Get all environment variables in a scope keyed by env var key"""
+        # Returns the live index partition; callers must not mutate it
+        return self._by_scope.get((scope_level, scope_ref_id), {})
+    
+    def _index(self, env_var: EnvVar):
+        """Add environment variable to secondary indexes"""
+        scope = (env_var.scope.level.value, env_var.scope.ref_id)
+        self._by_scope.setdefault(scope, {})[env_var.key] = env_var
+        self._idx['scope_level'][env_var.scope.level.value].add(env_var.id)
+        self._idx['type'][env_var.type.value].add(env_var.id)
+        self._idx['status'][env_var.status.value].add(env_var.id)
+        for tag in env_var.tags:
+            self._idx['tag'][tag].add(env_var.id)
+        if env_var.id not in self._seq:
+            self._seq[env_var.id] = next(self._seq_counter)
+    
+    def _unindex(self, env_var: EnvVar):
+        """Remove environment variable from secondary indexes"""
+        scope = (env_var.scope.level.value, env_var.scope.ref_id)
+        scope_vars = self._by_scope.get(scope)
+        if scope_vars and env_var.key in scope_vars:
+            del scope_vars[env_var.key]
+            if not scope_vars:
+                del self._by_scope[scope]
+        self._idx['scope_level'][env_var.scope.level.value].discard(env_var.id)
+        self._idx['type'][env_var.type.value].discard(env_var.id)
+        self._idx['status'][env_var.status.value].discard(env_var.id)
+        for tag in env_var.tags:
+            self._idx['tag'][tag].discard(env_var.id)
+    
+    def _candidates(self, filters: Dict[str, Any]) -> Iterable[EnvVar]:
+        """Resolve filters against the indexes and return matches in insertion order
+        
+        Only key_filter (substring) is left for _matches_filters to check.
+        """
+        id_sets = []
+        if 'scope_level' in filters and 'scope_ref_id' in filters:
+            scope_vars = self._by_scope.get((filters['scope_level'], filters['scope_ref_id']), {})
+            id_sets.append({env_var.id for env_var in scope_vars.values()})
+        elif 'scope_level' in filters:
+            id_sets.append(self._idx['scope_level'].get(filters['scope_level'], set()))
+        if 'type_filter' in filters:
+            id_sets.append(self._idx['type'].get(filters['type_filter'], set()))
+        if 'status_filter' in filters:
+            id_sets.append(self._idx['status'].get(filters['status_filter'], set()))
+        if 'tag_filter' in filters:
+            # Tag filter is a substring match, so union every indexed tag containing it
+            needle = filters['tag_filter']
+            id_sets.append(set().union(*(ids for tag, ids in self._idx['tag'].items() if needle in tag)))
+        
+        if not id_sets:
+            return self.env_vars.values()
+        
+        id_sets.sort(key=len)
+        ids = set(id_sets[0]).intersection(*id_sets[1:])
+        return [self.env_vars[env_var_id] for env_var_id in sorted(ids, key=self._seq.__getitem__)]
+    
     def _matches_filters(self, env_var: EnvVar, filters: Dict[str, Any]) -> bool:
         """Check if environment variable matches filters"""
         if 'scope_level' in filters and env_var.scope.level.value != filters['scope_level']:
@@ -104,6 +198,7 @@ class MockEnvStore(EnvStore):
         if version.env_var_id not in self.versions:
             self.versions[version.env_var_id] = []
         self.versions[version.env_var_id].append(version)
+        self.write_version += 1
         return version
     
     async def get_versions(self, env_var_id: str) -> List[EnvVarVersion]:
@@ -140,6 +235,7 @@ class MockEnvStore(EnvStore):
     async def create_release(self, release: Release) -> Release:
         """Create a new release"""
         self.releases[release.id] = release
+        self.write_version += 1
         return release
     
     async def get_release_by_id(self, release_id: str) -> Optional[Release]:
@@ -149,6 +245,7 @@ class MockEnvStore(EnvStore):
     async def update_release(self, release: Release) -> Release:
         """Update a release"""
         self.releases[release.id] = release
+        self.write_version += 1
         return release
     
     async def list_releases(self, filters: Dict[str, Any], page: int = 1, size: int = 50) -> List[Release]:
@@ -183,6 +280,7 @@ class MockEnvStore(EnvStore):
         if approval.release_id not in self.approvals:
             self.approvals[approval.release_id] = []
         self.approvals[approval.release_id].append(approval)
+        self.write_version += 1
         return approval
     
     async def get_approvals_for_release(self, release_id: str) -> List[Approval]:
@@ -0,0 +1,15 @@
+"""
+No-op implementation of AuditSink for testing
+"""
+from ..domain.audit_event import AuditEvent
+from ..ports.audit_sink import AuditSink
+
+
+class NullAuditSink(AuditSink):
+    """AuditSink that discards every event (for tests that never read audit data)"""
+    
+    enabled = False
+    
+    async def create_audit_event(self, event: AuditEvent) -> None:
+        """Discard the audit event"""
+        return None
@@ -1,13 +1,37 @@
+import logging
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# ==== Logging ====
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
 # ==== Security ====
 SECRET_KEY = os.getenv("SECRET_KEY", "super-secret")
 ENCRYPTION_MASTER_KEY = os.getenv("ENCRYPTION_MASTER_KEY", "encryption-master-key-for-development-only")
 
+# ==== Schema ====
+# Set ALEMBIC_MANAGED=1 when migrations own the schema to skip create_all at startup
+ALEMBIC_MANAGED = os.getenv("ALEMBIC_MANAGED") == "1"
+
+# ==== Releases ====
+# Max number of release changes applied concurrently
+APPLY_CONCURRENCY = int(os.getenv("APPLY_CONCURRENCY", "8"))
+
+# ==== Read caches ====
+# In-process read caches are invalidated by a per-process write counter, so
+# they are only coherent with a single worker; WEB_CONCURRENCY is the worker
+# count uvicorn and gunicorn read
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+READ_CACHES_ENABLED = WEB_CONCURRENCY <= 1
+
+# ==== Audit ====
+# How often the audit_stats_mv materialized view is refreshed (PostgreSQL)
+AUDIT_STATS_REFRESH_SECONDS = int(os.getenv("AUDIT_STATS_REFRESH_SECONDS", "300"))
+
 # ==== Database URL ====
 DB_URL = os.getenv("DATABASE_URL")
 
@@ -25,4 +49,4 @@ def mask_db_url(url: str) -> str:
         return "***"
 
 # Log gọn để debug, KHÔNG lộ mật khẩu
-print("🔍 DATABASE_URL =", mask_db_url(DB_URL))
+logging.getLogger("app.config").info("DATABASE_URL = %s", mask_db_url(DB_URL))
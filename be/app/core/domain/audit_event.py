@@ -3,7 +3,7 @@ Domain model for Audit Events
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from dataclasses import dataclass
 import json
 
@@ -30,6 +30,30 @@ class AuditTargetType(Enum):
     POLICY = "POLICY"
 
 
+class LazyReason:
+    """Audit reason formatted with %-style arguments only when it is read"""
+    
+    __slots__ = ('fmt', 'args')
+    
+    def __init__(self, fmt: str, *args: Any):
+        self.fmt = fmt
+        self.args = args
+    
+    def __str__(self) -> str:
+        return self.fmt % self.args
+    
+    def __repr__(self) -> str:
+        return f"LazyReason({str(self)!r})"
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyReason, str)):
+            return str(self) == str(other)
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
 @dataclass
 class AuditEvent:
     """Audit event for tracking all changes"""
@@ -40,7 +64,7 @@ class AuditEvent:
     target_id: str
     before_json: Optional[Dict[str, Any]]
     after_json: Optional[Dict[str, Any]]
-    reason: Optional[str]
+    reason: Optional[Union[str, LazyReason]]
     timestamp: datetime
     
     def __post_init__(self):
@@ -123,7 +147,7 @@ class AuditEvent:
             'target_id': self.target_id,
             'before_json': self.get_masked_before_json(),
             'after_json': self.get_masked_after_json(),
-            'reason': self.reason,
+            'reason': str(self.reason) if self.reason is not None else None,
             'timestamp': self.timestamp.isoformat(),
             'action_description': self.get_action_description(),
             'change_summary': self.get_change_summary(),
@@ -5,9 +5,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
+import json
 import re
 
 
+# Compiled once at import; EnvVar validation runs on every construction
+_KEY_RE = re.compile(r'^[A-Z0-9_]{1,100}$')
+
+
 class ScopeLevel(Enum):
     """Scope levels for environment variables"""
     GLOBAL = "GLOBAL"
@@ -60,7 +65,7 @@ class EnvVar:
     updated_at: datetime
     
     # Validation rules
-    KEY_REGEX = re.compile(r'^[A-Z0-9_]{1,100}$')
+    KEY_REGEX = _KEY_RE
     MAX_VALUE_SIZE = 1024 * 1024  # 1MB
     
     def __post_init__(self):
@@ -70,7 +75,7 @@ class EnvVar:
     def _validate(self):
         """Validate environment variable according to business rules"""
         # Validate key format
-        if not self.KEY_REGEX.match(self.key):
+        if not _KEY_RE.match(self.key):
             raise ValueError(f"Key must match pattern ^[A-Z0-9_]{{1,100}}$: {self.key}")
         
         # Validate value size
@@ -90,7 +95,6 @@ class EnvVar:
         
         elif self.type == EnvVarType.JSON:
             try:
-                import json
                 json.loads(self.value)
             except json.JSONDecodeError:
                 raise ValueError(f"Value must be valid JSON for type JSON: {self.value}")
@@ -0,0 +1,18 @@
+"""
+Port interface for recording audit events
+"""
+from abc import ABC, abstractmethod
+
+from ..domain.audit_event import AuditEvent
+
+
+class AuditSink(ABC):
+    """Abstract interface for recording audit events"""
+    
+    # Use cases skip building audit events entirely when the sink is disabled
+    enabled: bool = True
+    
+    @abstractmethod
+    async def create_audit_event(self, event: AuditEvent) -> None:
+        """Record an audit event"""
+        pass
@@ -2,12 +2,13 @@
 Port interface for environment variable storage
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from ..domain.env_var import EnvVar
 from ..domain.env_var_version import EnvVarVersion
-from ..domain.release import Release
+from ..domain.release import Release, ReleaseStatus
 from ..domain.approval import Approval
 from ..domain.audit_event import AuditEvent
 
@@ -15,11 +16,24 @@ from ..domain.audit_event import AuditEvent
 class EnvStore(ABC):
     """Abstract interface for environment variable storage"""
     
+    # Monotonic counter bumped on every write (env vars, versions, releases,
+    # approvals), so read caches in front of the store can tell when their
+    # entries are stale
+    write_version: int = 0
+    
     @abstractmethod
     async def create(self, env_var: EnvVar) -> EnvVar:
         """Create a new environment variable"""
         pass
     
+    @abstractmethod
+    async def create_if_absent(self, env_var: EnvVar) -> Optional[EnvVar]:
+        """Create an environment variable unless its unique key (scope + key) is taken.
+        
+        Returns the created environment variable, or None on conflict.
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, env_var_id: str) -> Optional[EnvVar]:
         """Get environment variable by ID"""
@@ -30,11 +44,24 @@ class EnvStore(ABC):
         """Get environment variable by unique key (scope + key)"""
         pass
     
+    async def get_by_unique_keys(self, scope_level: str, scope_ref_id: str, keys: List[str]) -> Dict[str, EnvVar]:
+        """Get existing environment variables in a scope for the given keys, keyed by key"""
+        results = await asyncio.gather(
+            *(self.get_by_unique_key(scope_level, scope_ref_id, key) for key in keys)
+        )
+        return {key: env_var for key, env_var in zip(keys, results) if env_var}
+    
     @abstractmethod
     async def update(self, env_var: EnvVar) -> EnvVar:
         """Update an environment variable"""
         pass
     
+    async def update_with_version_tx(self, env_var: EnvVar, version: EnvVarVersion) -> EnvVar:
+        """Update an environment variable and record its version"""
+        await self.update(env_var)
+        await self.create_version(version)
+        return env_var
+    
     @abstractmethod
     async def delete(self, env_var_id: str) -> bool:
         """Delete an environment variable"""
@@ -50,6 +77,19 @@ class EnvStore(ABC):
         """Count environment variables matching filters"""
         pass
     
+    @abstractmethod
+    async def list_by_scope(self, scope_level: str, scope_ref_id: str) -> Dict[str, EnvVar]:
+        """Get all environment variables in a scope keyed by env var key (treat as read-only)"""
+        pass
+    
+    async def list_by_scopes(self, scope_level: str, scope_ref_ids: List[str]) -> Dict[str, Dict[str, EnvVar]]:
+        """Get list_by_scope for several scopes of one level, keyed by scope_ref_id"""
+        ref_ids = list(dict.fromkeys(scope_ref_ids))
+        results = await asyncio.gather(
+            *(self.list_by_scope(scope_level, ref_id) for ref_id in ref_ids)
+        )
+        return dict(zip(ref_ids, results))
+    
     # Version management
     @abstractmethod
     async def create_version(self, version: EnvVarVersion) -> EnvVarVersion:
@@ -92,6 +132,28 @@ class EnvStore(ABC):
         """List releases with filtering and pagination"""
         pass
     
+    async def approve_release_tx(self, approval: Approval, release_id: str) -> Release:
+        """Record an approval and move its release from PENDING_APPROVAL to APPROVED"""
+        release = await self.get_release_by_id(release_id)
+        if not release or not release.can_be_approved():
+            raise ValueError(f"Release {release_id} cannot be approved")
+        await self.create_approval(approval)
+        release.status = ReleaseStatus.APPROVED
+        return await self.update_release(release)
+    
+    async def apply_release_tx(self, release: Release, event: AuditEvent) -> Release:
+        """Persist an applied release together with its audit event"""
+        await self.update_release(release)
+        await self.create_audit_event(event)
+        return release
+    
+    async def get_release_with_approvals(self, release_id: str) -> Optional[Tuple[Release, List[Approval]]]:
+        """Get a release and its approvals, newest first"""
+        release = await self.get_release_by_id(release_id)
+        if not release:
+            return None
+        return release, await self.get_approvals_for_release(release_id)
+    
     # Approval management
     @abstractmethod
     async def create_approval(self, approval: Approval) -> Approval:
@@ -2,7 +2,7 @@
 Port interface for exporting environment variables
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 
 from ..domain.env_var import EnvVar
 
@@ -25,6 +25,21 @@ class Exporter(ABC):
         """Export environment variables to .env format"""
         pass
     
+    # Streaming exports yield UTF-8 chunks so large exports never have to be held
+    # as one string. The defaults emit the full export as a single chunk;
+    # exporters override them to stream incrementally.
+    async def stream_to_k8s_secret(self, env_vars: List[EnvVar], secret_name: str) -> AsyncIterator[bytes]:
+        """Stream Kubernetes Secret YAML in chunks"""
+        yield (await self.export_to_k8s_secret(env_vars, secret_name)).encode('utf-8')
+    
+    async def stream_to_k8s_configmap(self, env_vars: List[EnvVar], configmap_name: str) -> AsyncIterator[bytes]:
+        """Stream Kubernetes ConfigMap YAML in chunks"""
+        yield (await self.export_to_k8s_configmap(env_vars, configmap_name)).encode('utf-8')
+    
+    async def stream_to_dotenv(self, env_vars: List[EnvVar]) -> AsyncIterator[bytes]:
+        """Stream .env content in chunks"""
+        yield (await self.export_to_dotenv(env_vars)).encode('utf-8')
+    
     @abstractmethod
     async def export_to_json(self, env_vars: List[EnvVar]) -> str:
         """Export environment variables to JSON format"""
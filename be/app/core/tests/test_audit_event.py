@@ -0,0 +1,107 @@
+"""
+Unit tests for audit event domain objects
+"""
+import json
+from datetime import datetime
+
+from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType, LazyReason
+from ..domain.env_var import EnvVarType, ScopeRef, ScopeLevel
+from ..usecases.env_var_management import CreateEnvVarUseCase, CreateEnvVarRequest
+from ..adapters.mock_env_store import MockEnvStore
+from ..adapters.mock_secret_cipher import MockSecretCipher
+from ..adapters.mock_clock import MockClock
+from ..adapters.mock_id_generator import MockIdGenerator
+from ..adapters.mock_audit_sink import MockAuditSink
+from ..adapters.null_audit_sink import NullAuditSink
+
+
+class CountingArg:
+    """Format argument that counts how often it is rendered"""
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.renders = 0
+    
+    def __str__(self) -> str:
+        self.renders += 1
+        return self.text
+
+
+def _create_request() -> CreateEnvVarRequest:
+    return CreateEnvVarRequest(
+        key="DATABASE_URL",
+        value="postgresql://localhost/db",
+        type=EnvVarType.STRING,
+        scope=ScopeRef(ScopeLevel.GLOBAL, "default"),
+        tags=[],
+        description=None,
+        is_secret=False,
+        created_by="user1"
+    )
+
+
+class TestLazyReason:
+    """Test cases for LazyReason"""
+    
+    def test_str_formats_args(self):
+        """Test str() renders the %-style format"""
+        reason = LazyReason("Applied release %s with %d failed change(s)", "v1", 2)
+        
+        assert str(reason) == "Applied release v1 with 2 failed change(s)"
+        assert reason == "Applied release v1 with 2 failed change(s)"
+        assert repr(reason) == "LazyReason('Applied release v1 with 2 failed change(s)')"
+    
+    def test_args_not_formatted_until_read(self):
+        """Test building a LazyReason does not render its arguments"""
+        arg = CountingArg("DATABASE_URL")
+        reason = LazyReason("Created environment variable %s", arg)
+        assert arg.renders == 0
+        
+        assert str(reason) == "Created environment variable DATABASE_URL"
+        assert arg.renders == 1
+    
+    def test_json_encoding_uses_formatted_text(self):
+        """Test the event dict carries the formatted reason as a plain string"""
+        event = AuditEvent(
+            id="event-1",
+            actor="user1",
+            action=AuditAction.EXPORT,
+            target_type=AuditTargetType.ENV_VAR,
+            target_id="dotenv-default",
+            before_json=None,
+            after_json={'format': 'dotenv', 'count': 3},
+            reason=LazyReason("Exported %d environment variables to %s", 3, ".env format"),
+            timestamp=datetime(2024, 1, 1)
+        )
+        
+        data = json.loads(json.dumps(event.to_dict()))
+        
+        assert data['reason'] == "Exported 3 environment variables to .env format"
+    
+    async def test_recorded_reason_is_not_formatted(self, monkeypatch):
+        """Test an audited use case hands the sink a reason it has not rendered"""
+        renders = []
+        monkeypatch.setattr(LazyReason, "__str__", lambda self: renders.append(self) or self.fmt % self.args)
+        audit_sink = MockAuditSink()
+        use_case = CreateEnvVarUseCase(MockEnvStore(), MockSecretCipher(), MockClock(), MockIdGenerator(), audit_sink)
+        
+        await use_case.execute(_create_request())
+        
+        assert renders == []
+        assert str(audit_sink.events[0].reason) == "Created environment variable DATABASE_URL"
+    
+    async def test_disabled_sink_skips_reason(self, monkeypatch):
+        """Test no reason is built or formatted when the audit sink is disabled"""
+        built = []
+        original_init = LazyReason.__init__
+        
+        def counting_init(self, fmt, *args):
+            built.append(fmt)
+            original_init(self, fmt, *args)
+        
+        monkeypatch.setattr(LazyReason, "__init__", counting_init)
+        use_case = CreateEnvVarUseCase(MockEnvStore(), MockSecretCipher(), MockClock(), MockIdGenerator(), NullAuditSink())
+        
+        await use_case.execute(_create_request())
+        
+        assert built == []
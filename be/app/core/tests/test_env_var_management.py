@@ -3,6 +3,7 @@ Unit tests for environment variable management use cases
 """
 import pytest
 from datetime import datetime
+from functools import partial
 
 from ..domain.env_var import EnvVar, EnvVarType, ScopeRef, ScopeLevel, EnvVarStatus
 from ..domain.env_var_version import EnvVarVersion
@@ -17,6 +18,7 @@ from ..adapters.mock_env_store import MockEnvStore
 from ..adapters.mock_secret_cipher import MockSecretCipher
 from ..adapters.mock_clock import MockClock
 from ..adapters.mock_id_generator import MockIdGenerator
+from ..adapters.null_audit_sink import NullAuditSink
 
 
 class TestCreateEnvVarUseCase:
@@ -30,9 +32,8 @@ class TestCreateEnvVarUseCase:
         clock = MockClock()
         id_generator = MockIdGenerator()
         
-        return CreateEnvVarUseCase(env_store, secret_cipher, clock, id_generator)
+        return CreateEnvVarUseCase(env_store, secret_cipher, clock, id_generator, NullAuditSink())
     
-    @pytest.mark.asyncio
     async def test_create_env_var_success(self, use_case):
         """Test successful environment variable creation"""
         request = CreateEnvVarRequest(
@@ -60,7 +61,6 @@ class TestCreateEnvVarUseCase:
         assert result.created_by == "user1"
         assert result.updated_by == "user1"
     
-    @pytest.mark.asyncio
     async def test_create_secret_env_var(self, use_case):
         """Test creating a secret environment variable"""
         request = CreateEnvVarRequest(
@@ -82,7 +82,6 @@ class TestCreateEnvVarUseCase:
         assert result.value.startswith("encrypted:")
         assert result.get_masked_value() == "***"
     
-    @pytest.mark.asyncio
     async def test_create_env_var_duplicate_key(self, use_case):
         """Test creating environment variable with duplicate key"""
         # Create first env var
@@ -113,7 +112,6 @@ class TestCreateEnvVarUseCase:
         with pytest.raises(ValueError, match="already exists"):
             await use_case.execute(request2)
     
-    @pytest.mark.asyncio
     async def test_create_env_var_invalid_key(self, use_case):
         """Test creating environment variable with invalid key"""
         request = CreateEnvVarRequest(
@@ -142,7 +140,7 @@ class TestUpdateEnvVarUseCase:
         clock = MockClock()
         id_generator = MockIdGenerator()
         
-        return UpdateEnvVarUseCase(env_store, secret_cipher, clock, id_generator)
+        return UpdateEnvVarUseCase(env_store, secret_cipher, clock, id_generator, NullAuditSink())
     
     @pytest.fixture
     async def existing_env_var(self, use_case):
@@ -161,12 +159,11 @@ class TestUpdateEnvVarUseCase:
         
         create_use_case = CreateEnvVarUseCase(
             use_case.env_store, use_case.secret_cipher, 
-            use_case.clock, use_case.id_generator
+            use_case.clock, use_case.id_generator, use_case.audit_sink
         )
         
         return await create_use_case.execute(create_request)
     
-    @pytest.mark.asyncio
     async def test_update_env_var_success(self, use_case, existing_env_var):
         """Test successful environment variable update"""
         request = UpdateEnvVarRequest(
@@ -188,7 +185,6 @@ class TestUpdateEnvVarUseCase:
         assert result.updated_by == "user2"
         assert result.updated_at > existing_env_var.updated_at
     
-    @pytest.mark.asyncio
     async def test_update_nonexistent_env_var(self, use_case):
         """Test updating non-existent environment variable"""
         request = UpdateEnvVarRequest(
@@ -214,7 +210,7 @@ class TestDeleteEnvVarUseCase:
         clock = MockClock()
         id_generator = MockIdGenerator()
         
-        return DeleteEnvVarUseCase(env_store, clock, id_generator)
+        return DeleteEnvVarUseCase(env_store, clock, id_generator, NullAuditSink())
     
     @pytest.fixture
     async def existing_env_var(self, use_case):
@@ -233,12 +229,11 @@ class TestDeleteEnvVarUseCase:
         
         create_use_case = CreateEnvVarUseCase(
             use_case.env_store, MockSecretCipher(), 
-            use_case.clock, use_case.id_generator
+            use_case.clock, use_case.id_generator, use_case.audit_sink
         )
         
         return await create_use_case.execute(create_request)
     
-    @pytest.mark.asyncio
     async def test_delete_env_var_success(self, use_case, existing_env_var):
         """Test successful environment variable deletion"""
         result = await use_case.execute(existing_env_var.id, "user2")
@@ -249,7 +244,6 @@ class TestDeleteEnvVarUseCase:
         deleted_env_var = await use_case.env_store.get_by_id(existing_env_var.id)
         assert deleted_env_var is None
     
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_env_var(self, use_case):
         """Test deleting non-existent environment variable"""
         with pytest.raises(ValueError, match="not found"):
@@ -270,50 +264,46 @@ class TestListEnvVarsUseCase:
         """Create sample environment variables"""
         # Create multiple env vars for testing
         env_vars = []
+        now = datetime.now()
+        make_env_var = partial(
+            EnvVar,
+            type=EnvVarType.STRING,
+            is_secret=False,
+            status=EnvVarStatus.ACTIVE,
+            created_by="user1",
+            created_at=now,
+            updated_by="user1",
+            updated_at=now
+        )
         
         # Global env vars
         for i in range(3):
-            env_var = EnvVar(
+            env_var = make_env_var(
                 id=f"global-{i}",
                 key=f"GLOBAL_VAR_{i}",
                 value=f"global_value_{i}",
-                type=EnvVarType.STRING,
                 scope=ScopeRef(ScopeLevel.GLOBAL, "default"),
                 tags=["global"],
-                description=f"Global variable {i}",
-                is_secret=False,
-                status=EnvVarStatus.ACTIVE,
-                created_by="user1",
-                created_at=datetime.now(),
-                updated_by="user1",
-                updated_at=datetime.now()
+                description=f"Global variable {i}"
             )
             await use_case.env_store.create(env_var)
             env_vars.append(env_var)
         
         # Project env vars
         for i in range(2):
-            env_var = EnvVar(
+            env_var = make_env_var(
                 id=f"project-{i}",
                 key=f"PROJECT_VAR_{i}",
                 value=f"project_value_{i}",
-                type=EnvVarType.STRING,
                 scope=ScopeRef(ScopeLevel.PROJECT, "project1"),
                 tags=["project"],
-                description=f"Project variable {i}",
-                is_secret=False,
-                status=EnvVarStatus.ACTIVE,
-                created_by="user1",
-                created_at=datetime.now(),
-                updated_by="user1",
-                updated_at=datetime.now()
+                description=f"Project variable {i}"
             )
             await use_case.env_store.create(env_var)
             env_vars.append(env_var)
         
         return env_vars
     
-    @pytest.mark.asyncio
     async def test_list_all_env_vars(self, use_case, sample_env_vars):
         """Test listing all environment variables"""
         request = ListEnvVarsRequest(
@@ -335,7 +325,6 @@ class TestListEnvVarsUseCase:
         assert result.page == 1
         assert result.size == 10
     
-    @pytest.mark.asyncio
     async def test_list_env_vars_with_scope_filter(self, use_case, sample_env_vars):
         """Test listing environment variables with scope filter"""
         request = ListEnvVarsRequest(
@@ -356,7 +345,6 @@ class TestListEnvVarsUseCase:
         for env_var in result.env_vars:
             assert env_var.scope.level == ScopeLevel.GLOBAL
     
-    @pytest.mark.asyncio
     async def test_list_env_vars_with_pagination(self, use_case, sample_env_vars):
         """Test listing environment variables with pagination"""
         request = ListEnvVarsRequest(
@@ -376,6 +364,24 @@ class TestListEnvVarsUseCase:
         assert result.total == 5  # Total count
         assert result.page == 1
         assert result.size == 2
+    
+    async def test_list_env_vars_with_tag_and_type_filter(self, use_case, sample_env_vars):
+        """Test listing environment variables with tag and type filters"""
+        request = ListEnvVarsRequest(
+            scope_level=None,
+            scope_ref_id=None,
+            key_filter=None,
+            tag_filter="proj",
+            type_filter=EnvVarType.STRING,
+            status_filter=None,
+            page=1,
+            size=10
+        )
+        
+        result = await use_case.execute(request)
+        
+        assert [env_var.id for env_var in result.env_vars] == ["project-0", "project-1"]
+        assert result.total == 2
 
 
 class TestDiffEnvironmentsUseCase:
@@ -390,23 +396,28 @@ class TestDiffEnvironmentsUseCase:
     @pytest.fixture
     async def sample_env_vars(self, use_case):
         """Create sample environment variables for two environments"""
+        now = datetime.now()
+        make_env_var = partial(
+            EnvVar,
+            type=EnvVarType.STRING,
+            is_secret=False,
+            status=EnvVarStatus.ACTIVE,
+            created_by="user1",
+            created_at=now,
+            updated_by="user1",
+            updated_at=now
+        )
+        
         # Environment 1 variables
         env1_vars = []
         for i in range(3):
-            env_var = EnvVar(
+            env_var = make_env_var(
                 id=f"env1-{i}",
                 key=f"ENV_VAR_{i}",
                 value=f"env1_value_{i}",
-                type=EnvVarType.STRING,
                 scope=ScopeRef(ScopeLevel.ENV, "env1"),
                 tags=["env1"],
-                description=f"Environment 1 variable {i}",
-                is_secret=False,
-                status=EnvVarStatus.ACTIVE,
-                created_by="user1",
-                created_at=datetime.now(),
-                updated_by="user1",
-                updated_at=datetime.now()
+                description=f"Environment 1 variable {i}"
             )
             await use_case.env_store.create(env_var)
             env1_vars.append(env_var)
@@ -414,27 +425,19 @@ class TestDiffEnvironmentsUseCase:
         # Environment 2 variables
         env2_vars = []
         for i in range(2):
-            env_var = EnvVar(
+            env_var = make_env_var(
                 id=f"env2-{i}",
                 key=f"ENV_VAR_{i}",
                 value=f"env2_value_{i}",
-                type=EnvVarType.STRING,
                 scope=ScopeRef(ScopeLevel.ENV, "env2"),
                 tags=["env2"],
-                description=f"Environment 2 variable {i}",
-                is_secret=False,
-                status=EnvVarStatus.ACTIVE,
-                created_by="user1",
-                created_at=datetime.now(),
-                updated_by="user1",
-                updated_at=datetime.now()
+                description=f"Environment 2 variable {i}"
             )
             await use_case.env_store.create(env_var)
             env2_vars.append(env_var)
         
         return env1_vars, env2_vars
     
-    @pytest.mark.asyncio
     async def test_diff_environments(self, use_case, sample_env_vars):
         """Test comparing two environments"""
         env1_vars, env2_vars = sample_env_vars
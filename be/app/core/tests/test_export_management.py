@@ -0,0 +1,154 @@
+"""
+Unit tests for export management use cases
+"""
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+from app.adapters.k8s_yaml_exporter import K8sYamlExporter
+
+from ..domain.audit_event import AuditAction
+from ..domain.env_var import EnvVar, EnvVarType, ScopeRef, ScopeLevel, EnvVarStatus
+from ..usecases.export_management import (
+    ExportRequest, ExportToDotEnvUseCase, _build_filters,
+    ExportToK8sSecretUseCase, ExportToConfigMapUseCase
+)
+from ..adapters.mock_env_store import MockEnvStore
+from ..adapters.mock_exporter import MockExporter
+from ..adapters.mock_clock import MockClock
+from ..adapters.mock_id_generator import MockIdGenerator
+from ..adapters.null_audit_sink import NullAuditSink
+from ..adapters.mock_audit_sink import MockAuditSink
+
+
+def _export_request(**filters) -> ExportRequest:
+    """Export request with every filter unset unless given"""
+    fields = dict(service_id=None, environment=None, scope_level=None, scope_ref_id=None)
+    fields.update(filters)
+    return ExportRequest(mode='env', exported_by="user1", **fields)
+
+
+async def _seed_env_vars(env_store, secret_keys=()):
+    """Create one env var in each of four scopes"""
+    now = datetime.now()
+    make_env_var = partial(
+        EnvVar,
+        type=EnvVarType.STRING,
+        tags=[],
+        description=None,
+        status=EnvVarStatus.ACTIVE,
+        created_by="user1",
+        created_at=now,
+        updated_by="user1",
+        updated_at=now
+    )
+    scopes = {
+        'GLOBAL_VAR': ScopeRef(ScopeLevel.GLOBAL, "default"),
+        'PROJECT_VAR': ScopeRef(ScopeLevel.PROJECT, "project1"),
+        'DEV_VAR': ScopeRef(ScopeLevel.ENV, "dev"),
+        'STAGING_VAR': ScopeRef(ScopeLevel.ENV, "staging")
+    }
+    for i, (key, scope) in enumerate(scopes.items()):
+        await env_store.create(make_env_var(id=f"var-{i}", key=key, value=f"value-{i}", scope=scope,
+                                            is_secret=key in secret_keys))
+
+
+class TestExportFilters:
+    """Test cases for which env vars an export selects"""
+    
+    @pytest.fixture
+    async def use_case(self):
+        env_store = MockEnvStore()
+        await _seed_env_vars(env_store)
+        return ExportToDotEnvUseCase(env_store, MockExporter(), MockClock(), MockIdGenerator(), NullAuditSink())
+    
+    async def _exported_keys(self, use_case, request: ExportRequest):
+        response = await use_case.execute(request)
+        return sorted(line.split('=', 1)[0] for line in response.content.splitlines())
+    
+    async def test_no_filters(self, use_case):
+        """Test an unfiltered export includes every env var"""
+        request = _export_request()
+        
+        assert _build_filters(request) == ()
+        assert await self._exported_keys(use_case, request) == ['DEV_VAR', 'GLOBAL_VAR', 'PROJECT_VAR', 'STAGING_VAR']
+    
+    async def test_scope_only(self, use_case):
+        """Test an explicit scope selects that scope"""
+        request = _export_request(scope_level='PROJECT', scope_ref_id='project1')
+        
+        assert _build_filters(request) == (('scope_level', 'PROJECT'), ('scope_ref_id', 'project1'))
+        assert await self._exported_keys(use_case, request) == ['PROJECT_VAR']
+    
+    async def test_environment_only(self, use_case):
+        """Test an environment selects its ENV scope"""
+        request = _export_request(environment='dev')
+        
+        assert _build_filters(request) == (('scope_level', 'ENV'), ('scope_ref_id', 'dev'))
+        assert await self._exported_keys(use_case, request) == ['DEV_VAR']
+    
+    async def test_scope_overrides_environment(self, use_case):
+        """Test an explicit scope wins over the scope implied by environment"""
+        request = _export_request(environment='dev', scope_level='PROJECT', scope_ref_id='project1')
+        
+        assert _build_filters(request) == (('scope_level', 'PROJECT'), ('scope_ref_id', 'project1'))
+        assert await self._exported_keys(use_case, request) == ['PROJECT_VAR']
+    
+    async def test_scope_ref_overrides_environment(self, use_case):
+        """Test scope_ref_id alone replaces only the ref implied by environment"""
+        request = _export_request(environment='dev', scope_ref_id='staging')
+        
+        assert _build_filters(request) == (('scope_level', 'ENV'), ('scope_ref_id', 'staging'))
+        assert await self._exported_keys(use_case, request) == ['STAGING_VAR']
+    
+    async def test_service_is_passed_through(self, use_case):
+        """Test service_id is kept alongside the scope filters"""
+        request = _export_request(service_id='svc1', environment='dev')
+        
+        assert _build_filters(request) == (
+            ('scope_level', 'ENV'), ('scope_ref_id', 'dev'), ('service_id', 'svc1')
+        )
+        assert await self._exported_keys(use_case, request) == ['DEV_VAR']
+
+
+class TestExportStream:
+    """Test cases for streamed exports against their buffered execute()"""
+    
+    @pytest.fixture
+    async def env_store(self):
+        env_store = MockEnvStore()
+        await _seed_env_vars(env_store, secret_keys={'PROJECT_VAR', 'STAGING_VAR'})
+        return env_store
+    
+    @pytest.fixture
+    def exporter(self, monkeypatch):
+        """Exporter that emits one chunk per entry, with a fixed header timestamp"""
+        exporter = K8sYamlExporter()
+        monkeypatch.setattr(exporter, "_get_current_timestamp", lambda: "2024-01-01T00:00:00")
+        return exporter
+    
+    @pytest.mark.parametrize("use_case_cls, export_format, media_type", [
+        (ExportToK8sSecretUseCase, 'k8s-secret', 'application/yaml'),
+        (ExportToConfigMapUseCase, 'k8s-configmap', 'application/yaml'),
+        (ExportToDotEnvUseCase, 'dotenv', 'text/plain'),
+    ])
+    async def test_stream_matches_execute(self, env_store, exporter, use_case_cls, export_format, media_type):
+        """Test the joined stream chunks equal the buffered export and each call audits once"""
+        audit_sink = MockAuditSink()
+        use_case = use_case_cls(env_store, exporter, MockClock(), MockIdGenerator(), audit_sink)
+        request = _export_request(service_id='svc1')
+        
+        export = await use_case.stream(request)
+        assert len(audit_sink.events) == 1
+        chunks = [chunk async for chunk in export.chunks]
+        response = await use_case.execute(request)
+        
+        assert len(chunks) > 1
+        assert b"".join(chunks).decode('utf-8') == response.content
+        assert export.format == response.format == export_format
+        assert export.media_type == media_type
+        assert export.count == response.count == 4
+        assert len(audit_sink.events) == 2
+        assert {event.action for event in audit_sink.events} == {AuditAction.EXPORT}
+        assert audit_sink.events[0].after_json == {'format': export_format, 'count': 4}
@@ -0,0 +1,115 @@
+"""
+Unit tests for MockEnvStore batch lookups
+"""
+from datetime import datetime
+from functools import partial
+
+import pytest
+
+from ..domain.env_var import EnvVar, EnvVarType, ScopeRef, ScopeLevel, EnvVarStatus
+from ..ports.env_store import EnvStore
+from ..usecases.env_var_management import DiffEnvironmentsUseCase
+from ..usecases.export_management import ImportFromDotEnvUseCase
+from ..adapters.mock_env_store import MockEnvStore
+from ..adapters.mock_exporter import MockExporter
+from ..adapters.mock_clock import MockClock
+from ..adapters.mock_id_generator import MockIdGenerator
+
+
+@pytest.fixture
+async def env_store():
+    """Store with two keys in ENV:dev and one in ENV:staging"""
+    env_store = MockEnvStore()
+    now = datetime.now()
+    make_env_var = partial(
+        EnvVar,
+        type=EnvVarType.STRING,
+        tags=[],
+        description=None,
+        is_secret=False,
+        status=EnvVarStatus.ACTIVE,
+        created_by="user1",
+        created_at=now,
+        updated_by="user1",
+        updated_at=now
+    )
+    await env_store.create(make_env_var(id="dev-1", key="API_URL", value="dev-api",
+                                        scope=ScopeRef(ScopeLevel.ENV, "dev")))
+    await env_store.create(make_env_var(id="dev-2", key="LOG_LEVEL", value="debug",
+                                        scope=ScopeRef(ScopeLevel.ENV, "dev")))
+    await env_store.create(make_env_var(id="staging-1", key="API_URL", value="staging-api",
+                                        scope=ScopeRef(ScopeLevel.ENV, "staging")))
+    return env_store
+
+
+class TestGetByUniqueKeys:
+    """Test cases for MockEnvStore.get_by_unique_keys"""
+    
+    async def test_mixed_hits_and_misses(self, env_store):
+        """Test only existing keys are returned, keyed by key"""
+        result = await env_store.get_by_unique_keys("ENV", "dev", ["API_URL", "MISSING", "LOG_LEVEL"])
+        
+        assert set(result) == {"API_URL", "LOG_LEVEL"}
+        assert result["API_URL"].id == "dev-1"
+        assert result["LOG_LEVEL"].id == "dev-2"
+    
+    async def test_keys_from_other_scopes_miss(self, env_store):
+        """Test a key is only found in its own scope"""
+        assert await env_store.get_by_unique_keys("ENV", "staging", ["LOG_LEVEL"]) == {}
+        assert await env_store.get_by_unique_keys("ENV", "prod", ["API_URL"]) == {}
+        assert await env_store.get_by_unique_keys("ENV", "dev", []) == {}
+    
+    async def test_matches_port_default(self, env_store):
+        """Test the override returns what the per-key EnvStore default would"""
+        keys = ["API_URL", "MISSING", "LOG_LEVEL"]
+        
+        assert (await env_store.get_by_unique_keys("ENV", "dev", keys)
+                == await EnvStore.get_by_unique_keys(env_store, "ENV", "dev", keys))
+    
+    async def test_import_counts_hits_as_updates(self, env_store):
+        """Test import treats found keys as updates and missing keys as creates"""
+        use_case = ImportFromDotEnvUseCase(env_store, MockExporter(), MockClock(), MockIdGenerator())
+        
+        result = await use_case.execute("API_URL=new\nNEW_KEY=1\nLOG_LEVEL=info\n", "user1", "ENV", "dev")
+        
+        assert result == {'created': 1, 'updated': 2, 'total': 3, 'errors': []}
+
+
+class TestListByScopes:
+    """Test cases for MockEnvStore.list_by_scopes"""
+    
+    async def test_two_scopes_one_empty(self, env_store):
+        """Test every requested scope is present, an empty one as an empty map"""
+        result = await env_store.list_by_scopes("ENV", ["dev", "prod"])
+        
+        assert set(result) == {"dev", "prod"}
+        assert {key: env_var.id for key, env_var in result["dev"].items()} == {"API_URL": "dev-1", "LOG_LEVEL": "dev-2"}
+        assert result["prod"] == {}
+    
+    async def test_repeated_scope(self, env_store):
+        """Test the same scope requested twice is looked up once"""
+        result = await env_store.list_by_scopes("ENV", ["staging", "staging"])
+        
+        assert list(result) == ["staging"]
+        assert set(result["staging"]) == {"API_URL"}
+    
+    async def test_matches_list_by_scope(self, env_store):
+        """Test each entry is what list_by_scope returns for that scope"""
+        result = await env_store.list_by_scopes("ENV", ["dev", "staging", "prod"])
+        
+        for ref_id, scope_vars in result.items():
+            assert scope_vars == await env_store.list_by_scope("ENV", ref_id)
+    
+    async def test_diff_against_empty_environment(self, env_store):
+        """Test diff reports every key as missing from an empty environment"""
+        result = await DiffEnvironmentsUseCase(env_store).execute("dev", "prod")
+        
+        assert sorted(env_var['key'] for env_var in result['missing_in_env2']) == ["API_URL", "LOG_LEVEL"]
+        assert result['missing_in_env1'] == []
+        assert result['different_values'] == []
+    
+    async def test_diff_same_environment(self, env_store):
+        """Test diffing an environment with itself finds no differences"""
+        result = await DiffEnvironmentsUseCase(env_store).execute("dev", "dev")
+        
+        assert result['missing_in_env1'] == result['missing_in_env2'] == result['different_values'] == []
@@ -0,0 +1,184 @@
+"""
+Unit tests for release management use cases
+"""
+import asyncio
+
+import pytest
+
+from ..domain.release import ReleaseStatus
+from ..domain.audit_event import AuditAction
+from ..usecases.release_management import (
+    CreateReleaseUseCase, CreateReleaseRequest,
+    ApproveReleaseUseCase, ApproveReleaseRequest,
+    ApplyReleaseUseCase, ApplyReleaseRequest
+)
+from ..adapters.mock_env_store import MockEnvStore
+from ..adapters.mock_clock import MockClock
+from ..adapters.mock_id_generator import MockIdGenerator
+
+
+def _changes(count: int):
+    """Release changes updating VAR_0..VAR_<count-1>"""
+    return [{'action': 'UPDATE', 'env_var_id': f'VAR_{i}'} for i in range(count)]
+
+
+async def _create_release(env_store, environment: str = "dev", changes=None):
+    """Create a release through the use case"""
+    use_case = CreateReleaseUseCase(env_store, MockClock(), MockIdGenerator())
+    return await use_case.execute(CreateReleaseRequest(
+        service_id="service1",
+        environment=environment,
+        title="Release 1",
+        description=None,
+        changes=changes or _changes(1),
+        created_by="user1"
+    ))
+
+
+class RecordingApplyReleaseUseCase(ApplyReleaseUseCase):
+    """ApplyReleaseUseCase whose changes record their concurrency and can fail"""
+    
+    def __init__(self, *args, failing=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failing = set(failing)
+        self.applied = []
+        self.active = 0
+        self.max_active = 0
+    
+    async def _apply_change(self, change, applied_by):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            # Yield so every change that may run concurrently gets to start
+            await asyncio.sleep(0)
+            if change['env_var_id'] in self.failing:
+                raise RuntimeError("boom")
+            self.applied.append(change['env_var_id'])
+        finally:
+            self.active -= 1
+
+
+class TestCreateReleaseUseCase:
+    """Test cases for CreateReleaseUseCase"""
+    
+    @pytest.mark.parametrize("environment", ["prod", "PROD", "production", "Production"])
+    async def test_production_release_requires_approval(self, environment):
+        """Test production releases wait for approval whatever the casing"""
+        release = await _create_release(MockEnvStore(), environment=environment)
+        
+        assert release.status == ReleaseStatus.PENDING_APPROVAL
+    
+    @pytest.mark.parametrize("environment", ["dev", "staging", "preprod"])
+    async def test_other_release_is_approved(self, environment):
+        """Test non-production releases are approved on creation"""
+        release = await _create_release(MockEnvStore(), environment=environment)
+        
+        assert release.status == ReleaseStatus.APPROVED
+
+
+class TestApproveReleaseUseCase:
+    """Test cases for ApproveReleaseUseCase"""
+    
+    @pytest.fixture
+    def env_store(self):
+        return MockEnvStore()
+    
+    @pytest.fixture
+    def use_case(self, env_store):
+        return ApproveReleaseUseCase(env_store, MockClock(), MockIdGenerator())
+    
+    def _request(self, release_id: str) -> ApproveReleaseRequest:
+        return ApproveReleaseRequest(release_id=release_id, approver_id="approver1", comment="LGTM")
+    
+    async def test_approve_release_success(self, env_store, use_case):
+        """Test approving a pending release"""
+        release = await _create_release(env_store, environment="prod")
+        
+        approval = await use_case.execute(self._request(release.id))
+        
+        assert approval.release_id == release.id
+        assert (await env_store.get_release_by_id(release.id)).status == ReleaseStatus.APPROVED
+        assert await env_store.get_approvals_for_release(release.id) == [approval]
+        assert env_store.audit_events[-1].action == AuditAction.APPROVE
+    
+    async def test_approve_release_twice(self, env_store, use_case):
+        """Test a second approval is rejected and records nothing"""
+        release = await _create_release(env_store, environment="prod")
+        await use_case.execute(self._request(release.id))
+        audit_count = len(env_store.audit_events)
+        
+        with pytest.raises(ValueError, match="cannot be approved in current status"):
+            await use_case.execute(self._request(release.id))
+        assert len(await env_store.get_approvals_for_release(release.id)) == 1
+        assert len(env_store.audit_events) == audit_count
+    
+    async def test_approve_nonexistent_release(self, use_case):
+        """Test approving a release that does not exist"""
+        with pytest.raises(ValueError, match="not found"):
+            await use_case.execute(self._request("missing"))
+
+
+class TestApplyReleaseUseCase:
+    """Test cases for ApplyReleaseUseCase"""
+    
+    @pytest.fixture
+    def env_store(self):
+        return MockEnvStore()
+    
+    async def test_apply_release_success(self, env_store):
+        """Test applying an approved release applies every change"""
+        release = await _create_release(env_store, changes=_changes(3))
+        use_case = RecordingApplyReleaseUseCase(env_store, MockClock(), MockIdGenerator())
+        
+        result = await use_case.execute(ApplyReleaseRequest(release_id=release.id, applied_by="user2"))
+        
+        assert result.status == ReleaseStatus.APPLIED
+        assert result.applied_by == "user2"
+        assert sorted(use_case.applied) == ['VAR_0', 'VAR_1', 'VAR_2']
+        event = env_store.audit_events[-1]
+        assert event.action == AuditAction.APPLY
+        assert event.after_json == {'status': 'APPLIED', 'errors': []}
+        assert str(event.reason) == "Applied release Release 1"
+    
+    async def test_apply_release_collects_failed_change(self, env_store):
+        """Test a failing change is recorded without stopping the others"""
+        release = await _create_release(env_store, changes=_changes(5))
+        use_case = RecordingApplyReleaseUseCase(env_store, MockClock(), MockIdGenerator(), failing={'VAR_2'})
+        
+        result = await use_case.execute(ApplyReleaseRequest(release_id=release.id, applied_by="user2"))
+        
+        assert result.status == ReleaseStatus.APPLIED
+        assert sorted(use_case.applied) == ['VAR_0', 'VAR_1', 'VAR_3', 'VAR_4']
+        event = env_store.audit_events[-1]
+        assert event.after_json['errors'] == ["Error applying UPDATE VAR_2: boom"]
+        assert str(event.reason) == "Applied release Release 1 with 1 failed change(s)"
+    
+    async def test_apply_release_bounds_concurrency(self, env_store):
+        """Test no more than max_concurrency changes run at once"""
+        release = await _create_release(env_store, changes=_changes(10))
+        use_case = RecordingApplyReleaseUseCase(env_store, MockClock(), MockIdGenerator(), max_concurrency=3)
+        
+        await use_case.execute(ApplyReleaseRequest(release_id=release.id, applied_by="user2"))
+        
+        assert len(use_case.applied) == 10
+        assert use_case.max_active == 3
+    
+    async def test_apply_unapproved_release(self, env_store):
+        """Test a release pending approval cannot be applied"""
+        release = await _create_release(env_store, environment="prod")
+        use_case = RecordingApplyReleaseUseCase(env_store, MockClock(), MockIdGenerator())
+        
+        with pytest.raises(ValueError, match="cannot be applied in current status"):
+            await use_case.execute(ApplyReleaseRequest(release_id=release.id, applied_by="user2"))
+        assert use_case.applied == []
+        assert (await env_store.get_release_by_id(release.id)).status == ReleaseStatus.PENDING_APPROVAL
+    
+    async def test_apply_release_twice(self, env_store):
+        """Test an applied release cannot be applied again"""
+        release = await _create_release(env_store)
+        use_case = RecordingApplyReleaseUseCase(env_store, MockClock(), MockIdGenerator())
+        await use_case.execute(ApplyReleaseRequest(release_id=release.id, applied_by="user2"))
+        
+        with pytest.raises(ValueError, match="cannot be applied in current status"):
+            await use_case.execute(ApplyReleaseRequest(release_id=release.id, applied_by="user2"))
+        assert use_case.applied == ['VAR_0']
@@ -0,0 +1,177 @@
+"""
+Unit tests for secret management use cases
+"""
+import asyncio
+
+import pytest
+
+from ..domain.env_var import EnvVarType, ScopeRef, ScopeLevel
+from ..usecases import secret_management
+from ..usecases.env_var_management import CreateEnvVarUseCase, CreateEnvVarRequest
+from ..usecases.secret_management import (
+    MAX_REVEAL_TTL_SECONDS, SecretCache,
+    RevealSecretUseCase, RevealSecretRequest,
+    RotateSecretUseCase
+)
+from ..adapters.mock_env_store import MockEnvStore
+from ..adapters.mock_secret_cipher import MockSecretCipher
+from ..adapters.mock_clock import MockClock
+from ..adapters.mock_id_generator import MockIdGenerator
+from ..adapters.null_audit_sink import NullAuditSink
+
+
+class CountingCipher(MockSecretCipher):
+    """MockSecretCipher that counts decrypts and can hold them until released"""
+    
+    def __init__(self):
+        super().__init__()
+        self.decrypts = 0
+        self.release = asyncio.Event()
+        self.release.set()
+    
+    async def decrypt(self, ciphertext: str) -> str:
+        self.decrypts += 1
+        await self.release.wait()
+        return await super().decrypt(ciphertext)
+
+
+class FakeTime:
+    """Stand-in for the time module with a settable monotonic clock"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self) -> float:
+        return self.now
+
+
+class TestSecretCache:
+    """Test cases for revealing secrets through SecretCache"""
+    
+    @pytest.fixture
+    def env_store(self):
+        return MockEnvStore()
+    
+    @pytest.fixture
+    def cipher(self):
+        return CountingCipher()
+    
+    @pytest.fixture
+    def secret_cache(self):
+        return SecretCache()
+    
+    @pytest.fixture
+    def reveal(self, env_store, cipher, secret_cache):
+        """Reveal use case sharing the cache"""
+        return RevealSecretUseCase(env_store, cipher, MockClock(), MockIdGenerator(), secret_cache)
+    
+    @pytest.fixture
+    async def secret(self, env_store, cipher):
+        """Create a secret env var"""
+        create = CreateEnvVarUseCase(env_store, cipher, MockClock(), MockIdGenerator(), NullAuditSink())
+        return await create.execute(CreateEnvVarRequest(
+            key="DB_PASSWORD",
+            value="old-password",
+            type=EnvVarType.SECRET,
+            scope=ScopeRef(ScopeLevel.ENV, "dev"),
+            tags=[],
+            description=None,
+            is_secret=True,
+            created_by="user1"
+        ))
+    
+    def _request(self, env_var_id: str) -> RevealSecretRequest:
+        return RevealSecretRequest(env_var_id=env_var_id, justification="debugging", requested_by="user1")
+    
+    async def test_reveal_twice_decrypts_once(self, reveal, secret, cipher):
+        """Test a second reveal is served from the cache"""
+        first = await reveal.execute(self._request(secret.id))
+        second = await reveal.execute(self._request(secret.id))
+        
+        assert first.value == second.value == "old-password"
+        assert cipher.decrypts == 1
+    
+    async def test_rotate_then_reveal_returns_new_value(self, reveal, secret, env_store, cipher, secret_cache):
+        """Test rotation drops the cached plaintext of the old value"""
+        await reveal.execute(self._request(secret.id))
+        
+        rotate = RotateSecretUseCase(env_store, cipher, MockClock(), MockIdGenerator(), secret_cache)
+        await rotate.execute(secret.id, "new-password", "user2")
+        result = await reveal.execute(self._request(secret.id))
+        
+        assert result.value == "new-password"
+        assert cipher.decrypts == 2
+    
+    async def test_concurrent_reveals_decrypt_once(self, reveal, secret, cipher):
+        """Test concurrent reveals of one secret share a single decrypt"""
+        cipher.release.clear()
+        tasks = [asyncio.create_task(reveal.execute(self._request(secret.id))) for _ in range(5)]
+        for _ in range(3):
+            await asyncio.sleep(0)
+        cipher.release.set()
+        results = await asyncio.gather(*tasks)
+        
+        assert {result.value for result in results} == {"old-password"}
+        assert cipher.decrypts == 1
+    
+    async def test_entry_expires_after_ttl(self, reveal, secret, cipher, monkeypatch):
+        """Test a cached plaintext is not served past the cache TTL"""
+        fake_time = FakeTime()
+        monkeypatch.setattr(secret_management, "time", fake_time)
+        
+        await reveal.execute(self._request(secret.id))
+        fake_time.now += 29
+        await reveal.execute(self._request(secret.id))
+        assert cipher.decrypts == 1
+        
+        # Entries live for the reveal's ttl_seconds (30 by default)
+        fake_time.now += 2
+        await reveal.execute(self._request(secret.id))
+        assert cipher.decrypts == 2
+
+
+class TestRevealSecretTtl:
+    """Test cases for the reveal TTL bounds"""
+    
+    @pytest.fixture
+    def env_store(self):
+        return MockEnvStore()
+    
+    @pytest.fixture
+    def reveal(self, env_store):
+        return RevealSecretUseCase(env_store, MockSecretCipher(), MockClock(), MockIdGenerator())
+    
+    @pytest.fixture
+    async def secret(self, env_store):
+        """Create a secret env var"""
+        create = CreateEnvVarUseCase(env_store, MockSecretCipher(), MockClock(), MockIdGenerator(), NullAuditSink())
+        return await create.execute(CreateEnvVarRequest(
+            key="API_TOKEN",
+            value="token",
+            type=EnvVarType.SECRET,
+            scope=ScopeRef(ScopeLevel.ENV, "dev"),
+            tags=[],
+            description=None,
+            is_secret=True,
+            created_by="user1"
+        ))
+    
+    @pytest.mark.parametrize("ttl_seconds", [0, MAX_REVEAL_TTL_SECONDS + 1, 3600])
+    async def test_reveal_rejects_ttl_out_of_range(self, reveal, secret, env_store, ttl_seconds):
+        """Test a reveal TTL outside 1..MAX_REVEAL_TTL_SECONDS is rejected before decrypting"""
+        request = RevealSecretRequest(env_var_id=secret.id, justification="debugging",
+                                      requested_by="user1", ttl_seconds=ttl_seconds)
+        
+        with pytest.raises(ValueError, match="ttl_seconds must be between 1 and 300"):
+            await reveal.execute(request)
+        assert env_store.audit_events == []
+    
+    async def test_reveal_accepts_max_ttl(self, reveal, secret):
+        """Test the maximum TTL itself is allowed"""
+        request = RevealSecretRequest(env_var_id=secret.id, justification="debugging",
+                                      requested_by="user1", ttl_seconds=MAX_REVEAL_TTL_SECONDS)
+        
+        result = await reveal.execute(request)
+        
+        assert result.value == "token"
+        assert result.ttl_seconds == 300
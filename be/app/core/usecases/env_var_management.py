@@ -7,14 +7,15 @@ from dataclasses import dataclass
 
 from ..domain.env_var import EnvVar, EnvVarType, ScopeRef, ScopeLevel, EnvVarStatus
 from ..domain.env_var_version import EnvVarVersion
-from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType
+from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType, LazyReason
 from ..ports.env_store import EnvStore
+from ..ports.audit_sink import AuditSink
 from ..ports.secret_cipher import SecretCipher
 from ..ports.clock import Clock
 from ..ports.id_generator import IdGenerator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateEnvVarRequest:
     """Request to create environment variable"""
     key: str
@@ -27,7 +28,7 @@ class CreateEnvVarRequest:
     created_by: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateEnvVarRequest:
     """Request to update environment variable"""
     env_var_id: str
@@ -38,7 +39,7 @@ class UpdateEnvVarRequest:
     updated_by: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListEnvVarsRequest:
     """Request to list environment variables"""
     scope_level: Optional[ScopeLevel]
@@ -51,7 +52,7 @@ class ListEnvVarsRequest:
     size: int = 50
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListEnvVarsResponse:
     """Response for listing environment variables"""
     env_vars: List[EnvVar]
@@ -64,23 +65,15 @@ class CreateEnvVarUseCase:
     """Use case for creating environment variables"""
     
     def __init__(self, env_store: EnvStore, secret_cipher: SecretCipher, 
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator, audit_sink: AuditSink):
         self.env_store = env_store
         self.secret_cipher = secret_cipher
         self.clock = clock
         self.id_generator = id_generator
+        self.audit_sink = audit_sink
     
     async def execute(self, request: CreateEnvVarRequest) -> EnvVar:
         """Create a new environment variable"""
-        # Check if key already exists in scope
-        existing = await self.env_store.get_by_unique_key(
-            request.scope.level.value, 
-            request.scope.ref_id, 
-            request.key
-        )
-        if existing:
-            raise ValueError(f"Environment variable {request.key} already exists in scope {request.scope}")
-        
         # Encrypt value if it's a secret
         encrypted_value = request.value
         if request.is_secret:
@@ -104,22 +97,26 @@ class CreateEnvVarUseCase:
             updated_at=now
         )
         
-        # Save to store
-        await self.env_store.create(env_var)
+        # Save to store; the existence check is fused into the insert so a
+        # concurrent create of the same key cannot slip in between
+        created = await self.env_store.create_if_absent(env_var)
+        if created is None:
+            raise ValueError(f"Environment variable {request.key} already exists in scope {request.scope}")
         
         # Create audit event
-        audit_event = AuditEvent(
-            id=self.id_generator.generate(),
-            actor=request.created_by,
-            action=AuditAction.CREATE,
-            target_type=AuditTargetType.ENV_VAR,
-            target_id=env_var.id,
-            before_json=None,
-            after_json=env_var.to_dict(),
-            reason=f"Created environment variable {request.key}",
-            timestamp=now
-        )
-        await self.env_store.create_audit_event(audit_event)
+        if self.audit_sink.enabled:
+            audit_event = AuditEvent(
+                id=self.id_generator.generate(),
+                actor=request.created_by,
+                action=AuditAction.CREATE,
+                target_type=AuditTargetType.ENV_VAR,
+                target_id=env_var.id,
+                before_json=None,
+                after_json=env_var.to_dict(),
+                reason=LazyReason("Created environment variable %s", request.key),
+                timestamp=now
+            )
+            await self.audit_sink.create_audit_event(audit_event)
         
         return env_var
 
@@ -128,11 +125,12 @@ class UpdateEnvVarUseCase:
     """Use case for updating environment variables"""
     
     def __init__(self, env_store: EnvStore, secret_cipher: SecretCipher,
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator, audit_sink: AuditSink):
         self.env_store = env_store
         self.secret_cipher = secret_cipher
         self.clock = clock
         self.id_generator = id_generator
+        self.audit_sink = audit_sink
     
     async def execute(self, request: UpdateEnvVarRequest) -> EnvVar:
         """Update an environment variable"""
@@ -141,14 +139,21 @@ class UpdateEnvVarUseCase:
         if not existing:
             raise ValueError(f"Environment variable {request.env_var_id} not found")
         
-        # Create version before update
-        before_dict = existing.to_dict()
+        now = self.clock.now()
+        
+        # Encrypt new secret values
+        new_value = existing.value
+        if request.value is not None:
+            new_value = request.value
+            if existing.is_secret:
+                new_value = await self.secret_cipher.encrypt(request.value)
+        next_version = await self.env_store.get_next_version(existing.id)
         
         # Update fields
         updated_env_var = EnvVar(
             id=existing.id,
             key=existing.key,
-            value=request.value if request.value is not None else existing.value,
+            value=new_value,
             type=request.type if request.type is not None else existing.type,
             scope=existing.scope,
             tags=request.tags if request.tags is not None else existing.tags,
@@ -158,21 +163,14 @@ class UpdateEnvVarUseCase:
             created_by=existing.created_by,
             created_at=existing.created_at,
             updated_by=request.updated_by,
-            updated_at=self.clock.now()
+            updated_at=now
         )
         
-        # Encrypt value if it's a secret and value changed
-        if updated_env_var.is_secret and request.value is not None:
-            updated_env_var.value = await self.secret_cipher.encrypt(request.value)
-        
-        # Save updated environment variable
-        await self.env_store.update(updated_env_var)
-        
         # Create version record
         version = EnvVarVersion(
             id=self.id_generator.generate(),
             env_var_id=updated_env_var.id,
-            version=await self.env_store.get_next_version(updated_env_var.id),
+            version=next_version,
             diff_json={
                 'value': {'old': existing.value, 'new': updated_env_var.value},
                 'type': {'old': existing.type.value, 'new': updated_env_var.type.value},
@@ -181,23 +179,28 @@ class UpdateEnvVarUseCase:
             },
             checksum="",  # Will be computed in __post_init__
             author=request.updated_by,
-            created_at=self.clock.now()
+            created_at=now
         )
-        await self.env_store.create_version(version)
         
         # Create audit event
-        audit_event = AuditEvent(
-            id=self.id_generator.generate(),
-            actor=request.updated_by,
-            action=AuditAction.UPDATE,
-            target_type=AuditTargetType.ENV_VAR,
-            target_id=updated_env_var.id,
-            before_json=before_dict,
-            after_json=updated_env_var.to_dict(),
-            reason=f"Updated environment variable {updated_env_var.key}",
-            timestamp=self.clock.now()
-        )
-        await self.env_store.create_audit_event(audit_event)
+        audit_event = None
+        if self.audit_sink.enabled:
+            audit_event = AuditEvent(
+                id=self.id_generator.generate(),
+                actor=request.updated_by,
+                action=AuditAction.UPDATE,
+                target_type=AuditTargetType.ENV_VAR,
+                target_id=updated_env_var.id,
+                before_json=existing.to_dict(),
+                after_json=updated_env_var.to_dict(),
+                reason=LazyReason("Updated environment variable %s", updated_env_var.key),
+                timestamp=now
+            )
+        
+        # Persist the update and its version together, then record the audit event
+        await self.env_store.update_with_version_tx(updated_env_var, version)
+        if audit_event:
+            await self.audit_sink.create_audit_event(audit_event)
         
         return updated_env_var
 
@@ -205,10 +208,12 @@ class UpdateEnvVarUseCase:
 class DeleteEnvVarUseCase:
     """Use case for deleting environment variables"""
     
-    def __init__(self, env_store: EnvStore, clock: Clock, id_generator: IdGenerator):
+    def __init__(self, env_store: EnvStore, clock: Clock, id_generator: IdGenerator,
+                 audit_sink: AuditSink):
         self.env_store = env_store
         self.clock = clock
         self.id_generator = id_generator
+        self.audit_sink = audit_sink
     
     async def execute(self, env_var_id: str, deleted_by: str) -> bool:
         """Delete an environment variable"""
@@ -221,22 +226,25 @@ class DeleteEnvVarUseCase:
         if existing.is_restricted_environment():
             raise ValueError(f"Cannot delete environment variable in restricted environment {existing.scope}")
         
-        # Create audit event before deletion
-        audit_event = AuditEvent(
-            id=self.id_generator.generate(),
-            actor=deleted_by,
-            action=AuditAction.DELETE,
-            target_type=AuditTargetType.ENV_VAR,
-            target_id=env_var_id,
-            before_json=existing.to_dict(),
-            after_json=None,
-            reason=f"Deleted environment variable {existing.key}",
-            timestamp=self.clock.now()
-        )
-        await self.env_store.create_audit_event(audit_event)
+        # Create audit event for deletion
+        audit_event = None
+        if self.audit_sink.enabled:
+            audit_event = AuditEvent(
+                id=self.id_generator.generate(),
+                actor=deleted_by,
+                action=AuditAction.DELETE,
+                target_type=AuditTargetType.ENV_VAR,
+                target_id=env_var_id,
+                before_json=existing.to_dict(),
+                after_json=None,
+                reason=LazyReason("Deleted environment variable %s", existing.key),
+                timestamp=self.clock.now()
+            )
         
-        # Delete from store
+        # Delete from store, then record the audit event
         await self.env_store.delete(env_var_id)
+        if audit_event:
+            await self.audit_sink.create_audit_event(audit_event)
         
         return True
 
@@ -290,13 +298,9 @@ class DiffEnvironmentsUseCase:
     
     async def execute(self, env1: str, env2: str) -> Dict[str, Any]:
         """Compare two environments and return differences"""
-        # Get all environment variables for both environments
-        env1_vars = await self.env_store.list({'scope_level': 'ENV', 'scope_ref_id': env1})
-        env2_vars = await self.env_store.list({'scope_level': 'ENV', 'scope_ref_id': env2})
-        
-        # Create key-value maps
-        env1_map = {var.key: var for var in env1_vars}
-        env2_map = {var.key: var for var in env2_vars}
+        # Get key -> env var maps for both environments in one store call
+        scopes = await self.env_store.list_by_scopes(ScopeLevel.ENV.value, [env1, env2])
+        env1_map, env2_map = scopes[env1], scopes[env2]
         
         # Find differences
         all_keys = set(env1_map.keys()) | set(env2_map.keys())
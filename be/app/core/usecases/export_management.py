@@ -1,19 +1,24 @@
 """
 Use cases for export management
 """
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Callable
 from dataclasses import dataclass
+import functools
+import itertools
+import time
 
 from ..domain.env_var import EnvVar
-from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType
+from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType, LazyReason
 from ..ports.env_store import EnvStore
+from ..ports.audit_sink import AuditSink
 from ..ports.exporter import Exporter
 from ..ports.clock import Clock
 from ..ports.id_generator import IdGenerator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExportRequest:
     """Request to export environment variables"""
     mode: str  # 'k8s', 'env', 'json', 'yaml'
@@ -24,7 +29,7 @@ class ExportRequest:
     exported_by: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExportResponse:
     """Response for export request"""
     content: str
@@ -33,54 +38,172 @@ class ExportResponse:
     count: int
 
 
+@dataclass
+class ExportStream:
+    """Streamed export: content chunks plus metadata known before streaming starts"""
+    chunks: AsyncIterator[bytes]
+    format: str
+    media_type: str
+    count: int
+    exported_at: datetime
+
+
+FilterKey = Tuple[Tuple[str, str], ...]
+
+# Which request fields are set: (service_id, environment, scope_level, scope_ref_id)
+FilterShape = Tuple[bool, bool, bool, bool]
+
+# (filter name, request attribute to read, constant used when attribute is None)
+FilterPlan = Tuple[Tuple[str, Optional[str], Optional[str]], ...]
+
+
+def _plan_filters(shape: FilterShape) -> FilterPlan:
+    """Resolve where each EnvStore.list filter comes from for one request shape
+    
+    An explicit scope_level/scope_ref_id overrides the ENV scope implied by
+    environment. The plan is sorted by filter name so builders emit FilterKeys
+    directly.
+    """
+    has_service, has_env, has_level, has_ref = shape
+    plan = {}
+    if has_service:
+        plan['service_id'] = ('service_id', None)
+    if has_env:
+        plan['scope_level'] = (None, 'ENV')
+        plan['scope_ref_id'] = ('environment', None)
+    if has_level:
+        plan['scope_level'] = ('scope_level', None)
+    if has_ref:
+        plan['scope_ref_id'] = ('scope_ref_id', None)
+    return tuple((name, attr, value) for name, (attr, value) in sorted(plan.items()))
+
+
+def _apply_filter_plan(plan: FilterPlan, request: ExportRequest) -> FilterKey:
+    """Read the planned fields off a request"""
+    return tuple((name, getattr(request, attr) if attr else value) for name, attr, value in plan)
+
+
+# One pre-planned builder per request shape; filter precedence lives only in _plan_filters
+_FILTER_BUILDERS: Dict[FilterShape, Callable[[ExportRequest], FilterKey]] = {
+    shape: functools.partial(_apply_filter_plan, _plan_filters(shape))
+    for shape in itertools.product((False, True), repeat=4)
+}
+
+
+def _build_filters(request: ExportRequest) -> FilterKey:
+    """Build EnvStore.list filters for an export request as a hashable key"""
+    shape = (bool(request.service_id), bool(request.environment),
+             bool(request.scope_level), bool(request.scope_ref_id))
+    return _FILTER_BUILDERS[shape](request)
+
+
+class FilteredEnvVarCache:
+    """Short-lived in-process cache of EnvStore.list results keyed by filters
+    
+    Entries expire after ttl_seconds and are ignored as soon as the store's
+    write_version moves past the version they were read at. One cache should
+    front a single backing store.
+    """
+    
+    def __init__(self, ttl_seconds: float = 5.0, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[FilterKey, Tuple[float, int, List[EnvVar]]]' = OrderedDict()
+    
+    async def list(self, env_store: EnvStore, filters: FilterKey) -> List[EnvVar]:
+        """Get env vars matching filters, reading through to the store on a miss"""
+        now = time.monotonic()
+        version = env_store.write_version
+        entry = self._entries.get(filters)
+        if entry is not None and entry[0] > now and entry[1] == version:
+            self._entries.move_to_end(filters)
+            return entry[2]
+        
+        env_vars = await env_store.list(dict(filters))
+        self._entries[filters] = (now + self.ttl_seconds, version, env_vars)
+        self._entries.move_to_end(filters)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return env_vars
+    
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+
+
+# Audit fields shared by every export; use cases splat this into AuditEvent
+# and only fill in the per-call fields
+_EXPORT_AUDIT_TEMPLATE: Dict[str, Any] = {
+    'action': AuditAction.EXPORT,
+    'target_type': AuditTargetType.ENV_VAR,
+    'before_json': None
+}
+
+
+async def _list_env_vars(env_store: EnvStore, cache: Optional[FilteredEnvVarCache],
+                         filters: FilterKey) -> List[EnvVar]:
+    """List env vars for an export, through the cache when one is configured"""
+    if cache is None:
+        return await env_store.list(dict(filters))
+    return await cache.list(env_store, filters)
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> str:
+    """Join a streamed export back into a single string"""
+    return b"".join([chunk async for chunk in chunks]).decode('utf-8')
+
+
 class ExportToK8sSecretUseCase:
     """Use case for exporting to Kubernetes Secret"""
     
     def __init__(self, env_store: EnvStore, exporter: Exporter, 
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator, audit_sink: AuditSink,
+                 cache: Optional[FilteredEnvVarCache] = None):
         self.env_store = env_store
         self.exporter = exporter
         self.clock = clock
         self.id_generator = id_generator
+        self.audit_sink = audit_sink
+        self.cache = cache
     
     async def execute(self, request: ExportRequest) -> ExportResponse:
         """Export environment variables to Kubernetes Secret YAML"""
-        # Get environment variables based on filters
-        filters = {}
-        if request.service_id:
-            filters['service_id'] = request.service_id
-        if request.environment:
-            filters['scope_level'] = 'ENV'
-            filters['scope_ref_id'] = request.environment
-        if request.scope_level:
-            filters['scope_level'] = request.scope_level
-        if request.scope_ref_id:
-            filters['scope_ref_id'] = request.scope_ref_id
-        
-        env_vars = await self.env_store.list(filters)
-        
-        # Export to Kubernetes Secret format
-        content = await self.exporter.export_to_k8s_secret(env_vars, request.service_id or 'default')
+        export = await self.stream(request)
         
-        # Create audit event
-        audit_event = AuditEvent(
-            id=self.id_generator.generate(),
-            actor=request.exported_by,
-            action=AuditAction.EXPORT,
-            target_type=AuditTargetType.ENV_VAR,
-            target_id=f"k8s-secret-{request.service_id or 'default'}",
-            before_json=None,
-            after_json={'format': 'k8s-secret', 'count': len(env_vars)},
-            reason=f"Exported {len(env_vars)} environment variables to Kubernetes Secret",
-            timestamp=self.clock.now()
+        return ExportResponse(
+            content=await _collect(export.chunks),
+            format=export.format,
+            exported_at=export.exported_at,
+            count=export.count
         )
-        await self.env_store.create_audit_event(audit_event)
+    
+    async def stream(self, request: ExportRequest) -> ExportStream:
+        """Export environment variables to Kubernetes Secret YAML as a stream of chunks"""
+        now = self.clock.now()
         
-        return ExportResponse(
-            content=content,
+        # Get environment variables based on filters
+        env_vars = await _list_env_vars(self.env_store, self.cache, _build_filters(request))
+        
+        # Create audit event; exports are audited when issued, before any content is sent
+        if self.audit_sink.enabled:
+            audit_event = AuditEvent(
+                **_EXPORT_AUDIT_TEMPLATE,
+                id=self.id_generator.generate(),
+                actor=request.exported_by,
+                target_id=f"k8s-secret-{request.service_id or 'default'}",
+                after_json={'format': 'k8s-secret', 'count': len(env_vars)},
+                reason=LazyReason("Exported %d environment variables to %s", len(env_vars), "Kubernetes Secret"),
+                timestamp=now
+            )
+            await self.audit_sink.create_audit_event(audit_event)
+        
+        # Export to Kubernetes Secret format
+        return ExportStream(
+            chunks=self.exporter.stream_to_k8s_secret(env_vars, request.service_id or 'default'),
             format='k8s-secret',
-            exported_at=self.clock.now(),
-            count=len(env_vars)
+            media_type='application/yaml',
+            count=len(env_vars),
+            exported_at=now
         )
 
 
@@ -88,50 +211,53 @@ class ExportToConfigMapUseCase:
     """Use case for exporting to Kubernetes ConfigMap"""
     
     def __init__(self, env_store: EnvStore, exporter: Exporter,
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator, audit_sink: AuditSink,
+                 cache: Optional[FilteredEnvVarCache] = None):
         self.env_store = env_store
         self.exporter = exporter
         self.clock = clock
         self.id_generator = id_generator
+        self.audit_sink = audit_sink
+        self.cache = cache
     
     async def execute(self, request: ExportRequest) -> ExportResponse:
         """Export environment variables to Kubernetes ConfigMap YAML"""
-        # Get environment variables based on filters
-        filters = {}
-        if request.service_id:
-            filters['service_id'] = request.service_id
-        if request.environment:
-            filters['scope_level'] = 'ENV'
-            filters['scope_ref_id'] = request.environment
-        if request.scope_level:
-            filters['scope_level'] = request.scope_level
-        if request.scope_ref_id:
-            filters['scope_ref_id'] = request.scope_ref_id
-        
-        env_vars = await self.env_store.list(filters)
-        
-        # Export to Kubernetes ConfigMap format
-        content = await self.exporter.export_to_k8s_configmap(env_vars, request.service_id or 'default')
+        export = await self.stream(request)
         
-        # Create audit event
-        audit_event = AuditEvent(
-            id=self.id_generator.generate(),
-            actor=request.exported_by,
-            action=AuditAction.EXPORT,
-            target_type=AuditTargetType.ENV_VAR,
-            target_id=f"k8s-configmap-{request.service_id or 'default'}",
-            before_json=None,
-            after_json={'format': 'k8s-configmap', 'count': len(env_vars)},
-            reason=f"Exported {len(env_vars)} environment variables to Kubernetes ConfigMap",
-            timestamp=self.clock.now()
+        return ExportResponse(
+            content=await _collect(export.chunks),
+            format=export.format,
+            exported_at=export.exported_at,
+            count=export.count
         )
-        await self.env_store.create_audit_event(audit_event)
+    
+    async def stream(self, request: ExportRequest) -> ExportStream:
+        """Export environment variables to Kubernetes ConfigMap YAML as a stream of chunks"""
+        now = self.clock.now()
         
-        return ExportResponse(
-            content=content,
+        # Get environment variables based on filters
+        env_vars = await _list_env_vars(self.env_store, self.cache, _build_filters(request))
+        
+        # Create audit event; exports are audited when issued, before any content is sent
+        if self.audit_sink.enabled:
+            audit_event = AuditEvent(
+                **_EXPORT_AUDIT_TEMPLATE,
+                id=self.id_generator.generate(),
+                actor=request.exported_by,
+                target_id=f"k8s-configmap-{request.service_id or 'default'}",
+                after_json={'format': 'k8s-configmap', 'count': len(env_vars)},
+                reason=LazyReason("Exported %d environment variables to %s", len(env_vars), "Kubernetes ConfigMap"),
+                timestamp=now
+            )
+            await self.audit_sink.create_audit_event(audit_event)
+        
+        # Export to Kubernetes ConfigMap format
+        return ExportStream(
+            chunks=self.exporter.stream_to_k8s_configmap(env_vars, request.service_id or 'default'),
             format='k8s-configmap',
-            exported_at=self.clock.now(),
-            count=len(env_vars)
+            media_type='application/yaml',
+            count=len(env_vars),
+            exported_at=now
         )
 
 
@@ -139,50 +265,53 @@ class ExportToDotEnvUseCase:
     """Use case for exporting to .env format"""
     
     def __init__(self, env_store: EnvStore, exporter: Exporter,
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator, audit_sink: AuditSink,
+                 cache: Optional[FilteredEnvVarCache] = None):
         self.env_store = env_store
         self.exporter = exporter
         self.clock = clock
         self.id_generator = id_generator
+        self.audit_sink = audit_sink
+        self.cache = cache
     
     async def execute(self, request: ExportRequest) -> ExportResponse:
         """Export environment variables to .env format"""
-        # Get environment variables based on filters
-        filters = {}
-        if request.service_id:
-            filters['service_id'] = request.service_id
-        if request.environment:
-            filters['scope_level'] = 'ENV'
-            filters['scope_ref_id'] = request.environment
-        if request.scope_level:
-            filters['scope_level'] = request.scope_level
-        if request.scope_ref_id:
-            filters['scope_ref_id'] = request.scope_ref_id
-        
-        env_vars = await self.env_store.list(filters)
+        export = await self.stream(request)
         
-        # Export to .env format
-        content = await self.exporter.export_to_dotenv(env_vars)
-        
-        # Create audit event
-        audit_event = AuditEvent(
-            id=self.id_generator.generate(),
-            actor=request.exported_by,
-            action=AuditAction.EXPORT,
-            target_type=AuditTargetType.ENV_VAR,
-            target_id=f"dotenv-{request.service_id or 'default'}",
-            before_json=None,
-            after_json={'format': 'dotenv', 'count': len(env_vars)},
-            reason=f"Exported {len(env_vars)} environment variables to .env format",
-            timestamp=self.clock.now()
+        return ExportResponse(
+            content=await _collect(export.chunks),
+            format=export.format,
+            exported_at=export.exported_at,
+            count=export.count
         )
-        await self.env_store.create_audit_event(audit_event)
+    
+    async def stream(self, request: ExportRequest) -> ExportStream:
+        """Export environment variables to .env format as a stream of chunks"""
+        now = self.clock.now()
         
-        return ExportResponse(
-            content=content,
+        # Get environment variables based on filters
+        env_vars = await _list_env_vars(self.env_store, self.cache, _build_filters(request))
+        
+        # Create audit event; exports are audited when issued, before any content is sent
+        if self.audit_sink.enabled:
+            audit_event = AuditEvent(
+                **_EXPORT_AUDIT_TEMPLATE,
+                id=self.id_generator.generate(),
+                actor=request.exported_by,
+                target_id=f"dotenv-{request.service_id or 'default'}",
+                after_json={'format': 'dotenv', 'count': len(env_vars)},
+                reason=LazyReason("Exported %d environment variables to %s", len(env_vars), ".env format"),
+                timestamp=now
+            )
+            await self.audit_sink.create_audit_event(audit_event)
+        
+        # Export to .env format
+        return ExportStream(
+            chunks=self.exporter.stream_to_dotenv(env_vars),
             format='dotenv',
-            exported_at=self.clock.now(),
-            count=len(env_vars)
+            media_type='text/plain',
+            count=len(env_vars),
+            exported_at=now
         )
 
 
@@ -206,10 +335,13 @@ class ImportFromDotEnvUseCase:
         updated_count = 0
         errors = []
         
+        # Look up all existing keys in one batch
+        existing_vars = await self.env_store.get_by_unique_keys(scope_level, scope_ref_id, list(env_vars.keys()))
+        
         for key, value in env_vars.items():
             try:
                 # Check if already exists
-                existing = await self.env_store.get_by_unique_key(scope_level, scope_ref_id, key)
+                existing = existing_vars.get(key)
                 
                 if existing:
                     # Update existing
@@ -232,7 +364,7 @@ class ImportFromDotEnvUseCase:
             target_id=f"import-{scope_level}-{scope_ref_id}",
             before_json=None,
             after_json={'format': 'dotenv', 'created': created_count, 'updated': updated_count},
-            reason=f"Imported {len(env_vars)} environment variables from .env format",
+            reason=LazyReason("Imported %d environment variables from .env format", len(env_vars)),
             timestamp=self.clock.now()
         )
         await self.env_store.create_audit_event(audit_event)
@@ -1,6 +1,7 @@
 """
 Use cases for release management
 """
+import asyncio
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
@@ -8,13 +9,17 @@ from dataclasses import dataclass
 from ..domain.release import Release, ReleaseStatus
 from ..domain.approval import Approval, ApprovalDecision
 from ..domain.env_var import EnvVar
-from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType
+from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType, LazyReason
 from ..ports.env_store import EnvStore
 from ..ports.clock import Clock
 from ..ports.id_generator import IdGenerator
 
 
-@dataclass
+# Environments whose releases need approval before they can be applied
+_APPROVAL_ENVIRONMENTS = frozenset({'prod', 'production'})
+
+
+@dataclass(slots=True, frozen=True)
 class CreateReleaseRequest:
     """Request to create a release"""
     service_id: str
@@ -25,7 +30,7 @@ class CreateReleaseRequest:
     created_by: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApproveReleaseRequest:
     """Request to approve a release"""
     release_id: str
@@ -33,7 +38,7 @@ class ApproveReleaseRequest:
     comment: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApplyReleaseRequest:
     """Request to apply a release"""
     release_id: str
@@ -50,12 +55,14 @@ class CreateReleaseUseCase:
     
     async def execute(self, request: CreateReleaseRequest) -> Release:
         """Create a new release"""
+        now = self.clock.now()
+        
         # Validate changes
         if not request.changes:
             raise ValueError("Release must have at least one change")
         
         # Check if environment requires approval
-        requires_approval = await self._requires_approval(request.environment)
+        requires_approval = self._requires_approval(request.environment)
         
         # Create release
         release = Release(
@@ -67,7 +74,7 @@ class CreateReleaseUseCase:
             status=ReleaseStatus.PENDING_APPROVAL if requires_approval else ReleaseStatus.APPROVED,
             changes=request.changes,
             created_by=request.created_by,
-            created_at=self.clock.now(),
+            created_at=now,
             applied_by=None,
             applied_at=None
         )
@@ -75,6 +82,9 @@ class CreateReleaseUseCase:
         # Save release
         await self.env_store.create_release(release)
         
+        # to_dict() walks every change, so build it once
+        release_dict = release.to_dict()
+        
         # Create audit event
         audit_event = AuditEvent(
             id=self.id_generator.generate(),
@@ -83,19 +93,19 @@ class CreateReleaseUseCase:
             target_type=AuditTargetType.RELEASE,
             target_id=release.id,
             before_json=None,
-            after_json=release.to_dict(),
-            reason=f"Created release {request.title}",
-            timestamp=self.clock.now()
+            after_json=release_dict,
+            reason=LazyReason("Created release %s", request.title),
+            timestamp=now
         )
         await self.env_store.create_audit_event(audit_event)
         
         return release
     
-    async def _requires_approval(self, environment: str) -> bool:
+    def _requires_approval(self, environment: str) -> bool:
         """Check if environment requires approval"""
         # This would typically check against policies
         # For now, assume prod environments require approval
-        return environment.lower() in ['prod', 'production']
+        return environment.casefold() in _APPROVAL_ENVIRONMENTS
 
 
 class ApproveReleaseUseCase:
@@ -108,6 +118,8 @@ class ApproveReleaseUseCase:
     
     async def execute(self, request: ApproveReleaseRequest) -> Approval:
         """Approve a release"""
+        now = self.clock.now()
+        
         # Get release
         release = await self.env_store.get_release_by_id(request.release_id)
         if not release:
@@ -123,15 +135,11 @@ class ApproveReleaseUseCase:
             approver_id=request.approver_id,
             decision=ApprovalDecision.APPROVED,
             comment=request.comment,
-            decided_at=self.clock.now()
+            decided_at=now
         )
         
-        # Save approval
-        await self.env_store.create_approval(approval)
-        
-        # Update release status
-        release.status = ReleaseStatus.APPROVED
-        await self.env_store.update_release(release)
+        # Save approval and update release status in one transaction
+        release = await self.env_store.approve_release_tx(approval, request.release_id)
         
         # Create audit event
         audit_event = AuditEvent(
@@ -142,8 +150,8 @@ class ApproveReleaseUseCase:
             target_id=request.release_id,
             before_json={'status': ReleaseStatus.PENDING_APPROVAL.value},
             after_json={'status': ReleaseStatus.APPROVED.value},
-            reason=f"Approved release {release.title}: {request.comment or 'No comment'}",
-            timestamp=self.clock.now()
+            reason=LazyReason("Approved release %s: %s", release.title, request.comment or 'No comment'),
+            timestamp=now
         )
         await self.env_store.create_audit_event(audit_event)
         
@@ -153,13 +161,17 @@ class ApproveReleaseUseCase:
 class ApplyReleaseUseCase:
     """Use case for applying releases"""
     
-    def __init__(self, env_store: EnvStore, clock: Clock, id_generator: IdGenerator):
+    def __init__(self, env_store: EnvStore, clock: Clock, id_generator: IdGenerator,
+                 max_concurrency: int = 8):
         self.env_store = env_store
         self.clock = clock
         self.id_generator = id_generator
+        self.max_concurrency = max_concurrency
     
     async def execute(self, request: ApplyReleaseRequest) -> Release:
         """Apply a release"""
+        now = self.clock.now()
+        
         # Get release
         release = await self.env_store.get_release_by_id(request.release_id)
         if not release:
@@ -168,15 +180,14 @@ class ApplyReleaseUseCase:
         if not release.can_be_applied():
             raise ValueError(f"Release {request.release_id} cannot be applied in current status {release.status}")
         
-        # Apply changes
-        for change in release.changes:
-            await self._apply_change(change, request.applied_by)
+        # Apply changes concurrently; a failing change is recorded instead of
+        # aborting the others
+        errors = await self._apply_changes(release.changes, request.applied_by)
         
         # Update release status
         release.status = ReleaseStatus.APPLIED
         release.applied_by = request.applied_by
-        release.applied_at = self.clock.now()
-        await self.env_store.update_release(release)
+        release.applied_at = now
         
         # Create audit event
         audit_event = AuditEvent(
@@ -186,14 +197,32 @@ class ApplyReleaseUseCase:
             target_type=AuditTargetType.RELEASE,
             target_id=request.release_id,
             before_json={'status': ReleaseStatus.APPROVED.value},
-            after_json={'status': ReleaseStatus.APPLIED.value},
-            reason=f"Applied release {release.title}",
-            timestamp=self.clock.now()
+            after_json={'status': ReleaseStatus.APPLIED.value, 'errors': errors},
+            reason=(LazyReason("Applied release %s with %d failed change(s)", release.title, len(errors)) if errors
+                    else LazyReason("Applied release %s", release.title)),
+            timestamp=now
         )
-        await self.env_store.create_audit_event(audit_event)
+        
+        # Save release status and audit event in one transaction
+        await self.env_store.apply_release_tx(release, audit_event)
         
         return release
     
+    async def _apply_changes(self, changes: List[Dict[str, Any]], applied_by: str) -> List[str]:
+        """Apply release changes with bounded concurrency and collect per-change errors"""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        
+        async def _run(change: Dict[str, Any]):
+            async with semaphore:
+                await self._apply_change(change, applied_by)
+        
+        results = await asyncio.gather(*(_run(change) for change in changes), return_exceptions=True)
+        return [
+            f"Error applying {change.get('action')} {change.get('env_var_id')}: {str(result)}"
+            for change, result in zip(changes, results)
+            if isinstance(result, Exception)
+        ]
+    
     async def _apply_change(self, change: Dict[str, Any], applied_by: str):
         """Apply a single change from the release"""
         action = change.get('action')
@@ -1,19 +1,28 @@
 """
 Use cases for secret management
 """
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
+import asyncio
+import hashlib
+import time
 
 from ..domain.env_var import EnvVar
-from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType
+from ..domain.audit_event import AuditEvent, AuditAction, AuditTargetType, LazyReason
 from ..ports.env_store import EnvStore
 from ..ports.secret_cipher import SecretCipher
 from ..ports.clock import Clock
 from ..ports.id_generator import IdGenerator
 
 
-@dataclass
+# Upper bound for a reveal TTL; keeps expiries (and anything cached for that
+# long) short-lived no matter what the caller asks for
+MAX_REVEAL_TTL_SECONDS = 300
+
+
+@dataclass(slots=True, frozen=True)
 class RevealSecretRequest:
     """Request to reveal a secret"""
     env_var_id: str
@@ -22,7 +31,7 @@ class RevealSecretRequest:
     ttl_seconds: int = 30
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RevealSecretResponse:
     """Response for revealing a secret"""
     value: str
@@ -30,18 +39,99 @@ class RevealSecretResponse:
     ttl_seconds: int
 
 
+SecretKey = Tuple[str, bytes]
+
+
+class SecretCache:
+    """Short-lived in-process cache of decrypted secret values
+    
+    Entries are keyed by env var id and a digest of the ciphertext, so a
+    rotated value never hits a stale entry. Concurrent reveals of the same
+    secret share a single decrypt.
+    """
+    
+    def __init__(self, ttl_seconds: float = 60.0, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[SecretKey, Tuple[float, str]]' = OrderedDict()
+        self._locks: Dict[SecretKey, asyncio.Lock] = {}
+    
+    @staticmethod
+    def key_for(env_var: EnvVar) -> SecretKey:
+        """Build the cache key for an env var's current ciphertext"""
+        digest = hashlib.blake2b(env_var.value.encode('utf-8'), digest_size=16).digest()
+        return env_var.id, digest
+    
+    async def get_or_decrypt(self, env_var: EnvVar, secret_cipher: SecretCipher,
+                             ttl_seconds: float) -> str:
+        """Get the plaintext for env_var, decrypting at most once per key and TTL window"""
+        key = self.key_for(env_var)
+        value = self._get(key)
+        if value is not None:
+            return value
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            value = self._get(key)
+            if value is not None:
+                return value
+            try:
+                value = await secret_cipher.decrypt(env_var.value)
+            except Exception:
+                self._locks.pop(key, None)
+                raise
+            ttl = min(ttl_seconds, self.ttl_seconds)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+            return value
+    
+    def invalidate(self, env_var: EnvVar):
+        """Drop the cached plaintext for env_var's current ciphertext"""
+        self._discard(self.key_for(env_var))
+    
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._locks.clear()
+    
+    def _get(self, key: SecretKey) -> Optional[str]:
+        """Get a live entry, dropping it if expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def _discard(self, key: SecretKey):
+        """Remove an entry and its lock"""
+        self._entries.pop(key, None)
+        self._locks.pop(key, None)
+
+
 class RevealSecretUseCase:
     """Use case for revealing secrets with TTL"""
     
     def __init__(self, env_store: EnvStore, secret_cipher: SecretCipher,
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator,
+                 secret_cache: Optional[SecretCache] = None):
         self.env_store = env_store
         self.secret_cipher = secret_cipher
         self.clock = clock
         self.id_generator = id_generator
+        self.secret_cache = secret_cache
     
     async def execute(self, request: RevealSecretRequest) -> RevealSecretResponse:
         """Reveal a secret with TTL"""
+        if not 1 <= request.ttl_seconds <= MAX_REVEAL_TTL_SECONDS:
+            raise ValueError(f"ttl_seconds must be between 1 and {MAX_REVEAL_TTL_SECONDS}")
+        
+        now = self.clock.now()
+        
         # Get environment variable
         env_var = await self.env_store.get_by_id(request.env_var_id)
         if not env_var:
@@ -50,11 +140,16 @@ class RevealSecretUseCase:
         if not env_var.is_secret:
             raise ValueError(f"Environment variable {env_var.key} is not a secret")
         
-        # Decrypt the value
-        decrypted_value = await self.secret_cipher.decrypt(env_var.value)
+        # Decrypt the value, reusing a recent decrypt of the same ciphertext
+        if self.secret_cache is None:
+            decrypted_value = await self.secret_cipher.decrypt(env_var.value)
+        else:
+            decrypted_value = await self.secret_cache.get_or_decrypt(
+                env_var, self.secret_cipher, request.ttl_seconds
+            )
         
         # Calculate expiration time
-        expires_at = self.clock.now() + timedelta(seconds=request.ttl_seconds)
+        expires_at = now + timedelta(seconds=request.ttl_seconds)
         
         # Create audit event for secret reveal
         audit_event = AuditEvent(
@@ -65,8 +160,8 @@ class RevealSecretUseCase:
             target_id=env_var.id,
             before_json=None,
             after_json={'justification': request.justification, 'ttl_seconds': request.ttl_seconds},
-            reason=f"Revealed secret {env_var.key}: {request.justification}",
-            timestamp=self.clock.now()
+            reason=LazyReason("Revealed secret %s: %s", env_var.key, request.justification),
+            timestamp=now
         )
         await self.env_store.create_audit_event(audit_event)
         
@@ -81,14 +176,18 @@ class RotateSecretUseCase:
     """Use case for rotating secrets"""
     
     def __init__(self, env_store: EnvStore, secret_cipher: SecretCipher,
-                 clock: Clock, id_generator: IdGenerator):
+                 clock: Clock, id_generator: IdGenerator,
+                 secret_cache: Optional[SecretCache] = None):
         self.env_store = env_store
         self.secret_cipher = secret_cipher
         self.clock = clock
         self.id_generator = id_generator
+        self.secret_cache = secret_cache
     
     async def execute(self, env_var_id: str, new_value: str, rotated_by: str) -> EnvVar:
         """Rotate a secret value"""
+        now = self.clock.now()
+        
         # Get existing environment variable
         existing = await self.env_store.get_by_id(env_var_id)
         if not existing:
@@ -117,11 +216,13 @@ class RotateSecretUseCase:
             created_by=existing.created_by,
             created_at=existing.created_at,
             updated_by=rotated_by,
-            updated_at=self.clock.now()
+            updated_at=now
         )
         
         # Save updated environment variable
         await self.env_store.update(updated_env_var)
+        if self.secret_cache is not None:
+            self.secret_cache.invalidate(existing)
         
         # Create version record
         from ..domain.env_var_version import EnvVarVersion
@@ -135,7 +236,7 @@ class RotateSecretUseCase:
             },
             checksum="",  # Will be computed in __post_init__
             author=rotated_by,
-            created_at=self.clock.now()
+            created_at=now
         )
         await self.env_store.create_version(version)
         
@@ -148,8 +249,8 @@ class RotateSecretUseCase:
             target_id=updated_env_var.id,
             before_json=before_dict,
             after_json=updated_env_var.to_dict(),
-            reason=f"Rotated secret {updated_env_var.key}",
-            timestamp=self.clock.now()
+            reason=LazyReason("Rotated secret %s", updated_env_var.key),
+            timestamp=now
         )
         await self.env_store.create_audit_event(audit_event)
         
@@ -166,6 +267,8 @@ class ScheduleRotationUseCase:
     
     async def execute(self, env_var_id: str, rotation_schedule: str, scheduled_by: str) -> Dict[str, Any]:
         """Schedule automatic rotation for a secret"""
+        now = self.clock.now()
+        
         # Get environment variable
         env_var = await self.env_store.get_by_id(env_var_id)
         if not env_var:
@@ -180,7 +283,7 @@ class ScheduleRotationUseCase:
             'env_var_id': env_var_id,
             'schedule': rotation_schedule,
             'created_by': scheduled_by,
-            'created_at': self.clock.now(),
+            'created_at': now,
             'status': 'ACTIVE'
         }
         
@@ -196,8 +299,8 @@ class ScheduleRotationUseCase:
             target_id=env_var_id,
             before_json=None,
             after_json={'rotation_schedule': rotation_schedule},
-            reason=f"Scheduled rotation for secret {env_var.key}",
-            timestamp=self.clock.now()
+            reason=LazyReason("Scheduled rotation for secret %s", env_var.key),
+            timestamp=now
         )
         await self.env_store.create_audit_event(audit_event)
         
@@ -0,0 +1,94 @@
+"""
+Materialized audit statistics (PostgreSQL only)
+
+audit_stats_mv holds one row per (action, actor, is_sensitive) with its event
+count, so /audit/stats reads a handful of pre-aggregated rows instead of
+scanning audit_events. The view is refreshed periodically in the background
+and may lag new events by up to AUDIT_STATS_REFRESH_SECONDS.
+"""
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+log = logging.getLogger("app.audit_stats")
+
+# action_counts/actor_counts keep only the most frequent entries, so the
+# response stays bounded however many distinct actors there are
+STATS_TOP_N = 100
+
+CREATE_AUDIT_STATS_VIEW = text("""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS audit_stats_mv AS
+    SELECT action, actor, coalesce(is_sensitive, false) AS is_sensitive, count(*) AS event_count
+    FROM audit_events
+    GROUP BY action, actor, coalesce(is_sensitive, false)
+""")
+
+# REFRESH ... CONCURRENTLY requires a unique index on the view
+CREATE_AUDIT_STATS_INDEX = text(
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_audit_stats_mv_key ON audit_stats_mv (action, actor, is_sensitive)"
+)
+
+REFRESH_AUDIT_STATS_VIEW = text("REFRESH MATERIALIZED VIEW CONCURRENTLY audit_stats_mv")
+
+# Transaction-scoped, so it is released when the refresh commits; workers that
+# miss it skip the tick instead of queueing a duplicate refresh
+TRY_LOCK_AUDIT_STATS_REFRESH = text("SELECT pg_try_advisory_xact_lock(hashtext('audit_stats_refresh'))")
+
+
+def create_audit_stats_view(conn) -> None:
+    """Create audit_stats_mv and its unique index if missing"""
+    conn.execute(CREATE_AUDIT_STATS_VIEW)
+    conn.execute(CREATE_AUDIT_STATS_INDEX)
+
+
+def read_audit_stats(db: Session) -> Dict[str, Any]:
+    """Build the /audit/stats payload from audit_stats_mv"""
+    rows = db.execute(text(
+        "SELECT action, actor, event_count, CASE WHEN is_sensitive THEN event_count ELSE 0 END "
+        "FROM audit_stats_mv"
+    )).all()
+    return fold_audit_stats(rows)
+
+
+def fold_audit_stats(rows: Iterable[Tuple[str, str, int, int]]) -> Dict[str, Any]:
+    """Build the /audit/stats payload from (action, actor, count, sensitive count) rows
+    
+    action_counts and actor_counts are ordered by count, highest first, and
+    capped at STATS_TOP_N entries; the totals always cover every row.
+    """
+    total_events = 0
+    sensitive_events = 0
+    action_counts: Counter = Counter()
+    actor_counts: Counter = Counter()
+    for action, actor, count, sensitive_count in rows:
+        total_events += count
+        sensitive_events += sensitive_count
+        action_counts[action] += count
+        actor_counts[actor] += count
+
+    return {
+        "total_events": total_events,
+        "sensitive_events": sensitive_events,
+        "action_counts": dict(action_counts.most_common(STATS_TOP_N)),
+        "actor_counts": dict(actor_counts.most_common(STATS_TOP_N))
+    }
+
+
+async def refresh_audit_stats_periodically(async_engine, interval_seconds: float) -> None:
+    """Refresh audit_stats_mv every interval_seconds until cancelled
+    
+    Every worker runs this loop; an advisory lock lets only one of them
+    refresh per tick.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with async_engine.begin() as conn:
+                if await conn.scalar(TRY_LOCK_AUDIT_STATS_REFRESH):
+                    await conn.execute(REFRESH_AUDIT_STATS_VIEW)
+        except Exception as e:
+            log.warning("Failed to refresh audit_stats_mv: %s", e)
@@ -0,0 +1,21 @@
+"""
+Bulk insert helpers for the sync SQLAlchemy session
+"""
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+
+def bulk_insert(db: Session, model, rows: Sequence[Dict[str, Any]]) -> int:
+    """Insert rows without per-row ORM unit-of-work overhead
+
+    Rows go out as a single executemany INSERT, which psycopg2 batches into
+    multi-row VALUES statements (see executemany_mode in app.db.database).
+    Every row must carry the same keys.
+    """
+    if not rows:
+        return 0
+
+    db.execute(insert(model), list(rows))
+    return len(rows)
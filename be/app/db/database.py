@@ -1,18 +1,69 @@
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import DB_URL
 
+# psycopg2: gộp executemany thành INSERT ... VALUES (...), (...) nhiều dòng,
+# và execute_batch cho UPDATE/DELETE nhiều tham số
+_db_url = make_url(DB_URL)
+_engine_options = {}
+if _db_url.get_backend_name() == "postgresql" and _db_url.get_driver_name() == "psycopg2":
+    _engine_options = {
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 1000,
+    }
+
+
+# Cột JSON (before_json, after_json, tags, diff_json, ...) encode/decode bằng
+# orjson thay vì module json chuẩn; driver cần str nên decode bytes
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_json_options = {"json_serializer": _json_dumps, "json_deserializer": orjson.loads}
+
+# Cache SQL đã compile (mặc định 500): đủ chỗ cho mọi tổ hợp filter của
+# list/audit query mà không bị đẩy ra khỏi cache
+QUERY_CACHE_SIZE = 1200
+
 # Tạo engine (pool_pre_ping để check connection khỏe)
 engine = create_engine(
     DB_URL,
     pool_pre_ping=True,  # giúp tránh lỗi connection drop
-    echo=False  # Set to True for SQL debugging
+    echo=False,  # Set to True for SQL debugging
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_json_options,
+    **_engine_options
 )
 
 # SessionLocal cho mỗi request
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) cho các router async, để DB I/O không chặn event loop.
+# Engine sync ở trên vẫn dùng cho script, migration và schema init.
+# asyncpg giữ prepared statement theo từng connection (mặc định 100); tăng lên
+# để mọi tổ hợp filter (đều là bind param) dùng lại plan thay vì PREPARE lại
+ASYNC_PREPARED_STATEMENT_CACHE_SIZE = 500
+ASYNC_DB_URL = _db_url.set(drivername="postgresql+asyncpg").update_query_dict(
+    {"prepared_statement_cache_size": str(ASYNC_PREPARED_STATEMENT_CACHE_SIZE)}
+)
+
+async_engine = create_async_engine(
+    ASYNC_DB_URL,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    echo=False,
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_json_options
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, class_=AsyncSession)
+
 # Base model cho ORM
 Base = declarative_base()
 
@@ -22,4 +73,35 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Dependency để inject AsyncSession vào route async
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+_schema_initialized = False
+
+
+def init_schema(bind=None):
+    """Create missing tables once per process; concurrent workers serialize on an advisory lock"""
+    global _schema_initialized
+    if _schema_initialized:
+        return
+    
+    # Import models so Base.metadata is populated
+    import app.model.audit_event  # noqa: F401
+    import app.model.env_var  # noqa: F401
+    
+    with (bind or engine).begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Transaction-scoped lock, released on commit
+            conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('schema_init'))"))
+        Base.metadata.create_all(conn)
+        if conn.dialect.name == "postgresql":
+            from app.db.audit_stats import create_audit_stats_view
+            create_audit_stats_view(conn)
+    
+    _schema_initialized = True
\ No newline at end of file
@@ -1,11 +1,19 @@
+import asyncio
+import logging
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
-from app.db.database import engine
+from app.db.audit_stats import refresh_audit_stats_periodically
+from app.db.database import AsyncSessionLocal, async_engine, init_schema
 from app.core.config import mask_db_url
+from app.utils.responses import ORJSONResponse
+
+log = logging.getLogger("app.startup")
 
 
 def _mask_db_url(url: str) -> str:
@@ -19,16 +27,29 @@ def _mask_db_url(url: str) -> str:
         return "***"
 
 
+# ==== Event loop ====
+# Dùng uvloop nếu có (Linux/macOS); uvicorn --loop auto cũng chọn nó, nhưng
+# đặt policy ở đây để mọi server/runner khác đều dùng cùng event loop
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+
 # ==== FastAPI app ====
 app = FastAPI(
     title="Simple API",
     description="Simple API System",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # ==== CORS ====
 allow_origins_env = os.getenv("ALLOW_ORIGINS", "http://localhost:5173")
 ALLOW_ORIGINS = [o.strip() for o in allow_origins_env.split(",") if o.strip()]
+# Cho browser cache kết quả preflight (OPTIONS) thay vì gửi lại mỗi request
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
 
 app.add_middleware(
     CORSMiddleware,
@@ -36,28 +57,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE,
 )
 
+# ==== Compression ====
+# Nén gzip các response lớn (list, export); response stream được nén theo
+# từng chunk nên bộ nhớ vẫn bị giới hạn. Level 4 đủ nhỏ mà tốn ít CPU
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
 
-# ==== Startup: kiểm tra DB ====
+
+# ==== Startup: khởi tạo schema ====
+# Không probe DB ở đây: pool_pre_ping kiểm tra kết nối khi dùng, còn
+# readiness thì do /health/db đảm nhận
 @app.on_event("startup")
 async def startup_event():
-    from app.core.config import DB_URL
+    from app.core.config import DB_URL, ALEMBIC_MANAGED
     
-    print("→ Using DATABASE_URL:", _mask_db_url(DB_URL))
+    log.info("Using DATABASE_URL: %s", _mask_db_url(DB_URL))
 
     try:
-        # Test kết nối trước
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-
-        print("✅ Database connection successful.")
+        if ALEMBIC_MANAGED:
+            log.info("ALEMBIC_MANAGED=1, skipping schema init.")
+        else:
+            # create_all dùng engine sync; chạy trong thread để không chặn event loop
+            await asyncio.to_thread(init_schema)
+            log.info("Database schema ready.")
     except OperationalError as e:
-        print("❌ Cannot connect to database. Check DATABASE_URL. Detail:", e)
+        log.error("Cannot connect to database. Check DATABASE_URL. Detail: %s", e)
         raise
     except Exception as e:
-        print("❌ Failed to initialize database:", e)
+        log.exception("Failed to initialize database: %s", e)
         raise
+    
+    # Làm mới audit_stats_mv định kỳ ở background
+    from app.core.config import AUDIT_STATS_REFRESH_SECONDS
+    app.state.audit_stats_refresher = asyncio.create_task(
+        refresh_audit_stats_periodically(async_engine, AUDIT_STATS_REFRESH_SECONDS)
+    )
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    refresher = getattr(app.state, "audit_stats_refresher", None)
+    if refresher is not None:
+        refresher.cancel()
 
 
 # ==== Root endpoint ====
@@ -70,6 +113,17 @@ def root():
 def health_check():
     return {"status": "healthy", "message": "Backend is running"}
 
+@app.get("/health/db")
+async def db_health_check():
+    """Readiness check: run a trivial query on a pooled connection"""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(text("SELECT 1"))
+    except Exception as e:
+        log.warning("Database health check failed: %s", e)
+        return JSONResponse(status_code=503, content={"status": "unhealthy", "message": "Database unavailable"})
+    return {"status": "healthy", "message": "Database is reachable"}
+
 
 # ==== Routers ====
 from app.routers import env_vars, releases, audit
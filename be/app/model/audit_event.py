@@ -1,27 +1,31 @@
 """
 Audit Event SQLAlchemy model
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, JSON, Integer
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, Column, String, DateTime, Boolean, Text, JSON, Integer, Index, event
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
+import operator
 import uuid
 
 from app.db.database import Base
 
+# jsonb on PostgreSQL (stored pre-parsed, indexable); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class AuditEventModel(Base):
     __tablename__ = "audit_events"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    actor = Column(String(255), nullable=False, index=True)
-    action = Column(String(100), nullable=False, index=True)
+    actor = Column(String(255), nullable=False)
+    action = Column(String(100), nullable=False)
     action_description = Column(Text)
-    target_type = Column(String(100), nullable=False, index=True)
-    target_id = Column(String(255), nullable=False, index=True)
+    target_type = Column(String(100), nullable=False)
+    target_id = Column(String(255), nullable=False)
     change_summary = Column(Text)
-    before_json = Column(JSON)
-    after_json = Column(JSON)
-    timestamp = Column(DateTime(timezone=True), nullable=False, default=func.now(), index=True)
+    before_json = Column(JSONType)
+    after_json = Column(JSONType)
+    timestamp = Column(DateTime(timezone=True), nullable=False, default=func.now())
     is_sensitive = Column(Boolean, default=False, index=True)
     reason = Column(Text)
     
@@ -30,22 +34,39 @@ class AuditEventModel(Base):
     user_agent = Column(Text)
     session_id = Column(String(255))
     
+    # Composite indexes match the audit list filters + ORDER BY timestamp DESC,
+    # so filtered pages are read in order from the index without a sort;
+    # (timestamp, id) backs the keyset cursor of the unfiltered listing;
+    # the trigram indexes serve the actor/action substring search
+    __table_args__ = (
+        Index('idx_audit_events_ts_id', timestamp.desc(), id.desc()),
+        Index('idx_audit_events_target_ts', target_type, target_id, timestamp.desc()),
+        Index('idx_audit_events_actor_ts', actor, timestamp.desc()),
+        Index('idx_audit_events_action_ts', action, timestamp.desc()),
+        Index('idx_audit_events_actor_trgm', actor,
+              postgresql_using='gin', postgresql_ops={'actor': 'gin_trgm_ops'}),
+        Index('idx_audit_events_action_trgm', action,
+              postgresql_using='gin', postgresql_ops={'action': 'gin_trgm_ops'}),
+    )
+    
+    # Keys of to_dict, read in one attrgetter call
+    _DICT_KEYS = (
+        "id", "actor", "action", "action_description", "target_type", "target_id",
+        "change_summary", "before_json", "after_json", "timestamp", "is_sensitive",
+        "reason", "ip_address", "user_agent", "session_id",
+    )
+    _DICT_GETTER = operator.attrgetter(*_DICT_KEYS)
+    
     def to_dict(self):
-        return {
-            "id": str(self.id),
-            "actor": self.actor,
-            "action": self.action,
-            "action_description": self.action_description,
-            "target_type": self.target_type,
-            "target_id": self.target_id,
-            "change_summary": self.change_summary,
-            "before_json": self.before_json,
-            "after_json": self.after_json,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "is_sensitive": self.is_sensitive,
-            "reason": self.reason,
-            "ip_address": self.ip_address,
-            "user_agent": self.user_agent,
-            "session_id": self.session_id
-        }
+        data = dict(zip(self._DICT_KEYS, self._DICT_GETTER(self)))
+        data["id"] = str(data["id"])
+        timestamp = data["timestamp"]
+        data["timestamp"] = timestamp.isoformat() if timestamp else None
+        return data
+
 
+# gin_trgm_ops needs pg_trgm, which create_all does not install
+event.listen(
+    AuditEventModel.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
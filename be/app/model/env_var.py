@@ -2,11 +2,14 @@
 SQLAlchemy models for environment variables
 """
 from sqlalchemy import Column, String, Text, Boolean, DateTime, Integer, JSON, ForeignKey, Index
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
-Base = declarative_base()
+from app.db.database import Base
+
+# jsonb on PostgreSQL (stored pre-parsed, indexable); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 
 class EnvVarModel(Base):
@@ -19,7 +22,7 @@ class EnvVarModel(Base):
     type = Column(String(20), nullable=False)  # STRING, NUMBER, BOOL, JSON, SECRET
     scope_level = Column(String(20), nullable=False)  # GLOBAL, PROJECT, SERVICE, ENV
     scope_ref_id = Column(String(255), nullable=False)
-    tags = Column(JSON, nullable=True)
+    tags = Column(JSONType, nullable=True)
     description = Column(Text, nullable=True)
     is_secret = Column(Boolean, default=False, nullable=False)
     status = Column(String(20), default="ACTIVE", nullable=False)  # ACTIVE, PENDING, DEPRECATED
@@ -28,8 +31,8 @@ class EnvVarModel(Base):
     updated_by = Column(String(255), nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
-    # Relationships
-    versions = relationship("EnvVarVersionModel", back_populates="env_var", cascade="all, delete-orphan")
+    # Relationships (lazy="raise": load explicitly with selectinload, never per row)
+    versions = relationship("EnvVarVersionModel", back_populates="env_var", cascade="all, delete-orphan", lazy="raise")
     
     # Indexes
     __table_args__ = (
@@ -38,6 +41,8 @@ class EnvVarModel(Base):
         Index('idx_env_vars_unique', 'scope_level', 'scope_ref_id', 'key', unique=True),
         Index('idx_env_vars_created_at', 'created_at'),
         Index('idx_env_vars_updated_at', 'updated_at'),
+        Index('idx_env_vars_status', 'status'),
+        Index('idx_env_vars_tags', 'tags', postgresql_using='gin'),
     )
 
 
@@ -48,13 +53,13 @@ class EnvVarVersionModel(Base):
     id = Column(String(255), primary_key=True)
     env_var_id = Column(String(255), ForeignKey("env_vars.id"), nullable=False)
     version = Column(Integer, nullable=False)
-    diff_json = Column(JSON, nullable=False)
+    diff_json = Column(JSONType, nullable=False)
     checksum = Column(String(255), nullable=False)
     author = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationships
-    env_var = relationship("EnvVarModel", back_populates="versions")
+    env_var = relationship("EnvVarModel", back_populates="versions", lazy="raise")
     
     # Indexes
     __table_args__ = (
@@ -74,18 +79,19 @@ class ReleaseModel(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(20), default="DRAFT", nullable=False)  # DRAFT, PENDING_APPROVAL, APPROVED, APPLIED, REJECTED, CANCELLED
-    changes = Column(JSON, nullable=False)
+    changes = Column(JSONType, nullable=False)
     created_by = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     applied_by = Column(String(255), nullable=True)
     applied_at = Column(DateTime, nullable=True)
     
-    # Relationships
-    approvals = relationship("ApprovalModel", back_populates="release", cascade="all, delete-orphan")
+    # Relationships (lazy="raise": load explicitly with selectinload, never per row)
+    approvals = relationship("ApprovalModel", back_populates="release", cascade="all, delete-orphan", lazy="raise")
     
     # Indexes
     __table_args__ = (
-        Index('idx_releases_service_id', 'service_id'),
+        # Matches the /releases list filters (service_id, environment, status)
+        Index('idx_releases_service_env_status', 'service_id', 'environment', 'status'),
         Index('idx_releases_environment', 'environment'),
         Index('idx_releases_status', 'status'),
         Index('idx_releases_created_at', 'created_at'),
@@ -104,7 +110,7 @@ class ApprovalModel(Base):
     decided_at = Column(DateTime, nullable=True)
     
     # Relationships
-    release = relationship("ReleaseModel", back_populates="approvals")
+    release = relationship("ReleaseModel", back_populates="approvals", lazy="raise")
     
     # Indexes
     __table_args__ = (
@@ -139,30 +145,6 @@ class PolicyModel(Base):
     )
 
 
-class AuditEventModel(Base):
-    """SQLAlchemy model for audit events"""
-    __tablename__ = "audit_events"
-    
-    id = Column(String(255), primary_key=True)
-    actor = Column(String(255), nullable=False)
-    action = Column(String(20), nullable=False)  # CREATE, UPDATE, DELETE, REVEAL, APPROVE, REJECT, APPLY, ROLLBACK, EXPORT, IMPORT
-    target_type = Column(String(20), nullable=False)  # ENV_VAR, RELEASE, APPROVAL, POLICY
-    target_id = Column(String(255), nullable=False)
-    before_json = Column(JSON, nullable=True)
-    after_json = Column(JSON, nullable=True)
-    reason = Column(Text, nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
-    
-    # Indexes
-    __table_args__ = (
-        Index('idx_audit_events_actor', 'actor'),
-        Index('idx_audit_events_action', 'action'),
-        Index('idx_audit_events_target_type', 'target_type'),
-        Index('idx_audit_events_target_id', 'target_id'),
-        Index('idx_audit_events_timestamp', 'timestamp'),
-    )
-
-
 class RotationScheduleModel(Base):
     """SQLAlchemy model for rotation schedules"""
     __tablename__ = "rotation_schedules"
@@ -2,14 +2,22 @@
 Audit endpoints for environment variable management
 """
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from datetime import datetime, timezone
+import hashlib
+import operator
+import uuid
+import orjson
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, or_, desc, func, select, tuple_
 
 from app.db.database import get_db
+from app.db.audit_stats import REFRESH_AUDIT_STATS_VIEW, fold_audit_stats, read_audit_stats
+from app.db.bulk import bulk_insert
 from app.model.audit_event import AuditEventModel
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
@@ -77,7 +85,7 @@ SAMPLE_AUDIT_EVENTS = [
     }
 ]
 
-class AuditEvent(BaseModel):
+class AuditEventSummary(BaseModel):
     id: str
     actor: str
     action: str
@@ -85,73 +93,200 @@ class AuditEvent(BaseModel):
     target_type: str
     target_id: str
     change_summary: str
-    before_json: Optional[dict] = None
-    after_json: Optional[dict] = None
     timestamp: str
     is_sensitive: bool
     reason: str
 
+class AuditEvent(AuditEventSummary):
+    before_json: Optional[dict] = None
+    after_json: Optional[dict] = None
+
+# Response fields read straight off AuditEventModel rows. The pydantic
+# schemas document the API; responses are built as plain dicts and encoded
+# with orjson, skipping pydantic for already-typed column values
+_AUDIT_EVENT_FIELDS = tuple(AuditEvent.model_fields)
+_AUDIT_EVENT_GETTER = operator.attrgetter(*_AUDIT_EVENT_FIELDS)
+
+# The list selects only the summary columns, leaving the JSON blobs to
+# /events/{event_id}
+_AUDIT_SUMMARY_FIELDS = tuple(AuditEventSummary.model_fields)
+_AUDIT_SUMMARY_COLUMNS = [getattr(AuditEventModel, field) for field in _AUDIT_SUMMARY_FIELDS]
+
+def _audit_data(fields, values) -> dict:
+    """Response dict from column values in field order"""
+    data = dict(zip(fields, values))
+    data["id"] = str(data["id"])
+    timestamp = data["timestamp"]
+    data["timestamp"] = timestamp.isoformat() if timestamp else None
+    return data
+
+def _audit_event_data(event: AuditEventModel) -> dict:
+    """AuditEvent-shaped dict for a row"""
+    return _audit_data(_AUDIT_EVENT_FIELDS, _AUDIT_EVENT_GETTER(event))
+
+class AuditCursor(BaseModel):
+    before_ts: str
+    before_id: str
+
 class AuditEventsResponse(BaseModel):
-    events: List[AuditEvent]
+    events: List[AuditEventSummary]
     total: int
     page: int
     size: int
+    next_cursor: Optional[AuditCursor] = None
+
+def _etag_response(request: Request, content, headers: Optional[dict] = None) -> Response:
+    """JSON response tagged with a hash of its body; 304 if the client already has it"""
+    body = orjson.dumps(content)
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {**(headers or {}), "ETag": etag}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+def _contains(column, value: str):
+    """Case-insensitive substring filter; user-supplied % and _ match literally
+    
+    Served by the pg_trgm GIN indexes on audit_events (migration 0002).
+    """
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+def _audit_filters(actor: Optional[str], action: Optional[str],
+                   target_type: Optional[str], target_id: Optional[str]) -> list:
+    """WHERE clauses for the audit event list filters"""
+    filters = []
+    
+    if actor:
+        filters.append(_contains(AuditEventModel.actor, actor))
+    
+    if action:
+        filters.append(_contains(AuditEventModel.action, action))
+        
+    if target_type:
+        filters.append(AuditEventModel.target_type == target_type)
+        
+    if target_id:
+        filters.append(AuditEventModel.target_id == target_id)
+    
+    return filters
 
 @router.get("/events", response_model=AuditEventsResponse)
-async def list_audit_events(
+def list_audit_events(
+    request: Request,
     actor: Optional[str] = Query(None, description="Filter by actor"),
     action: Optional[str] = Query(None, description="Filter by action"),
     target_type: Optional[str] = Query(None, description="Filter by target type"),
     target_id: Optional[str] = Query(None, description="Filter by target ID"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     size: int = Query(50, ge=1, le=100, description="Page size"),
+    before_ts: Optional[datetime] = Query(None, description="Cursor: timestamp of the last event seen"),
+    before_id: Optional[uuid.UUID] = Query(None, description="Cursor: ID of the last event seen"),
     db: Session = Depends(get_db)
 ):
-    """List audit events with filtering and pagination"""
+    """List audit event summaries with filtering and pagination
+    
+    before_json/after_json are not loaded here; fetch /events/{event_id} for
+    the full record. Pass next_cursor back as before_ts/before_id to seek to the following page
+    through the (timestamp, id) index; page-number OFFSET paging is kept for
+    clients that jump to arbitrary pages.
+    """
+    if (before_ts is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before_ts and before_id must be given together")
+    
     try:
-        # Build query with filters
-        query = db.query(AuditEventModel)
-        
-        if actor:
-            query = query.filter(AuditEventModel.actor.ilike(f"%{actor}%"))
+        filters = _audit_filters(actor, action, target_type, target_id)
+        order_by = (desc(AuditEventModel.timestamp), desc(AuditEventModel.id))
         
-        if action:
-            query = query.filter(AuditEventModel.action.ilike(f"%{action}%"))
+        if before_ts is not None:
+            # Keyset page: seek past the cursor instead of skipping rows. The
+            # window count would only cover rows after the cursor, so the
+            # total is counted separately
+            stmt = (
+                select(*_AUDIT_SUMMARY_COLUMNS)
+                .where(*filters)
+                .where(tuple_(AuditEventModel.timestamp, AuditEventModel.id) < tuple_(before_ts, before_id))
+                .order_by(*order_by)
+                .limit(size)
+            )
+            rows = db.execute(stmt).all()
+            total = db.scalar(select(func.count()).select_from(AuditEventModel).where(*filters))
+        else:
+            # Fetch the page and the total match count in one query; the window
+            # count is computed over all filtered rows before OFFSET/LIMIT
+            stmt = (
+                select(*_AUDIT_SUMMARY_COLUMNS, func.count().over().label("total"))
+                .where(*filters)
+                .order_by(*order_by)
+                .offset((page - 1) * size)
+                .limit(size)
+            )
+            rows = db.execute(stmt).all()
             
-        if target_type:
-            query = query.filter(AuditEventModel.target_type == target_type)
-            
-        if target_id:
-            query = query.filter(AuditEventModel.target_id == target_id)
-        
-        # Get total count
-        total = query.count()
+            if rows:
+                total = rows[0].total
+            elif page > 1:
+                # Page past the end: no rows to carry the window count
+                total = db.scalar(select(func.count()).select_from(AuditEventModel).where(*filters))
+            else:
+                total = 0
         
-        # Apply pagination and ordering
-        events = query.order_by(desc(AuditEventModel.timestamp)).offset((page - 1) * size).limit(size).all()
+        # A full page may have more events after it
+        next_cursor = None
+        if len(rows) == size:
+            last = rows[-1]
+            next_cursor = {"before_ts": last.timestamp.isoformat(), "before_id": str(last.id)}
         
-        # Convert to AuditEvent objects
-        audit_events = [AuditEvent(**event.to_dict()) for event in events]
-        
-        return AuditEventsResponse(
-            events=audit_events,
-            total=total,
-            page=page,
-            size=size
-        )
+        # zip stops at the summary fields, dropping the trailing window count
+        return _etag_response(request, {
+            "events": [_audit_data(_AUDIT_SUMMARY_FIELDS, row) for row in rows],
+            "total": total,
+            "page": page,
+            "size": size,
+            "next_cursor": next_cursor
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list audit events: {str(e)}")
 
+@router.get("/events/stream")
+def stream_audit_events(
+    actor: Optional[str] = Query(None, description="Filter by actor"),
+    action: Optional[str] = Query(None, description="Filter by action"),
+    target_type: Optional[str] = Query(None, description="Filter by target type"),
+    target_id: Optional[str] = Query(None, description="Filter by target ID"),
+    db: Session = Depends(get_db)
+):
+    """Stream all matching audit events as NDJSON (one AuditEvent per line), newest first
+    
+    Rows are fetched through a server-side cursor in batches of 32 and
+    encoded one at a time, so memory stays flat however many events match.
+    """
+    stmt = (
+        select(AuditEventModel)
+        .options(raiseload("*"))
+        .where(*_audit_filters(actor, action, target_type, target_id))
+        .order_by(desc(AuditEventModel.timestamp), desc(AuditEventModel.id))
+        .execution_options(stream_results=True, yield_per=32)
+    )
+    
+    def lines():
+        for event in db.scalars(stmt):
+            yield orjson.dumps(_audit_event_data(event)) + b"\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @router.get("/events/{event_id}", response_model=AuditEvent)
-async def get_audit_event(event_id: str, db: Session = Depends(get_db)):
+def get_audit_event(event_id: str, db: Session = Depends(get_db)):
     """Get a specific audit event by ID"""
     try:
-        event = db.query(AuditEventModel).filter(AuditEventModel.id == event_id).first()
+        event = db.query(AuditEventModel).options(raiseload("*")).filter(AuditEventModel.id == event_id).first()
         if not event:
             raise HTTPException(status_code=404, detail="Audit event not found")
         
-        return AuditEvent(**event.to_dict())
+        return ORJSONResponse(_audit_event_data(event))
         
     except HTTPException:
         raise
@@ -159,53 +294,54 @@ async def get_audit_event(event_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Failed to get audit event: {str(e)}")
 
 @router.get("/stats")
-async def get_audit_stats(db: Session = Depends(get_db)):
-    """Get audit statistics"""
+def get_audit_stats(request: Request, db: Session = Depends(get_db)):
+    """Get audit statistics
+    
+    On PostgreSQL the counts come from audit_stats_mv, refreshed in the
+    background, so they may briefly lag new events; clients may cache the
+    response for a few seconds and revalidate with If-None-Match.
+    """
+    headers = {"Cache-Control": "max-age=10"}
     try:
-        # Get total events
-        total_events = db.query(AuditEventModel).count()
-        sensitive_events = db.query(AuditEventModel).filter(AuditEventModel.is_sensitive == True).count()
+        if db.get_bind().dialect.name == "postgresql":
+            return _etag_response(request, read_audit_stats(db), headers)
         
-        # Group by action
-        action_counts = db.query(
-            AuditEventModel.action, 
-            func.count(AuditEventModel.id)
-        ).group_by(AuditEventModel.action).all()
-        action_counts_dict = {action: count for action, count in action_counts}
-        
-        # Group by actor
-        actor_counts = db.query(
-            AuditEventModel.actor, 
-            func.count(AuditEventModel.id)
-        ).group_by(AuditEventModel.actor).all()
-        actor_counts_dict = {actor: count for actor, count in actor_counts}
-        
-        return {
-            "total_events": total_events,
-            "sensitive_events": sensitive_events,
-            "action_counts": action_counts_dict,
-            "actor_counts": actor_counts_dict
-        }
+        # One scan: per (action, actor) counts, with the sensitive count as a
+        # FILTER aggregate; totals and per-action/per-actor counts are summed
+        # from these rows
+        rows = db.execute(
+            select(
+                AuditEventModel.action,
+                AuditEventModel.actor,
+                func.count(),
+                func.count().filter(AuditEventModel.is_sensitive.is_(True))
+            ).group_by(AuditEventModel.action, AuditEventModel.actor)
+        ).all()
+        return _etag_response(request, fold_audit_stats(rows), headers)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get audit stats: {str(e)}")
 
 @router.post("/seed")
-async def seed_audit_events(db: Session = Depends(get_db)):
+def seed_audit_events(db: Session = Depends(get_db)):
     """Seed database with sample audit events"""
     try:
         # Check if events already exist
-        existing_count = db.query(AuditEventModel).count()
+        existing_count = db.scalar(select(func.count()).select_from(AuditEventModel))
         if existing_count > 0:
             return {"message": f"Database already has {existing_count} audit events", "seeded": False}
         
-        # Create sample events
-        for event_data in SAMPLE_AUDIT_EVENTS:
-            audit_event = AuditEventModel(**event_data)
-            db.add(audit_event)
+        # Create sample events in one batch
+        now = datetime.now(timezone.utc)
+        rows = [dict(event_data, id=uuid.uuid4(), timestamp=now) for event_data in SAMPLE_AUDIT_EVENTS]
+        bulk_insert(db, AuditEventModel, rows)
         
         db.commit()
         
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(REFRESH_AUDIT_STATS_VIEW)
+            db.commit()
+        
         return {
             "message": f"Successfully seeded {len(SAMPLE_AUDIT_EVENTS)} audit events",
             "seeded": True,
@@ -1,11 +1,14 @@
 """
 REST endpoints for environment variables
 """
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import get_async_db
+from app.core.config import READ_CACHES_ENABLED
 from app.core.domain.env_var import EnvVar, EnvVarType, ScopeRef, ScopeLevel, EnvVarStatus
 from app.core.usecases.env_var_management import (
     CreateEnvVarUseCase, CreateEnvVarRequest,
@@ -15,101 +18,143 @@ from app.core.usecases.env_var_management import (
     DiffEnvironmentsUseCase
 )
 from app.core.usecases.secret_management import (
-    RevealSecretUseCase, RevealSecretRequest, RevealSecretResponse
+    RevealSecretUseCase, RevealSecretRequest, RevealSecretResponse, SecretCache
 )
 from app.core.usecases.export_management import (
     ExportToK8sSecretUseCase, ExportToConfigMapUseCase, ExportToDotEnvUseCase,
-    ExportRequest, ExportResponse
+    ExportRequest, ExportResponse, FilteredEnvVarCache
 )
 from app.adapters.sqlalchemy_env_store import SqlAlchemyEnvStore
+from app.adapters.env_store_audit_sink import EnvStoreAuditSink
 from app.adapters.crypto_cipher import CryptoCipher
 from app.adapters.k8s_yaml_exporter import K8sYamlExporter
 from app.adapters.slack_notifier import SlackNotifier
+from app.adapters.uuid_id_generator import UuidIdGenerator
 from app.core.adapters.mock_clock import MockClock
-from app.core.adapters.mock_id_generator import MockIdGenerator
+from app.schemas.env_vars import (
+    CreateEnvVarPayload, UpdateEnvVarPayload, RollbackEnvVarPayload, RevealSecretPayload,
+    ExportPayload, K8sExportPayload
+)
+from app.utils.errors import ErrorTranslatingRoute
+from app.utils.responses import ORJSONResponse, ResponseCache
+
+router = APIRouter(
+    prefix="/envvars", tags=["Environment Variables"],
+    default_response_class=ORJSONResponse, route_class=ErrorTranslatingRoute
+)
+
+# Process-wide cache for repeated exports of the same scope
+_export_cache = FilteredEnvVarCache()
+
+# Process-wide cache of recently revealed secrets
+_secret_cache = SecretCache()
+
+# Process-wide cache of rendered read responses
+_response_cache = ResponseCache(enabled=READ_CACHES_ENABLED)
+
+# Request value -> enum member, built once instead of calling Enum(value) per request
+_ENV_VAR_TYPES = {member.value: member for member in EnvVarType}
+_SCOPE_LEVELS = {member.value: member for member in ScopeLevel}
+_ENV_VAR_STATUSES = {member.value: member for member in EnvVarStatus}
 
-router = APIRouter(prefix="/envvars", tags=["Environment Variables"])
+
+def _enum_member(members: Dict[str, Any], value: str, enum_name: str) -> Any:
+    """Look up an enum member by value, raising ValueError like Enum(value) does"""
+    try:
+        return members[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid {enum_name}") from None
 
 
-def get_env_store(db: Session = Depends(get_db)) -> SqlAlchemyEnvStore:
+def get_env_store(db: AsyncSession = Depends(get_async_db)) -> SqlAlchemyEnvStore:
     """Get environment variable store"""
     return SqlAlchemyEnvStore(db)
 
 
+def get_audit_sink(env_store: SqlAlchemyEnvStore = Depends(get_env_store)) -> EnvStoreAuditSink:
+    """Get audit sink"""
+    return EnvStoreAuditSink(env_store)
+
+
+# Adapters below are stateless (or only hold config), so one instance is
+# shared across requests; CryptoCipher in particular derives its key with
+# PBKDF2 on construction
+@lru_cache(maxsize=1)
 def get_secret_cipher() -> CryptoCipher:
     """Get secret cipher"""
     return CryptoCipher()
 
 
+@lru_cache(maxsize=1)
 def get_exporter() -> K8sYamlExporter:
     """Get exporter"""
     return K8sYamlExporter()
 
 
+def get_export_cache() -> Optional[FilteredEnvVarCache]:
+    """Get export list cache, or None when it cannot stay coherent across workers"""
+    return _export_cache if READ_CACHES_ENABLED else None
+
+
+def get_secret_cache() -> SecretCache:
+    """Get revealed secret cache"""
+    return _secret_cache
+
+
+def get_response_cache() -> ResponseCache:
+    """Get read response cache"""
+    return _response_cache
+
+
+@lru_cache(maxsize=1)
 def get_notifier() -> SlackNotifier:
     """Get notifier"""
     return SlackNotifier()
 
 
+@lru_cache(maxsize=1)
 def get_clock() -> MockClock:
     """Get clock"""
     return MockClock()
 
 
-def get_id_generator() -> MockIdGenerator:
+@lru_cache(maxsize=1)
+def get_id_generator() -> UuidIdGenerator:
     """Get ID generator"""
-    # TODO: Replace with real ID generator in production
-    # For now, use MockIdGenerator with UUID v4 to avoid conflicts
-    generator = MockIdGenerator()
-    # Use UUID v4 method for reliable UUID generation
-    generator.generate = generator.generate_uuid
-    return generator
+    return UuidIdGenerator()
 
 
 @router.post("/", response_model=Dict[str, Any])
 async def create_env_var(
-    key: str = Body(..., description="Environment variable key"),
-    value: str = Body(..., description="Environment variable value"),
-    type: str = Body(..., description="Environment variable type"),
-    scope_level: str = Body(..., description="Scope level"),
-    scope_ref_id: str = Body(..., description="Scope reference ID"),
-    tags: List[str] = Body(default=[], description="Tags"),
-    description: Optional[str] = Body(None, description="Description"),
-    is_secret: bool = Body(False, description="Is secret"),
-    created_by: str = Body(..., description="Created by user"),
+    payload: CreateEnvVarPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     secret_cipher: CryptoCipher = Depends(get_secret_cipher),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink)
 ):
     """Create a new environment variable"""
-    try:
-        # Validate input
-        env_var_type = EnvVarType(type)
-        scope = ScopeRef(ScopeLevel(scope_level), scope_ref_id)
-        
-        # Create request
-        request = CreateEnvVarRequest(
-            key=key,
-            value=value,
-            type=env_var_type,
-            scope=scope,
-            tags=tags,
-            description=description,
-            is_secret=is_secret,
-            created_by=created_by
-        )
-        
-        # Execute use case
-        use_case = CreateEnvVarUseCase(env_store, secret_cipher, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result.to_dict()
+    # Validate input
+    env_var_type = _enum_member(_ENV_VAR_TYPES, payload.type, "EnvVarType")
+    scope = ScopeRef(_enum_member(_SCOPE_LEVELS, payload.scope_level, "ScopeLevel"), payload.scope_ref_id)
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    # Create request
+    request = CreateEnvVarRequest(
+        key=payload.key,
+        value=payload.value,
+        type=env_var_type,
+        scope=scope,
+        tags=payload.tags,
+        description=payload.description,
+        is_secret=payload.is_secret,
+        created_by=payload.created_by
+    )
+    
+    # Execute use case
+    use_case = CreateEnvVarUseCase(env_store, secret_cipher, clock, id_generator, audit_sink)
+    result = await use_case.execute(request)
+    
+    return ORJSONResponse(result.to_dict())
 
 
 @router.get("/", response_model=ListEnvVarsResponse)
@@ -122,91 +167,74 @@ async def list_env_vars(
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(50, ge=1, le=100, description="Page size"),
-    env_store: SqlAlchemyEnvStore = Depends(get_env_store)
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """List environment variables with filtering and pagination"""
-    try:
-        # Build request
-        request = ListEnvVarsRequest(
-            scope_level=ScopeLevel(scope_level) if scope_level else None,
-            scope_ref_id=scope_ref_id,
-            key_filter=key_filter,
-            tag_filter=tag_filter,
-            type_filter=EnvVarType(type_filter) if type_filter else None,
-            status_filter=EnvVarStatus(status_filter) if status_filter else None,
-            page=page,
-            size=size
-        )
-        
-        # Execute use case
-        use_case = ListEnvVarsUseCase(env_store)
-        result = await use_case.execute(request)
-        
-        return result
+    # Build request
+    request = ListEnvVarsRequest(
+        scope_level=_enum_member(_SCOPE_LEVELS, scope_level, "ScopeLevel") if scope_level else None,
+        scope_ref_id=scope_ref_id,
+        key_filter=key_filter,
+        tag_filter=tag_filter,
+        type_filter=_enum_member(_ENV_VAR_TYPES, type_filter, "EnvVarType") if type_filter else None,
+        status_filter=_enum_member(_ENV_VAR_STATUSES, status_filter, "EnvVarStatus") if status_filter else None,
+        page=page,
+        size=size
+    )
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    # Execute use case, unless an identical listing was rendered since the last write
+    use_case = ListEnvVarsUseCase(env_store)
+    return await response_cache.respond(
+        ("env_vars", request), env_store.write_version, lambda: use_case.execute(request)
+    )
 
 
 @router.get("/{env_var_id}", response_model=Dict[str, Any])
 async def get_env_var(
     env_var_id: str,
-    env_store: SqlAlchemyEnvStore = Depends(get_env_store)
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get environment variable by ID"""
-    try:
+    async def load():
         env_var = await env_store.get_by_id(env_var_id)
         if not env_var:
             raise HTTPException(status_code=404, detail="Environment variable not found")
-        
         return env_var.to_dict()
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return await response_cache.respond(("env_var", env_var_id), env_store.write_version, load)
 
 
 @router.put("/{env_var_id}", response_model=Dict[str, Any])
 async def update_env_var(
     env_var_id: str,
-    value: Optional[str] = Body(None, description="New value"),
-    type: Optional[str] = Body(None, description="New type"),
-    tags: Optional[List[str]] = Body(None, description="New tags"),
-    description: Optional[str] = Body(None, description="New description"),
-    updated_by: str = Body(..., description="Updated by user"),
+    payload: UpdateEnvVarPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     secret_cipher: CryptoCipher = Depends(get_secret_cipher),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink)
 ):
     """Update an environment variable"""
-    try:
-        # Validate input
-        env_var_type = EnvVarType(type) if type else None
-        
-        # Create request
-        request = UpdateEnvVarRequest(
-            env_var_id=env_var_id,
-            value=value,
-            type=env_var_type,
-            tags=tags,
-            description=description,
-            updated_by=updated_by
-        )
-        
-        # Execute use case
-        use_case = UpdateEnvVarUseCase(env_store, secret_cipher, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result.to_dict()
+    # Validate input
+    env_var_type = _enum_member(_ENV_VAR_TYPES, payload.type, "EnvVarType") if payload.type else None
+    
+    # Create request
+    request = UpdateEnvVarRequest(
+        env_var_id=env_var_id,
+        value=payload.value,
+        type=env_var_type,
+        tags=payload.tags,
+        description=payload.description,
+        updated_by=payload.updated_by
+    )
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    # Execute use case
+    use_case = UpdateEnvVarUseCase(env_store, secret_cipher, clock, id_generator, audit_sink)
+    result = await use_case.execute(request)
+    
+    return ORJSONResponse(result.to_dict())
 
 
 @router.delete("/{env_var_id}")
@@ -215,85 +243,61 @@ async def delete_env_var(
     deleted_by: str = Body(..., description="Deleted by user"),
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink)
 ):
     """Delete an environment variable"""
-    try:
-        # Execute use case
-        use_case = DeleteEnvVarUseCase(env_store, clock, id_generator)
-        result = await use_case.execute(env_var_id, deleted_by)
-        
-        return {"success": result}
+    # Execute use case
+    use_case = DeleteEnvVarUseCase(env_store, clock, id_generator, audit_sink)
+    result = await use_case.execute(env_var_id, deleted_by)
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse({"success": result})
 
 
 @router.get("/{env_var_id}/versions")
 async def get_env_var_versions(
     env_var_id: str,
-    env_store: SqlAlchemyEnvStore = Depends(get_env_store)
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get versions for an environment variable"""
-    try:
+    async def load():
         versions = await env_store.get_versions(env_var_id)
         return [version.to_dict() for version in versions]
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return await response_cache.respond(("versions", env_var_id), env_store.write_version, load)
 
 
 @router.post("/{env_var_id}/rollback")
 async def rollback_env_var(
     env_var_id: str,
-    version: int = Body(..., description="Version to rollback to"),
-    rolled_back_by: str = Body(..., description="Rolled back by user"),
+    payload: RollbackEnvVarPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store)
 ):
     """Rollback environment variable to a specific version"""
-    try:
-        result = await env_store.rollback_to_version(env_var_id, version, rolled_back_by)
-        return result.to_dict()
-    
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    result = await env_store.rollback_to_version(env_var_id, payload.version, payload.rolled_back_by)
+    return ORJSONResponse(result.to_dict())
 
 
 @router.post("/{env_var_id}/reveal", response_model=RevealSecretResponse)
 async def reveal_secret(
     env_var_id: str,
-    justification: str = Body(..., description="Justification for revealing secret"),
-    ttl_seconds: int = Body(30, ge=1, le=300, description="TTL in seconds"),
-    requested_by: str = Body(..., description="Requested by user"),
+    payload: RevealSecretPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     secret_cipher: CryptoCipher = Depends(get_secret_cipher),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    secret_cache: SecretCache = Depends(get_secret_cache)
 ):
     """Reveal a secret with TTL"""
-    try:
-        # Create request
-        request = RevealSecretRequest(
-            env_var_id=env_var_id,
-            justification=justification,
-            ttl_seconds=ttl_seconds,
-            requested_by=requested_by
-        )
-        
-        # Execute use case
-        use_case = RevealSecretUseCase(env_store, secret_cipher, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result
+    # Create request
+    request = RevealSecretRequest(env_var_id=env_var_id, **payload.model_dump())
+    
+    # Execute use case
+    use_case = RevealSecretUseCase(env_store, secret_cipher, clock, id_generator, secret_cache)
+    result = await use_case.execute(request)
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse(result)
 
 
 @router.get("/diff/{env1}/{env2}")
@@ -303,112 +307,106 @@ async def diff_environments(
     env_store: SqlAlchemyEnvStore = Depends(get_env_store)
 ):
     """Compare two environments"""
-    try:
-        use_case = DiffEnvironmentsUseCase(env_store)
-        result = await use_case.execute(env1, env2)
-        return result
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    use_case = DiffEnvironmentsUseCase(env_store)
+    result = await use_case.execute(env1, env2)
+    return ORJSONResponse(result)
 
 
 @router.post("/export/k8s-secret")
 async def export_to_k8s_secret(
-    service_id: str = Body(..., description="Service ID"),
-    environment: Optional[str] = Body(None, description="Environment"),
-    scope_level: Optional[str] = Body(None, description="Scope level"),
-    scope_ref_id: Optional[str] = Body(None, description="Scope reference ID"),
-    exported_by: str = Body(..., description="Exported by user"),
+    payload: K8sExportPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     exporter: K8sYamlExporter = Depends(get_exporter),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink),
+    export_cache: Optional[FilteredEnvVarCache] = Depends(get_export_cache)
 ):
     """Export environment variables to Kubernetes Secret YAML"""
-    try:
-        # Create request
-        request = ExportRequest(
-            mode="k8s-secret",
-            service_id=service_id,
-            environment=environment,
-            scope_level=scope_level,
-            scope_ref_id=scope_ref_id,
-            exported_by=exported_by
-        )
-        
-        # Execute use case
-        use_case = ExportToK8sSecretUseCase(env_store, exporter, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result
+    # Create request
+    request = ExportRequest(mode="k8s-secret", **payload.model_dump())
+    
+    # Execute use case
+    use_case = ExportToK8sSecretUseCase(env_store, exporter, clock, id_generator, audit_sink, export_cache)
+    result = await use_case.execute(request)
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse(result)
 
 
 @router.post("/export/k8s-configmap")
 async def export_to_k8s_configmap(
-    service_id: str = Body(..., description="Service ID"),
-    environment: Optional[str] = Body(None, description="Environment"),
-    scope_level: Optional[str] = Body(None, description="Scope level"),
-    scope_ref_id: Optional[str] = Body(None, description="Scope reference ID"),
-    exported_by: str = Body(..., description="Exported by user"),
+    payload: K8sExportPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     exporter: K8sYamlExporter = Depends(get_exporter),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink),
+    export_cache: Optional[FilteredEnvVarCache] = Depends(get_export_cache)
 ):
     """Export environment variables to Kubernetes ConfigMap YAML"""
-    try:
-        # Create request
-        request = ExportRequest(
-            mode="k8s-configmap",
-            service_id=service_id,
-            environment=environment,
-            scope_level=scope_level,
-            scope_ref_id=scope_ref_id,
-            exported_by=exported_by
-        )
-        
-        # Execute use case
-        use_case = ExportToConfigMapUseCase(env_store, exporter, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result
+    # Create request
+    request = ExportRequest(mode="k8s-configmap", **payload.model_dump())
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    # Execute use case
+    use_case = ExportToConfigMapUseCase(env_store, exporter, clock, id_generator, audit_sink, export_cache)
+    result = await use_case.execute(request)
+    
+    return ORJSONResponse(result)
 
 
 @router.post("/export/dotenv")
 async def export_to_dotenv(
-    service_id: Optional[str] = Body(None, description="Service ID"),
-    environment: Optional[str] = Body(None, description="Environment"),
-    scope_level: Optional[str] = Body(None, description="Scope level"),
-    scope_ref_id: Optional[str] = Body(None, description="Scope reference ID"),
-    exported_by: str = Body(..., description="Exported by user"),
+    payload: ExportPayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     exporter: K8sYamlExporter = Depends(get_exporter),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink),
+    export_cache: Optional[FilteredEnvVarCache] = Depends(get_export_cache)
 ):
     """Export environment variables to .env format"""
-    try:
-        # Create request
-        request = ExportRequest(
-            mode="dotenv",
-            service_id=service_id,
-            environment=environment,
-            scope_level=scope_level,
-            scope_ref_id=scope_ref_id,
-            exported_by=exported_by
-        )
-        
-        # Execute use case
-        use_case = ExportToDotEnvUseCase(env_store, exporter, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result
+    # Create request
+    request = ExportRequest(mode="dotenv", **payload.model_dump())
+    
+    # Execute use case
+    use_case = ExportToDotEnvUseCase(env_store, exporter, clock, id_generator, audit_sink, export_cache)
+    result = await use_case.execute(request)
+    
+    return ORJSONResponse(result)
+
+
+_STREAM_EXPORT_USE_CASES = {
+    "k8s-secret": ExportToK8sSecretUseCase,
+    "k8s-configmap": ExportToConfigMapUseCase,
+    "dotenv": ExportToDotEnvUseCase,
+}
+
+
+@router.post("/export/{export_format}/stream")
+async def stream_export(
+    export_format: str,
+    payload: ExportPayload,
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    exporter: K8sYamlExporter = Depends(get_exporter),
+    clock: MockClock = Depends(get_clock),
+    id_generator: UuidIdGenerator = Depends(get_id_generator),
+    audit_sink: EnvStoreAuditSink = Depends(get_audit_sink),
+    export_cache: Optional[FilteredEnvVarCache] = Depends(get_export_cache)
+):
+    """Stream an export (k8s-secret, k8s-configmap or dotenv) without building it in memory"""
+    use_case_cls = _STREAM_EXPORT_USE_CASES.get(export_format)
+    if use_case_cls is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_format}")
+    
+    # Create request
+    request = ExportRequest(mode=export_format, **payload.model_dump())
+    
+    # Execute use case
+    use_case = use_case_cls(env_store, exporter, clock, id_generator, audit_sink, export_cache)
+    export = await use_case.stream(request)
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.media_type,
+        headers={'X-Export-Count': str(export.count)}
+    )
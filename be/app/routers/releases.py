@@ -1,11 +1,13 @@
 """
 REST endpoints for releases
 """
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import get_async_db
+from app.core.config import APPLY_CONCURRENCY, READ_CACHES_ENABLED
 from app.core.domain.release import Release, ReleaseStatus
 from app.core.usecases.release_management import (
     CreateReleaseUseCase, CreateReleaseRequest,
@@ -13,61 +15,59 @@ from app.core.usecases.release_management import (
     ApplyReleaseUseCase, ApplyReleaseRequest
 )
 from app.adapters.sqlalchemy_env_store import SqlAlchemyEnvStore
+from app.adapters.uuid_id_generator import UuidIdGenerator
 from app.core.adapters.mock_clock import MockClock
-from app.core.adapters.mock_id_generator import MockIdGenerator
+from app.schemas.releases import CreateReleasePayload, ApproveReleasePayload, ApplyReleasePayload
+from app.utils.errors import ErrorTranslatingRoute
+from app.utils.responses import ORJSONResponse, ResponseCache
 
-router = APIRouter(prefix="/releases", tags=["Releases"])
+router = APIRouter(
+    prefix="/releases", tags=["Releases"],
+    default_response_class=ORJSONResponse, route_class=ErrorTranslatingRoute
+)
+
+# Process-wide cache of rendered read responses
+_response_cache = ResponseCache(enabled=READ_CACHES_ENABLED)
 
 
-def get_env_store(db: Session = Depends(get_db)) -> SqlAlchemyEnvStore:
+def get_env_store(db: AsyncSession = Depends(get_async_db)) -> SqlAlchemyEnvStore:
     """Get environment variable store"""
     return SqlAlchemyEnvStore(db)
 
 
+@lru_cache(maxsize=1)
 def get_clock() -> MockClock:
     """Get clock"""
     return MockClock()
 
 
-def get_id_generator() -> MockIdGenerator:
+@lru_cache(maxsize=1)
+def get_id_generator() -> UuidIdGenerator:
     """Get ID generator"""
-    return MockIdGenerator()
+    return UuidIdGenerator()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get read response cache"""
+    return _response_cache
 
 
 @router.post("/", response_model=Dict[str, Any])
 async def create_release(
-    service_id: str = Body(..., description="Service ID"),
-    environment: str = Body(..., description="Environment"),
-    title: str = Body(..., description="Release title"),
-    description: Optional[str] = Body(None, description="Release description"),
-    changes: List[Dict[str, Any]] = Body(..., description="List of changes"),
-    created_by: str = Body(..., description="Created by user"),
+    payload: CreateReleasePayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator)
 ):
     """Create a new release"""
-    try:
-        # Create request
-        request = CreateReleaseRequest(
-            service_id=service_id,
-            environment=environment,
-            title=title,
-            description=description,
-            changes=changes,
-            created_by=created_by
-        )
-        
-        # Execute use case
-        use_case = CreateReleaseUseCase(env_store, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result.to_dict()
+    # Create request
+    request = CreateReleaseRequest(**payload.model_dump())
+    
+    # Execute use case
+    use_case = CreateReleaseUseCase(env_store, clock, id_generator)
+    result = await use_case.execute(request)
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse(result.to_dict())
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
@@ -77,102 +77,80 @@ async def list_releases(
     status: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(50, ge=1, le=100, description="Page size"),
-    env_store: SqlAlchemyEnvStore = Depends(get_env_store)
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """List releases with filtering and pagination"""
-    try:
-        # Build filters
-        filters = {}
-        if service_id:
-            filters['service_id'] = service_id
-        if environment:
-            filters['environment'] = environment
-        if status:
-            filters['status'] = status
-        
-        # Get releases
+    # Build filters
+    filters = {}
+    if service_id:
+        filters['service_id'] = service_id
+    if environment:
+        filters['environment'] = environment
+    if status:
+        filters['status'] = status
+    
+    # Get releases
+    async def load():
         releases = await env_store.list_releases(filters, page, size)
         return [release.to_dict() for release in releases]
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    key = ("releases", service_id, environment, status, page, size)
+    return await response_cache.respond(key, env_store.write_version, load)
 
 
 @router.get("/{release_id}", response_model=Dict[str, Any])
 async def get_release(
     release_id: str,
-    env_store: SqlAlchemyEnvStore = Depends(get_env_store)
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get release by ID"""
-    try:
+    async def load():
         release = await env_store.get_release_by_id(release_id)
         if not release:
             raise HTTPException(status_code=404, detail="Release not found")
-        
         return release.to_dict()
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return await response_cache.respond(("release", release_id), env_store.write_version, load)
 
 
 @router.post("/{release_id}/approve")
 async def approve_release(
     release_id: str,
-    approver_id: str = Body(..., description="Approver ID"),
-    comment: Optional[str] = Body(None, description="Approval comment"),
+    payload: ApproveReleasePayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator)
 ):
     """Approve a release"""
-    try:
-        # Create request
-        request = ApproveReleaseRequest(
-            release_id=release_id,
-            approver_id=approver_id,
-            comment=comment
-        )
-        
-        # Execute use case
-        use_case = ApproveReleaseUseCase(env_store, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result.to_dict()
+    # Create request
+    request = ApproveReleaseRequest(release_id=release_id, **payload.model_dump())
+    
+    # Execute use case
+    use_case = ApproveReleaseUseCase(env_store, clock, id_generator)
+    result = await use_case.execute(request)
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse(result.to_dict())
 
 
 @router.post("/{release_id}/apply")
 async def apply_release(
     release_id: str,
-    applied_by: str = Body(..., description="Applied by user"),
+    payload: ApplyReleasePayload,
     env_store: SqlAlchemyEnvStore = Depends(get_env_store),
     clock: MockClock = Depends(get_clock),
-    id_generator: MockIdGenerator = Depends(get_id_generator)
+    id_generator: UuidIdGenerator = Depends(get_id_generator)
 ):
     """Apply a release"""
-    try:
-        # Create request
-        request = ApplyReleaseRequest(
-            release_id=release_id,
-            applied_by=applied_by
-        )
-        
-        # Execute use case
-        use_case = ApplyReleaseUseCase(env_store, clock, id_generator)
-        result = await use_case.execute(request)
-        
-        return result.to_dict()
+    # Create request
+    request = ApplyReleaseRequest(release_id=release_id, applied_by=payload.applied_by)
+    
+    # Execute use case
+    use_case = ApplyReleaseUseCase(env_store, clock, id_generator, APPLY_CONCURRENCY)
+    result = await use_case.execute(request)
     
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return ORJSONResponse(result.to_dict())
 
 
 @router.get("/{release_id}/approvals")
@@ -181,27 +159,23 @@ async def get_release_approvals(
     env_store: SqlAlchemyEnvStore = Depends(get_env_store)
 ):
     """Get approvals for a release"""
-    try:
-        approvals = await env_store.get_approvals_for_release(release_id)
-        return [approval.to_dict() for approval in approvals]
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    approvals = await env_store.get_approvals_for_release(release_id)
+    return ORJSONResponse([approval.to_dict() for approval in approvals])
 
 
 @router.get("/{release_id}/status")
 async def get_release_status(
     release_id: str,
-    env_store: SqlAlchemyEnvStore = Depends(get_env_store)
+    env_store: SqlAlchemyEnvStore = Depends(get_env_store),
+    response_cache: ResponseCache = Depends(get_response_cache)
 ):
     """Get release status and approval information"""
-    try:
-        release = await env_store.get_release_by_id(release_id)
-        if not release:
+    async def load():
+        found = await env_store.get_release_with_approvals(release_id)
+        if not found:
             raise HTTPException(status_code=404, detail="Release not found")
         
-        approvals = await env_store.get_approvals_for_release(release_id)
-        
+        release, approvals = found
         return {
             "release": release.to_dict(),
             "approvals": [approval.to_dict() for approval in approvals],
@@ -210,7 +184,4 @@ async def get_release_status(
             "can_be_cancelled": release.can_be_cancelled()
         }
     
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    return await response_cache.respond(("release_status", release_id), env_store.write_version, load)
@@ -0,0 +1,57 @@
+"""
+Request bodies for the environment variable endpoints
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.usecases.secret_management import MAX_REVEAL_TTL_SECONDS
+
+
+class CreateEnvVarPayload(BaseModel):
+    """Body of POST /envvars/"""
+    key: str = Field(..., description="Environment variable key")
+    value: str = Field(..., description="Environment variable value")
+    type: str = Field(..., description="Environment variable type")
+    scope_level: str = Field(..., description="Scope level")
+    scope_ref_id: str = Field(..., description="Scope reference ID")
+    tags: List[str] = Field(default=[], description="Tags")
+    description: Optional[str] = Field(None, description="Description")
+    is_secret: bool = Field(False, description="Is secret")
+    created_by: str = Field(..., description="Created by user")
+
+
+class UpdateEnvVarPayload(BaseModel):
+    """Body of PUT /envvars/{env_var_id}"""
+    value: Optional[str] = Field(None, description="New value")
+    type: Optional[str] = Field(None, description="New type")
+    tags: Optional[List[str]] = Field(None, description="New tags")
+    description: Optional[str] = Field(None, description="New description")
+    updated_by: str = Field(..., description="Updated by user")
+
+
+class RollbackEnvVarPayload(BaseModel):
+    """Body of POST /envvars/{env_var_id}/rollback"""
+    version: int = Field(..., description="Version to rollback to")
+    rolled_back_by: str = Field(..., description="Rolled back by user")
+
+
+class RevealSecretPayload(BaseModel):
+    """Body of POST /envvars/{env_var_id}/reveal"""
+    justification: str = Field(..., description="Justification for revealing secret")
+    ttl_seconds: int = Field(30, ge=1, le=MAX_REVEAL_TTL_SECONDS, description="TTL in seconds")
+    requested_by: str = Field(..., description="Requested by user")
+
+
+class ExportPayload(BaseModel):
+    """Body of the export endpoints"""
+    service_id: Optional[str] = Field(None, description="Service ID")
+    environment: Optional[str] = Field(None, description="Environment")
+    scope_level: Optional[str] = Field(None, description="Scope level")
+    scope_ref_id: Optional[str] = Field(None, description="Scope reference ID")
+    exported_by: str = Field(..., description="Exported by user")
+
+
+class K8sExportPayload(ExportPayload):
+    """Body of the Kubernetes export endpoints, which require a service"""
+    service_id: str = Field(..., description="Service ID")
@@ -0,0 +1,27 @@
+"""
+Request bodies for the release endpoints
+"""
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CreateReleasePayload(BaseModel):
+    """Body of POST /releases/"""
+    service_id: str = Field(..., description="Service ID")
+    environment: str = Field(..., description="Environment")
+    title: str = Field(..., description="Release title")
+    description: Optional[str] = Field(None, description="Release description")
+    changes: List[Dict[str, Any]] = Field(..., description="List of changes")
+    created_by: str = Field(..., description="Created by user")
+
+
+class ApproveReleasePayload(BaseModel):
+    """Body of POST /releases/{release_id}/approve"""
+    approver_id: str = Field(..., description="Approver ID")
+    comment: Optional[str] = Field(None, description="Approval comment")
+
+
+class ApplyReleasePayload(BaseModel):
+    """Body of POST /releases/{release_id}/apply"""
+    applied_by: str = Field(..., description="Applied by user")
@@ -0,0 +1,35 @@
+"""
+Route class that maps exceptions escaping an endpoint onto HTTP errors
+"""
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+
+class ErrorTranslatingRoute(APIRoute):
+    """APIRoute that turns ValueError into 400 and any other error into 500
+    
+    Replaces a try/except around every endpoint body. The translation runs
+    inside the route, so the resulting HTTPException is rendered by the
+    regular exception middleware and still passes through CORS, unlike a
+    catch-all app.exception_handler(Exception), which Starlette only runs
+    from the outermost ServerErrorMiddleware.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+        
+        return route_handler
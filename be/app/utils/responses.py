@@ -0,0 +1,134 @@
+"""
+orjson-backed JSON response that understands the domain objects
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+
+def _encoder_for(cls: type) -> Callable[[Any], Any]:
+    """Pick how _default encodes instances of cls
+    
+    Domain objects are encoded through their to_dict(), so API output matches
+    the representation the use cases build (masked secret values included).
+    Other dataclasses are encoded field by field, shallowly, so nested domain
+    objects still go through to_dict(); fields starting with "_" are private
+    and skipped.
+    """
+    if callable(getattr(cls, "to_dict", None)):
+        return lambda obj: obj.to_dict()
+    if is_dataclass(cls):
+        names = tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+        return lambda obj: {name: getattr(obj, name) for name in names}
+    if issubclass(cls, Decimal):
+        return str
+    raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
+
+
+# type -> encoder, filled on first sight of each type so repeat calls are a
+# single dict lookup instead of re-running the checks above
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _default(obj: Any) -> Any:
+    """Encode objects orjson does not handle natively"""
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is None:
+        encoder = _ENCODERS[type(obj)] = _encoder_for(type(obj))
+    return encoder(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson
+
+    Returning one directly from a route skips FastAPI's jsonable_encoder and
+    response_model validation, which only re-walk already-clean data.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+
+class ResponseCache:
+    """Short-lived in-process cache of rendered JSON response bodies
+    
+    Entries expire after ttl_seconds and are ignored as soon as the store's
+    write_version moves past the version they were rendered at, so a hit
+    skips both the query and serialization. write_version is per process, so
+    with several workers the cache is built with enabled=False: it then
+    stores nothing and only coalesces concurrent misses.
+    
+    Concurrent misses for the same key and version are coalesced: the first
+    request builds the body and the others await its result, so a burst
+    right after an entry expires costs one query rather than one per request.
+    """
+    
+    def __init__(self, ttl_seconds: float = 5.0, maxsize: int = 1024, enabled: bool = True):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._entries: 'OrderedDict[Hashable, Tuple[float, int, bytes]]' = OrderedDict()
+        self._in_flight: Dict[Tuple[Hashable, int], 'asyncio.Future[bytes]'] = {}
+    
+    async def respond(self, key: Hashable, version: int,
+                      build: Callable[[], Awaitable[Any]]) -> Response:
+        """Serve the cached body for key, or build, render and cache it
+        
+        Exceptions raised by build (e.g. a 404 HTTPException) propagate to
+        every request waiting on it and are not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic() and entry[1] == version:
+            self._entries.move_to_end(key)
+            return Response(content=entry[2], media_type="application/json")
+        
+        flight = (key, version)
+        pending = self._in_flight.get(flight)
+        if pending is not None:
+            # shield so one waiter disconnecting does not cancel the shared build
+            try:
+                body = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # the building request was cancelled, not this one; retry
+                return await self.respond(key, version, build)
+            return Response(content=body, media_type="application/json")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[flight] = future
+        try:
+            response = ORJSONResponse(await build())
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark retrieved so a build nobody else waited on is not logged
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[flight]
+        future.set_result(response.body)
+        if not self.enabled:
+            return response
+        
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, version, response.body)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return response
+    
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
@@ -0,0 +1,227 @@
+"""
+Unit tests for the cached JSON responses
+"""
+import asyncio
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from app.core.domain.audit_event import AuditEvent, AuditAction, AuditTargetType, LazyReason
+from app.core.domain.env_var import EnvVar, EnvVarType, EnvVarStatus, ScopeRef, ScopeLevel
+from app.core.domain.release import Release, ReleaseStatus
+from app.core.usecases.env_var_management import ListEnvVarsResponse
+
+from ..responses import ORJSONResponse, ResponseCache
+
+
+class SlowBuild:
+    """Response builder that blocks until released and counts its calls"""
+    
+    def __init__(self, result=None, error: Exception = None):
+        self.result = result if result is not None else {"ok": True}
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+    
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _previous_default(obj):
+    """The encoder ORJSONResponse used before per-type dispatch, kept as the reference"""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith("_")}
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _previous_render(content) -> bytes:
+    return orjson.dumps(content, default=_previous_default,
+                        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def _sample_payload() -> dict:
+    """One of each domain object the API returns, nested the way routes nest them"""
+    now = datetime(2024, 1, 2, 3, 4, 5)
+    env_vars = [
+        EnvVar(id="var-1", key="API_URL", value="https://api.example.com", type=EnvVarType.STRING,
+               scope=ScopeRef(ScopeLevel.ENV, "dev"), tags=["api"], description=None, is_secret=False,
+               status=EnvVarStatus.ACTIVE, created_by="user1", created_at=now, updated_by="user1", updated_at=now),
+        EnvVar(id="var-2", key="API_TOKEN", value="s3cr3t-token", type=EnvVarType.SECRET,
+               scope=ScopeRef(ScopeLevel.ENV, "dev"), tags=[], description="Token", is_secret=True,
+               status=EnvVarStatus.ACTIVE, created_by="user1", created_at=now, updated_by="user1", updated_at=now)
+    ]
+    release = Release(id="rel-1", service_id="svc1", environment="prod", title="Release 1", description=None,
+                      status=ReleaseStatus.PENDING_APPROVAL, changes=[{'action': 'UPDATE', 'env_var_id': 'var-1'}],
+                      created_by="user1", created_at=now, applied_by=None, applied_at=None)
+    event = AuditEvent(id="event-1", actor="user1", action=AuditAction.APPROVE, target_type=AuditTargetType.RELEASE,
+                       target_id="rel-1", before_json={'status': 'PENDING_APPROVAL'}, after_json={'status': 'APPROVED'},
+                       reason=LazyReason("Approved release %s: %s", "Release 1", "LGTM"), timestamp=now)
+    return {
+        "list": ListEnvVarsResponse(env_vars=env_vars, total=2, page=1, size=50),
+        "scope": env_vars[0].scope,
+        "release": release,
+        "audit": [event],
+        "ratio": Decimal("0.25"),
+        "at": now,
+        "status": ReleaseStatus.APPLIED
+    }
+
+
+async def settle():
+    """Let every ready task run until it blocks"""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache"""
+    
+    async def test_concurrent_misses_share_one_build(self):
+        """Test concurrent misses for one key build the body once"""
+        cache = ResponseCache()
+        build = SlowBuild({"n": 1})
+        
+        tasks = [asyncio.create_task(cache.respond("key", 1, build)) for _ in range(10)]
+        await settle()
+        build.release.set()
+        responses = await asyncio.gather(*tasks)
+        
+        assert build.calls == 1
+        assert {response.body for response in responses} == {ORJSONResponse({"n": 1}).body}
+        assert cache._in_flight == {}
+    
+    async def test_hit_skips_build(self):
+        """Test a cached body is served without building again"""
+        cache = ResponseCache()
+        build = SlowBuild()
+        build.release.set()
+        
+        first = await cache.respond("key", 1, build)
+        second = await cache.respond("key", 1, build)
+        
+        assert build.calls == 1
+        assert second.body == first.body
+        assert second.media_type == "application/json"
+    
+    async def test_write_version_bump_forces_rebuild(self):
+        """Test an entry rendered at an older write_version is not served"""
+        cache = ResponseCache()
+        build = SlowBuild()
+        build.release.set()
+        
+        await cache.respond("key", 1, build)
+        await cache.respond("key", 2, build)
+        
+        assert build.calls == 2
+    
+    async def test_exception_reaches_every_waiter(self):
+        """Test a failed build raises in every coalesced request and is not cached"""
+        cache = ResponseCache()
+        build = SlowBuild(error=ValueError("boom"))
+        
+        tasks = [asyncio.create_task(cache.respond("key", 1, build)) for _ in range(5)]
+        await settle()
+        build.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        assert build.calls == 1
+        assert all(isinstance(result, ValueError) for result in results)
+        assert cache._in_flight == {}
+        assert cache._entries == {}
+    
+    async def test_cancelled_leader_waiter_retries(self):
+        """Test waiters rebuild when the request building the body is cancelled"""
+        cache = ResponseCache()
+        build = SlowBuild({"n": 1})
+        
+        leader = asyncio.create_task(cache.respond("key", 1, build))
+        await settle()
+        waiter = asyncio.create_task(cache.respond("key", 1, build))
+        await settle()
+        leader.cancel()
+        await settle()
+        build.release.set()
+        
+        response = await waiter
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert build.calls == 2
+        assert response.body == ORJSONResponse({"n": 1}).body
+        assert cache._in_flight == {}
+    
+    async def test_cancelled_waiter_does_not_cancel_build(self):
+        """Test a waiter disconnecting leaves the shared build running"""
+        cache = ResponseCache()
+        build = SlowBuild({"n": 1})
+        
+        leader = asyncio.create_task(cache.respond("key", 1, build))
+        await settle()
+        waiter = asyncio.create_task(cache.respond("key", 1, build))
+        await settle()
+        waiter.cancel()
+        await settle()
+        build.release.set()
+        
+        response = await leader
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert build.calls == 1
+        assert response.body == ORJSONResponse({"n": 1}).body
+    
+    async def test_disabled_cache_coalesces_without_storing(self):
+        """Test a disabled cache still coalesces concurrent misses but stores nothing"""
+        cache = ResponseCache(enabled=False)
+        build = SlowBuild()
+        
+        tasks = [asyncio.create_task(cache.respond("key", 1, build)) for _ in range(5)]
+        await settle()
+        build.release.set()
+        await asyncio.gather(*tasks)
+        assert build.calls == 1
+        
+        await cache.respond("key", 1, build)
+        assert build.calls == 2
+        assert cache._entries == {}
+
+
+class TestORJSONResponse:
+    """Test cases for ORJSONResponse encoding of domain objects"""
+    
+    def test_matches_previous_encoding(self):
+        """Test per-type dispatch renders the same bytes as the previous encoder"""
+        payload = _sample_payload()
+        
+        assert ORJSONResponse(payload).body == _previous_render(payload)
+    
+    def test_domain_objects_use_to_dict(self):
+        """Test domain objects render their to_dict form, secrets masked and reasons formatted"""
+        payload = _sample_payload()
+        
+        data = orjson.loads(ORJSONResponse(payload).body)
+        
+        assert data["list"]["env_vars"] == [env_var.to_dict() for env_var in payload["list"].env_vars]
+        assert data["list"]["env_vars"][1]["value"] != "s3cr3t-token"
+        assert data["list"]["total"] == 2
+        assert data["scope"] == {"level": "ENV", "ref_id": "dev"}
+        assert data["release"] == payload["release"].to_dict()
+        assert data["audit"][0]["reason"] == "Approved release Release 1: LGTM"
+        assert data["ratio"] == "0.25"
+        assert data["at"] == "2024-01-02T03:04:05"
+        assert data["status"] == "APPLIED"
+    
+    def test_unknown_type_raises(self):
+        """Test objects with no encoding are rejected rather than stringified"""
+        with pytest.raises(TypeError):
+            ORJSONResponse({"reason": LazyReason("bare %s", "reason")})
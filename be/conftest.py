@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration
+"""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the whole test session"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
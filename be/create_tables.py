@@ -12,12 +12,13 @@ def create_tables():
     engine = create_engine(DB_URL)
     
     try:
-        # Create all tables
-        Base.metadata.create_all(engine)
-        print("✅ Tables created successfully!")
-        
-        # Test connection
-        with engine.connect() as conn:
+        # Create missing tables in one transaction on one connection, so a
+        # failure part-way through is rolled back
+        with engine.begin() as conn:
+            Base.metadata.create_all(conn)
+            print("✅ Tables created successfully!")
+            
+            # Test connection
             result = conn.execute(text("SELECT 1"))
             print("✅ Database connection successful!")
             
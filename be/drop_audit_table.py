@@ -7,18 +7,21 @@ from app.core.config import DB_URL
 def drop_and_recreate():
     engine = create_engine(DB_URL)
     
-    with engine.connect() as conn:
-        # Drop table if exists
+    from app.model.audit_event import AuditEventModel
+    from app.db.audit_stats import create_audit_stats_view
+    
+    # One transaction on one connection: PostgreSQL DDL is transactional, so
+    # other sessions never see the table missing and a failure rolls back
+    with engine.begin() as conn:
+        # Drop table if exists (CASCADE also drops audit_stats_mv)
         conn.execute(text('DROP TABLE IF EXISTS audit_events CASCADE'))
-        conn.commit()
         print("✅ Dropped audit_events table")
         
         # Recreate table
-        from app.model.audit_event import AuditEventModel
-        from app.db.database import Base
-        Base.metadata.create_all(engine)
+        AuditEventModel.__table__.create(conn)
+        if conn.dialect.name == "postgresql":
+            create_audit_stats_view(conn)
         print("✅ Recreated audit_events table")
 
 if __name__ == "__main__":
     drop_and_recreate()
-
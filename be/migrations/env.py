@@ -16,7 +16,9 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-from app.model.env_var import Base
+from app.db.database import Base
+import app.model.audit_event  # noqa: F401
+import app.model.env_var  # noqa: F401
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,55 @@
+"""audit_events composite indexes for filtered, timestamp-ordered listing
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 02:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COMPOSITE_INDEXES = {
+    'idx_audit_events_target_ts': '(target_type, target_id, "timestamp" DESC)',
+    'idx_audit_events_actor_ts': '(actor, "timestamp" DESC)',
+    'idx_audit_events_action_ts': '(action, "timestamp" DESC)',
+}
+
+# Single-column indexes made redundant by the composites' leading columns
+# (ix_* from the app.db model, idx_* from the app.model.env_var model)
+REDUNDANT_INDEXES = [
+    'ix_audit_events_actor',
+    'ix_audit_events_action',
+    'ix_audit_events_target_type',
+    'ix_audit_events_target_id',
+    'idx_audit_events_actor',
+    'idx_audit_events_action',
+    'idx_audit_events_target_type',
+    'idx_audit_events_target_id',
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in COMPOSITE_INDEXES.items():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON audit_events {columns}')
+        for name in REDUNDANT_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in ('actor', 'action', 'target_type', 'target_id'):
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_events_{column} ON audit_events ({column})')
+        for name in COMPOSITE_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
@@ -0,0 +1,41 @@
+"""audit_events trigram indexes for actor/action substring search
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 02:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = {
+    'idx_audit_events_actor_trgm': 'actor',
+    'idx_audit_events_action_trgm': 'action',
+}
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, column in TRIGRAM_INDEXES.items():
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} '
+                f'ON audit_events USING gin ({column} gin_trgm_ops)'
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in TRIGRAM_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
@@ -0,0 +1,43 @@
+"""audit_events (timestamp, id) index for keyset pagination
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 02:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Single-column timestamp indexes made redundant by the (timestamp, id) index
+# (ix_* from the app.db model, idx_* from the app.model.env_var model)
+REDUNDANT_INDEXES = [
+    'ix_audit_events_timestamp',
+    'idx_audit_events_timestamp',
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_audit_events_ts_id '
+            'ON audit_events ("timestamp" DESC, id DESC)'
+        )
+        for name in REDUNDANT_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_events_timestamp ON audit_events ("timestamp")')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_audit_events_ts_id')
@@ -0,0 +1,36 @@
+"""audit_stats_mv materialized view for /audit/stats
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 02:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE MATERIALIZED VIEW IF NOT EXISTS audit_stats_mv AS '
+        'SELECT action, actor, coalesce(is_sensitive, false) AS is_sensitive, count(*) AS event_count '
+        'FROM audit_events '
+        'GROUP BY action, actor, coalesce(is_sensitive, false)'
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index on the view
+    op.execute(
+        'CREATE UNIQUE INDEX IF NOT EXISTS idx_audit_stats_mv_key '
+        'ON audit_stats_mv (action, actor, is_sensitive)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS audit_stats_mv')
@@ -0,0 +1,38 @@
+"""JSON columns to jsonb
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 02:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# ALTER ... TYPE rewrites each table under an ACCESS EXCLUSIVE lock
+JSON_COLUMNS = [
+    ('audit_events', 'before_json'),
+    ('audit_events', 'after_json'),
+    ('env_vars', 'tags'),
+    ('env_var_versions', 'diff_json'),
+    ('releases', 'changes'),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb')
+
+
+def downgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json')
@@ -0,0 +1,38 @@
+"""env_vars indexes for status and tag filters
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 03:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    'idx_env_vars_status': '(status)',
+    # tags @> '["tag"]' (jsonb containment) is served by a GIN index
+    'idx_env_vars_tags': 'USING gin (tags)',
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON env_vars {columns}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
@@ -0,0 +1,35 @@
+"""releases composite index for the list filters
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 04:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_releases_service_env_status '
+            'ON releases (service_id, environment, status)'
+        )
+        # Covered by the composite's leading column
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_releases_service_id')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_releases_service_id ON releases (service_id)')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_releases_service_env_status')
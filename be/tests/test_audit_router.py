@@ -0,0 +1,160 @@
+"""
+Tests for the audit router against an in-memory SQLite database
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import get_db
+from app.model.audit_event import AuditEventModel
+from app.routers import audit
+
+
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw):
+    """Store PostgreSQL UUID columns as 32-char hex on SQLite"""
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session_factory():
+    """Sessions on a fresh in-memory database shared across threads"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    AuditEventModel.__table__.create(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+async def client(session_factory):
+    """HTTP client for an app serving only the audit router"""
+    app = FastAPI()
+    app.include_router(audit.router)
+    
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def add_events(session_factory, timestamps):
+    """Insert one audit event per timestamp and return their ids, newest first"""
+    rows = [
+        AuditEventModel(id=uuid.uuid4(), actor="user1", action="UPDATE_ENV_VAR",
+                        target_type="ENV_VAR", target_id=f"env_{i}", timestamp=timestamp)
+        for i, timestamp in enumerate(timestamps)
+    ]
+    ids = [str(row.id) for row in sorted(rows, key=lambda row: (row.timestamp, row.id), reverse=True)]
+    with session_factory() as db:
+        db.add_all(rows)
+        db.commit()
+    return ids
+
+
+class TestAuditEventsCursor:
+    """Test cases for keyset paging of /audit/events"""
+    
+    @pytest.fixture
+    def event_ids(self, session_factory):
+        """Seven events; the four at t0+1s straddle the first page boundary"""
+        t0 = datetime(2024, 1, 1)
+        timestamps = [t0] + [t0 + timedelta(seconds=1)] * 4 + [t0 + timedelta(seconds=2)] * 2
+        return add_events(session_factory, timestamps)
+    
+    async def test_cursor_pages_cover_every_event_once(self, client, event_ids):
+        """Test following next_cursor visits every event once, in order, with a stable total"""
+        response = await client.get("/audit/events", params={"size": 3})
+        assert response.status_code == 200
+        body = response.json()
+        pages = [body]
+        
+        while body["next_cursor"] is not None:
+            response = await client.get("/audit/events", params={"size": 3, **body["next_cursor"]})
+            assert response.status_code == 200
+            body = response.json()
+            pages.append(body)
+        
+        seen = [event["id"] for page in pages for event in page["events"]]
+        assert seen == event_ids
+        assert [len(page["events"]) for page in pages] == [3, 3, 1]
+        assert {page["total"] for page in pages} == {7}
+    
+    async def test_cursor_matches_offset_paging(self, client, event_ids):
+        """Test the page after a cursor is the same as the next OFFSET page"""
+        first = (await client.get("/audit/events", params={"size": 3})).json()
+        by_cursor = (await client.get("/audit/events", params={"size": 3, **first["next_cursor"]})).json()
+        by_offset = (await client.get("/audit/events", params={"size": 3, "page": 2})).json()
+        
+        assert by_cursor["events"] == by_offset["events"]
+        assert by_cursor["total"] == by_offset["total"] == 7
+    
+    async def test_cursor_needs_both_fields(self, client, event_ids):
+        """Test a cursor with only before_ts is rejected"""
+        response = await client.get("/audit/events", params={"before_ts": "2024-01-01T00:00:01"})
+        
+        assert response.status_code == 400
+
+
+class TestAuditStatsETag:
+    """Test cases for conditional requests to /audit/stats"""
+    
+    async def test_stats_headers(self, client):
+        """Test stats carry an ETag and a short max-age"""
+        response = await client.get("/audit/stats")
+        
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "max-age=10"
+        assert response.headers["etag"].startswith('"')
+        assert response.json()["total_events"] == 0
+    
+    async def test_matching_etag_returns_304(self, client, session_factory):
+        """Test revalidating with the current ETag gets an empty 304"""
+        add_events(session_factory, [datetime(2024, 1, 1)])
+        etag = (await client.get("/audit/stats")).headers["etag"]
+        
+        response = await client.get("/audit/stats", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == "max-age=10"
+    
+    async def test_etag_in_list_matches(self, client):
+        """Test If-None-Match with several tags matches any of them"""
+        etag = (await client.get("/audit/stats")).headers["etag"]
+        
+        response = await client.get("/audit/stats", headers={"If-None-Match": f'"stale", {etag}'})
+        
+        assert response.status_code == 304
+    
+    async def test_new_event_changes_etag(self, client, session_factory):
+        """Test seeding events invalidates the old ETag"""
+        etag = (await client.get("/audit/stats")).headers["etag"]
+        
+        assert (await client.post("/audit/seed")).json()["seeded"] is True
+        response = await client.get("/audit/stats", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["total_events"] == len(audit.SAMPLE_AUDIT_EVENTS)
+        
+        seeded_etag = response.headers["etag"]
+        add_events(session_factory, [datetime(2024, 1, 1)])
+        response = await client.get("/audit/stats", headers={"If-None-Match": seeded_etag})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != seeded_etag
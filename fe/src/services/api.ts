@@ -296,6 +296,8 @@ export const auditApi = {
     target_id?: string
     page?: number
     size?: number
+    before_ts?: string
+    before_id?: string
   }) => {
     const response = await apiClient.get('/audit/events', { params })
     return response.data